@@ -0,0 +1,39 @@
+"""Μηχανές μάχης χωρίς γραφικό περιβάλλον, μία ανά σύστημα κανόνων.
+
+Κάθε module εκθέτει `BattleEngine` και `simulate(config, n, seed, rng)`, όπου
+config είναι τα ορίσματα της `BattleEngine.simulate_battle_silent`.
+"""
+
+import importlib
+
+# Αλλάζει όταν αλλάζουν οι κανόνες κάποιου συστήματος - ακυρώνει τα αποθηκευμένα αποτελέσματα
+ENGINE_VERSION = "1"
+
+RULE_SYSTEMS = {
+    "classic": "battle_engine.classic",
+    "kryptes": "battle_engine.kryptes",
+    "adnd": "battle_engine.adnd",
+    "alternative": "battle_engine.alternative",
+    "alternative_new": "battle_engine.alternative_new",
+    "singleroll": "battle_engine.singleroll",
+}
+
+# Ταχύτερες εκδόσεις της simulate, όπου υπάρχουν (με δική τους εναλλακτική λύση)
+FAST_SIMULATORS = {
+    "classic": "battle_engine.classic_batch",
+}
+
+
+def get_rule_system(name):
+    """Επιστρέφει το module της μηχανής για ένα σύστημα κανόνων"""
+    try:
+        return importlib.import_module(RULE_SYSTEMS[name])
+    except KeyError:
+        raise ValueError(f"Άγνωστο σύστημα κανόνων: {name}") from None
+
+
+def get_simulator(name):
+    """Επιστρέφει την ταχύτερη διαθέσιμη simulate(config, n, seed, rng) ενός συστήματος κανόνων"""
+    if name in FAST_SIMULATORS:
+        return importlib.import_module(FAST_SIMULATORS[name]).simulate
+    return get_rule_system(name).simulate
@@ -0,0 +1,12 @@
+import os
+import sys
+
+from .cli import main
+
+if __name__ == "__main__":
+    try:
+        sys.exit(main())
+    except BrokenPipeError:
+        # π.χ. | head - το υπόλοιπο output δεν το διαβάζει κανείς
+        os.dup2(os.open(os.devnull, os.O_WRONLY), sys.stdout.fileno())
+        sys.exit(1)
@@ -0,0 +1,112 @@
+"""Μάχες μέχρι ακρίβεια: η εκτέλεση συνεχίζει σε κομμάτια μέχρι το διάστημα
+εμπιστοσύνης Wilson για το ποσοστό νίκης του Χαρακτήρα 1 να γίνει στενότερο
+από την ανοχή που ορίστηκε, ή μέχρι να τελειώσει ο διαθέσιμος χρόνος.
+
+Τα κομμάτια ξεκινούν μικρά (για τις μονόπλευρες μάχες που κρίνονται γρήγορα)
+και διπλασιάζονται μέχρι το parallel.CHUNK_SIZE. Κάθε κομμάτι παίρνει seed από
+τη θέση του, όπως στην parallel.simulate.
+"""
+
+import math
+import time
+from concurrent.futures import ProcessPoolExecutor
+
+from .parallel import CHUNK_SIZE, BattleRun, _run_chunk, chunk_seed
+
+FIRST_CHUNK = 1000  # Μάχες στο πρώτο κομμάτι
+Z_95 = 1.959964  # Διάστημα εμπιστοσύνης 95%
+
+
+def wilson_interval(successes, n, z=Z_95):
+    """Διάστημα εμπιστοσύνης Wilson για ποσοστό successes/n - επιστρέφει (κάτω, άνω)"""
+    if n == 0:
+        return 0.0, 1.0
+    p = successes / n
+    denominator = 1 + z * z / n
+    center = (p + z * z / (2 * n)) / denominator
+    half_width = z * math.sqrt(p * (1 - p) / n + z * z / (4 * n * n)) / denominator
+    return max(0.0, center - half_width), min(1.0, center + half_width)
+
+
+def chunk_sizes(chunk_size=CHUNK_SIZE, first_chunk=FIRST_CHUNK):
+    """Άπειρη σειρά μεγεθών κομματιών: first_chunk, 2*first_chunk, ... έως chunk_size"""
+    size = min(first_chunk, chunk_size)
+    while True:
+        yield size
+        size = min(size * 2, chunk_size)
+
+
+class PreciseRun(BattleRun):
+    """Εκτέλεση μαχών μέχρι το ±tolerance στο ποσοστό νίκης του Χαρακτήρα 1 ή μέχρι time_budget δευτερόλεπτα"""
+
+    def __init__(self, system, config, tolerance=0.01, time_budget=30.0, workers=None, seed=None,
+                 chunk_size=CHUNK_SIZE, max_battles=None, generator=None):
+        # Τα κομμάτια φτιάχνονται στην πορεία
+        super().__init__(system, config, 0, workers, seed, chunk_size, generator=generator)
+        self.tolerance = tolerance
+        self.time_budget = time_budget
+        self.chunk_size = chunk_size
+        self.max_battles = max_battles
+        self.interval = (0.0, 1.0)
+        self.converged = False
+        self._started = None
+
+    def half_width(self):
+        low, high = self.interval
+        return (high - low) / 2
+
+    def progress(self):
+        """Η μεγαλύτερη από την πρόοδο σε ακρίβεια και σε χρόνο (0 έως 1)"""
+        if self.done:
+            return 1.0
+        fractions = []
+        if self.stats.battles:
+            fractions.append(min(1.0, (self.tolerance / self.half_width()) ** 2))  # Το εύρος πέφτει με 1/sqrt(n)
+        if self.time_budget and self._started is not None:
+            fractions.append(min(1.0, (time.monotonic() - self._started) / self.time_budget))
+        return max(fractions, default=0.0)
+
+    def _finished(self):
+        if self.stats.battles and self.half_width() <= self.tolerance:
+            self.converged = True
+            return True
+        if self.time_budget is not None and time.monotonic() - self._started >= self.time_budget:
+            return True
+        return self.max_battles is not None and self.stats.battles >= self.max_battles
+
+    def _execute(self):
+        self._started = time.monotonic()
+        sizes = chunk_sizes(self.chunk_size)
+        index = 0
+        executor = ProcessPoolExecutor(max_workers=self.workers) if self.workers > 1 else None
+        try:
+            while not self.cancelled and not self._finished():
+                tasks = []
+                for _ in range(max(1, self.workers)):
+                    tasks.append((self.system, self.config, next(sizes), chunk_seed(self.seed, index), self.generator))
+                    index += 1
+                results = executor.map(_run_chunk, tasks) if executor is not None else map(_run_chunk, tasks)
+                for chunk_stats in results:
+                    self._add(chunk_stats)
+                self.interval = wilson_interval(self.stats.char1_wins, self.stats.battles)
+        finally:
+            if executor is not None:
+                executor.shutdown(wait=not self.cancelled, cancel_futures=True)
+
+
+def simulate_until(system, config, tolerance=0.01, time_budget=30.0, workers=None, seed=None, max_battles=None,
+                   generator=None):
+    """Εκτελεί μάχες μέχρι ακρίβεια ±tolerance - επιστρέφει το PreciseRun (stats, interval, converged)"""
+    precise_run = PreciseRun(system, config, tolerance, time_budget, workers, seed, max_battles=max_battles,
+                             generator=generator)
+    precise_run.run()
+    return precise_run
+
+
+def format_interval(precise_run):
+    """Η γραμμή με το διάστημα εμπιστοσύνης κάτω από τα αποτελέσματα"""
+    low, high = precise_run.interval
+    result = f"Νίκη Χαρακτήρα 1 (95%): {low * 100:.1f}% - {high * 100:.1f}% σε {precise_run.stats.battles} μάχες\n"
+    if not precise_run.converged:
+        result += f"(Δεν έφτασε την ακρίβεια ±{precise_run.tolerance * 100:.1f}%)\n"
+    return result
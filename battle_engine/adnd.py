@@ -0,0 +1,777 @@
+import random
+import re
+from collections import namedtuple
+
+from .alive import AliveSet
+from .common import run_battles
+from .rng import make_rng
+
+STATS = ["Initiative", "Hit points", "AC", "THAC0", "Attack bonus", "Damage die", "Number of attacks"]
+TEXT_STATS = ["Damage die", "Number of attacks"]  # Κείμενο (π.χ. "1d8", "3/2"), όχι αριθμός
+
+# Τα πεδία του Character στο τέλος κάθε μάχης, για το export (μία στήλη ανά χαρακτήρα)
+RECORD_FIELDS = ("current_hp",)
+
+# Τα στατιστικά ενός χαρακτήρα σε αριθμούς (compile_profile): τα strings ζαριών και επιθέσεων
+# διαβάζονται μία φορά ανά εκτέλεση και όλες οι μάχες μοιράζονται το ίδιο profile.
+# attacks: (main_attack, extra_attacks) στους ζυγούς και στους μονούς γύρους (attacks[round_number % 2]).
+Profile = namedtuple("Profile", [
+    "stats", "hp", "hp_dice", "initiative", "ac", "thac0", "attack_bonus",
+    "damage_dice", "die_size", "damage_bonus", "attacks",
+])
+
+
+def parse_dice_notation(dice_str):
+    """Αναλύει dice notation της μορφής XdY+Z ή XdY-Z ή XdY - (num_dice, die_size, bonus) ή None"""
+    dice_str = dice_str.strip()
+
+    # Pattern: XdY+Z ή XdY-Z ή XdY
+    match = re.match(r'(\d+)d(\d+)(([+-])(\d+))?', dice_str, re.IGNORECASE)
+    if not match:
+        return None
+
+    bonus = 0
+    if match.group(3):  # Υπάρχει bonus
+        bonus_value = int(match.group(5))
+        bonus = bonus_value if match.group(4) == '+' else -bonus_value
+    return int(match.group(1)), int(match.group(2)), bonus
+
+
+def parse_damage_die(damage_die_str):
+    """
+    Αναλύει ένα damage die string της μορφής XdY+Z ή XdY-Z ή XdY
+    Επιστρέφει (num_dice, die_size, bonus)
+    """
+    damage_die_str = damage_die_str.strip()
+
+    # Pattern: XdY+Z ή XdY-Z ή XdY
+    match = re.match(r'(\d+)d(\d+)(([+-])(\d+))?', damage_die_str)
+
+    if match:
+        num_dice = int(match.group(1))
+        die_size = int(match.group(2))
+        bonus = 0
+
+        if match.group(3):  # Υπάρχει bonus
+            sign = match.group(4)
+            bonus_value = int(match.group(5))
+            bonus = bonus_value if sign == '+' else -bonus_value
+
+        return num_dice, die_size, bonus
+    else:
+        # Default αν δεν μπορούμε να το parse
+        return 1, 6, 0
+
+
+def parse_attacks(attacks_str):
+    """
+    Αναλύει το number of attacks string
+    Μπορεί να είναι: "1", "2", "3/2", "5/2", κλπ
+    Επιστρέφει float
+    """
+    attacks_str = attacks_str.strip()
+
+    # Έλεγχος για κλάσμα
+    if '/' in attacks_str:
+        parts = attacks_str.split('/')
+        try:
+            numerator = float(parts[0])
+            denominator = float(parts[1])
+            return numerator / denominator
+        except (ValueError, IndexError, ZeroDivisionError):
+            return 1.0
+    else:
+        try:
+            return float(attacks_str)
+        except ValueError:
+            return 1.0
+
+
+def attacks_for_round(attacks_per_round, round_number):
+    """(main_attack, extra_attacks) για attacks_per_round επιθέσεις/γύρο σε αυτόν τον γύρο"""
+    if attacks_per_round >= 1:
+        main_attack = 1
+        extra_attacks = int(attacks_per_round) - 1
+
+        # Για fractional attacks (πχ 3/2 = 1.5)
+        if attacks_per_round % 1 != 0:
+            # Για 3/2 (1.5): κάθε δεύτερο γύρο παίρνει +1 επίθεση
+            # Για 5/2 (2.5): κάθε δεύτερο γύρο παίρνει +1 επίθεση
+            if round_number % 2 == 0:  # Ζυγοί γύροι
+                extra_attacks += 1
+
+        return main_attack, extra_attacks
+    else:
+        return 1, 0
+
+
+def compile_profile(stats):
+    """Μετατρέπει τα στατιστικά ενός χαρακτήρα σε Profile"""
+    hp_value = stats["Hit points"]
+    hp_dice = None
+    if isinstance(hp_value, str) and 'd' in hp_value.lower():
+        # Dice notation: ρίχνεται όταν φτιάχνεται ο χαρακτήρας, αλλιώς (ή αν δεν αναγνωρίζεται) 1
+        hp_dice = parse_dice_notation(hp_value)
+        hp_value = 1
+    elif isinstance(hp_value, str):
+        try:
+            hp_value = int(hp_value)
+        except ValueError:
+            hp_value = 1  # Fallback
+
+    num_dice, die_size, bonus = parse_damage_die(stats["Damage die"])
+    attacks_per_round = parse_attacks(stats["Number of attacks"])
+    return Profile(
+        stats=dict(stats),
+        hp=hp_value,
+        hp_dice=hp_dice,
+        initiative=stats["Initiative"],
+        ac=stats["AC"],
+        thac0=stats["THAC0"],
+        attack_bonus=stats["Attack bonus"],
+        damage_dice=num_dice,
+        die_size=die_size,
+        damage_bonus=bonus,
+        attacks=(attacks_for_round(attacks_per_round, 0), attacks_for_round(attacks_per_round, 1)),
+    )
+
+
+def as_profile(stats):
+    """Profile από τα στατιστικά - ή το ίδιο, αν είναι ήδη Profile"""
+    return stats if isinstance(stats, Profile) else compile_profile(stats)
+
+
+class Character:
+    # Χωρίς __dict__ ανά χαρακτήρα - τα στατιστικά είναι στο κοινό Profile
+    __slots__ = (
+        "name", "rng", "profile", "stats", "current_hp", "max_hp",
+        "attacks_this_round", "attacks_previous_round", "surprised",
+    )
+
+    def __init__(self, name, stats, surprised=False, roll_hp=False, rng=random, profile=None):
+        self.name = name
+        self.rng = rng
+        self.profile = profile if profile is not None else compile_profile(stats)
+        self.stats = self.profile.stats
+
+        # Παίρνουμε το HP - αν είναι dice notation και roll_hp=True, το ρίχνουμε
+        hp_value = self.profile.hp
+        if roll_hp and self.profile.hp_dice is not None:
+            hp_value = self._roll_hp_dice(self.profile.hp_dice)
+
+        self.current_hp = hp_value
+        self.max_hp = hp_value
+        self.attacks_this_round = 0  # Για tracking πολλαπλών επιθέσεων
+        self.attacks_previous_round = 0  # Για fractional attacks
+        self.surprised = surprised
+
+    def _roll_hp_dice(self, hp_dice):
+        """Ρίχνει τα ζάρια του HP (num_dice, die_size, bonus)"""
+        num_dice, die_size, bonus = hp_dice
+        total = 0
+        for _ in range(num_dice):
+            total += self.rng.randint(1, die_size)
+
+        total += bonus
+        # Τα ελάχιστα HP είναι ίσα με τον αριθμό των ζαριών (κάθε ζάρι = τουλάχιστον 1)
+        return max(num_dice, total)
+
+    def is_alive(self):
+        return self.current_hp > 0
+
+    def take_damage(self, damage):
+        self.current_hp -= damage
+        if self.current_hp < 0:
+            self.current_hp = 0
+
+class BattleEngine:
+    """Οι κανόνες μάχης του συστήματος AD&D, χωρίς γραφικό περιβάλλον"""
+
+    alive_set = AliveSet  # Οι ζωντανοί αντίπαλοι στις μάχες 1 vs πολλοί (η instrument την αντικαθιστά)
+
+    def __init__(self, rng=None):
+        self.rng = rng if rng is not None else make_rng()
+
+    def parse_damage_die(self, damage_die_str):
+        """Βλ. parse_damage_die - επιστρέφει (num_dice, die_size, bonus)"""
+        return parse_damage_die(damage_die_str)
+
+    def roll_damage(self, damage_die_str):
+        """Ρίχνει damage dice και επιστρέφει το αποτέλεσμα"""
+        num_dice, die_size, bonus = self.parse_damage_die(damage_die_str)
+
+        total = 0
+        rolls = []
+        for _ in range(num_dice):
+            roll = self.rng.randint(1, die_size)
+            rolls.append(roll)
+            total += roll
+
+        total += bonus
+
+        return total, rolls, bonus
+
+    def parse_attacks(self, attacks_str):
+        """Βλ. parse_attacks - επιστρέφει float"""
+        return parse_attacks(attacks_str)
+
+    def get_attacks_for_round(self, character, round_number):
+        """
+        Υπολογίζει πόσες επιθέσεις έχει ένας χαρακτήρας σε αυτόν τον γύρο
+        Επιστρέφει (main_attack, extra_attacks)
+        """
+        return character.profile.attacks[round_number % 2]
+
+    def roll_d10(self, modifier=0):
+        """Ρίχνει 1d10 με modifier (για initiative)"""
+        dice_result = self.rng.randint(1, 10)
+        total = dice_result + modifier
+        return dice_result, modifier, total
+
+    def roll_d20(self, modifier=0):
+        """Ρίχνει 1d20 με modifier"""
+        dice_result = self.rng.randint(1, 20)
+        total = dice_result + modifier
+        return dice_result, modifier, total
+
+    def initiative_phase(self, char1, char2):
+        """Καθορίζει ποιος παίζει πρώτος με initiative roll"""
+        result = ""
+
+        while True:
+            dice1, mod1, init1 = self.roll_d10(char1.stats["Initiative"])
+            dice2, mod2, init2 = self.roll_d10(char2.stats["Initiative"])
+
+            result += f"{char1.name}: 1d10({dice1}) + {mod1} = {init1}\n"
+            result += f"{char2.name}: 1d10({dice2}) + {mod2} = {init2}\n"
+
+            if init1 < init2:  # Μικρότερο initiative παίζει πρώτος
+                result += f"{char1.name} παίζει πρώτος!\n\n"
+                return char1, char2, result
+            elif init2 < init1:
+                result += f"{char2.name} παίζει πρώτος!\n\n"
+                return char2, char1, result
+            else:
+                result += "Ισοβαθμία στην πρωτοβουλία! Παίζουν ταυτόχρονα.\n\n"
+                return None, None, result  # Ταυτόχρονες επιθέσεις
+
+    def attack_roll(self, attacker, defender):
+        """
+        Εκτελεί attack roll
+        Επιστρέφει (hit, attack_total, target_number, description)
+        """
+        attack_dice, attack_mod, attack_total = self.roll_d20(attacker.stats["Attack bonus"])
+
+        # Target number = THAC0 του επιτιθέμενου - AC του αμυνόμενου
+        target_number = attacker.stats["THAC0"] - defender.stats["AC"]
+
+        hit = attack_total >= target_number
+
+        desc = f"Attack roll: 1d20({attack_dice}) + {attack_mod} = {attack_total} "
+        desc += f"(χρειάζεται {target_number})\n"
+
+        return hit, attack_total, target_number, desc
+
+    def perform_attack(self, attacker, defender, attack_type="Επίθεση"):
+        """Εκτελεί μια πλήρη επίθεση"""
+        result = f"--- {attack_type} από {attacker.name} ---\n"
+
+        hit, attack_total, target_number, attack_desc = self.attack_roll(attacker, defender)
+        result += attack_desc
+
+        if hit:
+            result += "Επιτυχής επίθεση!\n"
+
+            # Roll damage
+            damage, rolls, bonus = self.roll_damage(attacker.stats["Damage die"])
+
+            result += f"Ζημιά: {attacker.stats['Damage die']} = {rolls}"
+            if bonus != 0:
+                result += f" {'+' if bonus > 0 else ''}{bonus}"
+            result += f" = {damage}\n"
+
+            defender.take_damage(damage)
+            result += f"{defender.name} HP: {defender.current_hp}/{defender.max_hp}\n"
+
+            if not defender.is_alive():
+                result += f"{defender.name} νικιέται!\n"
+                return result, True
+        else:
+            result += "Αποτυχημένη επίθεση!\n"
+
+        result += "\n"
+        return result, False
+
+    def simulate_round(self, char1, char2, round_number):
+        """Προσομοιώνει έναν γύρο μάχης"""
+        result = f"=== ΓΥΡΟΣ {round_number} ===\n"
+
+        # Έλεγχος για surprised characters στον πρώτο γύρο
+        if round_number == 1:
+            char1_can_act = not char1.surprised
+            char2_can_act = not char2.surprised
+
+            if char1.surprised:
+                result += f"{char1.name} είναι surprised και δεν παίζει αυτόν τον γύρο!\n"
+            if char2.surprised:
+                result += f"{char2.name} είναι surprised και δεν παίζει αυτόν τον γύρο!\n"
+
+            # Αν και οι δύο είναι surprised, δεν γίνεται τίποτα
+            if not char1_can_act and not char2_can_act:
+                result += "\n"
+                return result, False, None
+
+            # Αν μόνο ο ένας είναι surprised, ο άλλος παίζει μόνος του
+            if not char1_can_act:
+                result += "\n"
+                char2_main, char2_extra = self.get_attacks_for_round(char2, round_number)
+                for attack_num in range(char2_main + char2_extra):
+                    attack_type = "Επίθεση" if attack_num == 0 else f"Επιπλέον επίθεση {attack_num}"
+                    attack_result, defeated = self.perform_attack(char2, char1, attack_type)
+                    result += attack_result
+                    if defeated:
+                        return result, True, char2
+                return result, False, None
+
+            if not char2_can_act:
+                result += "\n"
+                char1_main, char1_extra = self.get_attacks_for_round(char1, round_number)
+                for attack_num in range(char1_main + char1_extra):
+                    attack_type = "Επίθεση" if attack_num == 0 else f"Επιπλέον επίθεση {attack_num}"
+                    attack_result, defeated = self.perform_attack(char1, char2, attack_type)
+                    result += attack_result
+                    if defeated:
+                        return result, True, char1
+                return result, False, None
+
+        # Initiative roll για αυτόν τον γύρο
+        first_player, second_player, init_result = self.initiative_phase(char1, char2)
+        result += init_result
+
+        simultaneous = (first_player is None)
+
+        # Υπολογίζουμε πόσες επιθέσεις έχει ο καθένας
+        char1_main, char1_extra = self.get_attacks_for_round(char1, round_number)
+        char2_main, char2_extra = self.get_attacks_for_round(char2, round_number)
+
+        result += f"{char1.name} έχει {char1_main + char1_extra} επιθέσεις αυτόν τον γύρο\n"
+        result += f"{char2.name} έχει {char2_main + char2_extra} επιθέσεις αυτόν τον γύρο\n\n"
+
+        if simultaneous:
+            # Ταυτόχρονες επιθέσεις - και οι δύο παίζουν ΟΛΑ τα χτυπήματά τους
+            # Κύριες επιθέσεις
+            if char2.is_alive():
+                attack_result, char2_defeated = self.perform_attack(char1, char2, "Επίθεση")
+                result += attack_result
+
+            if char1.is_alive():
+                attack_result, char1_defeated = self.perform_attack(char2, char1, "Επίθεση")
+                result += attack_result
+
+            # Extra attacks για char1
+            for i in range(char1_extra):
+                if char2.is_alive():
+                    attack_result, defeated = self.perform_attack(char1, char2, f"Επιπλέον επίθεση {i+1}")
+                    result += attack_result
+
+            # Extra attacks για char2
+            for i in range(char2_extra):
+                if char1.is_alive():
+                    attack_result, defeated = self.perform_attack(char2, char1, f"Επιπλέον επίθεση {i+1}")
+                    result += attack_result
+
+            # Τώρα ελέγχουμε ποιος ζει
+            char1_alive = char1.is_alive()
+            char2_alive = char2.is_alive()
+
+            if not char1_alive and not char2_alive:
+                # Και οι δύο πέθαναν - ΙΣΟΠΑΛΙΑ!
+                result += "\nΚαι οι δύο χαρακτήρες νικιούνται ταυτόχρονα!\n"
+                return result, True, None  # None = ισοπαλία
+            elif not char1_alive:
+                return result, True, char2
+            elif not char2_alive:
+                return result, True, char1
+        else:
+            # Κανονική σειρά - πρώτος παίζει ο first_player
+            # Κύρια επίθεση του πρώτου παίκτη
+            attack_result, second_defeated = self.perform_attack(first_player, second_player, "Επίθεση")
+            result += attack_result
+
+            if second_defeated:
+                return result, True, first_player
+
+            # Κύρια επίθεση του δεύτερου παίκτη
+            attack_result, first_defeated = self.perform_attack(second_player, first_player, "Επίθεση")
+            result += attack_result
+
+            if first_defeated:
+                return result, True, second_player
+
+            # Extra attacks του πρώτου παίκτη
+            if first_player == char1:
+                extra_attacks = char1_extra
+            else:
+                extra_attacks = char2_extra
+
+            for i in range(extra_attacks):
+                if not second_player.is_alive():
+                    break
+                attack_result, defeated = self.perform_attack(first_player, second_player, f"Επιπλέον επίθεση {i+1}")
+                result += attack_result
+                if defeated:
+                    return result, True, first_player
+
+            # Extra attacks του δεύτερου παίκτη
+            if second_player == char1:
+                extra_attacks = char1_extra
+            else:
+                extra_attacks = char2_extra
+
+            for i in range(extra_attacks):
+                if not first_player.is_alive():
+                    break
+                attack_result, defeated = self.perform_attack(second_player, first_player, f"Επιπλέον επίθεση {i+1}")
+                result += attack_result
+                if defeated:
+                    return result, True, second_player
+
+        return result, False, None
+
+    def simulate_battle(self, char1_stats, char2_stats, char1_surprised, char2_surprised, verbose=True):
+        """Προσομοιώνει μια πλήρη μάχη"""
+        char1 = Character("Χαρακτήρας 1", char1_stats, char1_surprised, roll_hp=True, rng=self.rng)
+        char2 = Character("Χαρακτήρας 2", char2_stats, char2_surprised, roll_hp=True, rng=self.rng)
+
+        result = ""
+
+        if verbose:
+            result += "=== ΜΑΧΗ ΧΑΡΑΚΤΗΡΩΝ - AD&D ===\n\n"
+
+        round_number = 0
+        while round_number < 100:  # Safety limit
+            round_number += 1
+
+            round_result, battle_ended, winner = self.simulate_round(char1, char2, round_number)
+
+            if verbose:
+                result += round_result
+
+            if battle_ended:
+                if winner is None:
+                    # Ισοπαλία - και οι δύο πέθαναν ταυτόχρονα
+                    if verbose:
+                        result += f"\n🤝 ΙΣΟΠΑΛΙΑ! 🤝\n"
+                        result += f"Συνολικοί γύροι: {round_number}\n"
+                    return result, 0, round_number
+                else:
+                    if verbose:
+                        result += f"\n🏆 ΝΙΚΗΤΗΣ: {winner.name}! 🏆\n"
+                        result += f"Συνολικοί γύροι: {round_number}\n"
+
+                    winner_num = 1 if winner == char1 else 2
+                    return result, winner_num, round_number
+
+        # Ισοπαλία
+        if verbose:
+            result += "\nΗ μάχη διαρκεί πολύ! Ισοπαλία.\n"
+        return result, 0, round_number
+
+    def simulate_battle_1vMany(self, char1_stats, char2_stats, char2_number, char2_engaged, char1_surprised, char2_surprised, verbose=True):
+        """Προσομοιώνει μάχη 1 vs πολλοί με reserves"""
+        char1 = Character("Χαρακτήρας 1", char1_stats, char1_surprised, roll_hp=True, rng=self.rng)
+        char2_list = []
+
+        # Κάθε εχθρός παίρνει ΞΕΧΩΡΙΣΤΑ rolled HP!
+        for i in range(char2_number):
+            char = Character(f"Χαρακτήρας 2.{i+1}", char2_stats, char2_surprised, roll_hp=True, rng=self.rng)
+            char2_list.append(char)
+
+        result = ""
+        if verbose:
+            result += f"=== ΜΑΧΗ ΧΑΡΑΚΤΗΡΩΝ - AD&D (1 vs {char2_number}, max {char2_engaged} engaged) ===\n\n"
+
+        round_number = 0
+        while round_number < 100:  # Safety limit
+            round_number += 1
+
+            # Έλεγχος αν υπάρχουν ζωντανοί εχθροί
+            alive_enemies = [c for c in char2_list if c.is_alive()]
+            if not alive_enemies:
+                if verbose:
+                    result += f"\n🏆 ΝΙΚΗΤΗΣ: {char1.name}! 🏆\n"
+                    result += f"Συνολικοί γύροι: {round_number}\n"
+                return result, 1, round_number
+
+            if not char1.is_alive():
+                if verbose:
+                    result += f"\n🏆 ΝΙΚΗΤΕΣ: Οι αντίπαλοι! 🏆\n"
+                    result += f"Συνολικοί γύροι: {round_number}\n"
+                return result, 2, round_number
+
+            # Χωρίζουμε σε engaged και reserves
+            engaged_enemies = alive_enemies[:char2_engaged]
+            reserves = alive_enemies[char2_engaged:]
+
+            if verbose:
+                result += f"=== ΓΥΡΟΣ {round_number} ===\n"
+                if reserves:
+                    result += f"Engaged: {len(engaged_enemies)}, Reserves: {len(reserves)}\n\n"
+                else:
+                    result += f"Ζωντανοί εχθροί: {len(alive_enemies)}\n\n"
+
+            # Επιλογή στόχου: ο πιο χτυπημένος από τους engaged
+            target = min(engaged_enemies, key=lambda c: c.current_hp)
+
+            # Char1 επιτίθεται
+            char1_main, char1_extra = self.get_attacks_for_round(char1, round_number)
+
+            for attack_num in range(char1_main + char1_extra):
+                if not target.is_alive():
+                    # Αλλάζουμε στόχο από τους engaged
+                    alive_enemies = [c for c in char2_list if c.is_alive()]
+                    engaged_enemies = alive_enemies[:char2_engaged]
+                    if not alive_enemies:
+                        break
+                    if not engaged_enemies:
+                        break
+                    target = min(engaged_enemies, key=lambda c: c.current_hp)
+
+                attack_type = "Επίθεση" if attack_num == 0 else f"Επιπλέον επίθεση {attack_num}"
+                attack_result, defeated = self.perform_attack(char1, target, attack_type)
+
+                if verbose:
+                    result += attack_result
+
+            # Έλεγχος αν όλοι οι εχθροί νικήθηκαν
+            alive_enemies = [c for c in char2_list if c.is_alive()]
+            if not alive_enemies:
+                if verbose:
+                    result += f"\n🏆 ΝΙΚΗΤΗΣ: {char1.name}! 🏆\n"
+                    result += f"Συνολικοί γύροι: {round_number}\n"
+                return result, 1, round_number
+
+            # Ενημερώνουμε τους engaged μετά τις επιθέσεις του char1
+            engaged_enemies = alive_enemies[:char2_engaged]
+
+            # Engaged εχθροί επιτίθενται
+            for enemy in engaged_enemies:
+                if not char1.is_alive():
+                    break
+
+                enemy_main, enemy_extra = self.get_attacks_for_round(enemy, round_number)
+
+                for attack_num in range(enemy_main + enemy_extra):
+                    if not char1.is_alive():
+                        break
+
+                    attack_type = "Επίθεση" if attack_num == 0 else f"Επιπλέον επίθεση {attack_num}"
+                    attack_result, defeated = self.perform_attack(enemy, char1, attack_type)
+
+                    if verbose:
+                        result += attack_result
+
+                    if defeated:
+                        if verbose:
+                            result += f"\n🏆 ΝΙΚΗΤΕΣ: Οι αντίπαλοι! 🏆\n"
+                            result += f"Συνολικοί γύροι: {round_number}\n"
+                        return result, 2, round_number
+
+        # Ισοπαλία
+        if verbose:
+            result += "\nΗ μάχη διαρκεί πολύ! Ισοπαλία.\n"
+        return result, 0, round_number
+
+    def simulate_battle_silent(self, char1_stats, char2_stats, char1_surprised=False, char2_surprised=False, char2_number=1, char2_engaged=1):
+        """Προσομοιώνει μια μάχη χωρίς output - επιστρέφει (νικητής, γύροι)
+
+        Τα char1_stats/char2_stats μπορεί να είναι και Profile (compile_profile), όπως στην simulate.
+        """
+        profile1, profile2 = as_profile(char1_stats), as_profile(char2_stats)
+        char1 = Character("Χαρακτήρας 1", None, char1_surprised, roll_hp=True, rng=self.rng, profile=profile1)
+        if char2_number == 1:
+            char2 = Character("Χαρακτήρας 2", None, char2_surprised, roll_hp=True, rng=self.rng, profile=profile2)
+            self.combatants = (char1, (char2,))
+            return self.simulate_1v1_silent(char1, char2)
+
+        char2_list = []
+        for i in range(char2_number):
+            char2_list.append(Character(f"Χαρακτήρας 2.{i+1}", None, char2_surprised, roll_hp=True, rng=self.rng, profile=profile2))
+        self.combatants = (char1, char2_list)
+        return self.simulate_1vMany_silent(char1, char2_list, char2_engaged)
+
+    def end_state(self, winner):
+        """Οι πόντοι ζωής που έμειναν στον νικητή της τελευταίας μάχης χωρίς output (None σε ισοπαλία)
+
+        Όταν νικάνε οι αντίπαλοι, στον πιο υγιή ζωντανό αντίπαλο.
+        """
+        char1, char2_list = self.combatants
+        if winner == 1:
+            return char1.current_hp
+        if winner == 2:
+            return max(char2.current_hp for char2 in char2_list if char2.current_hp > 0)
+        return None
+
+    def simulate_1v1_silent(self, char1, char2):
+        """Μάχη 1v1 χωρίς κείμενο - ίδιες ζαριές με την simulate_battle"""
+        round_number = 0
+        while round_number < 100:  # Safety limit
+            round_number += 1
+            battle_ended, winner = self.simulate_round_silent(char1, char2, round_number)
+            if battle_ended:
+                if winner is None:
+                    return 0, round_number
+                return (1 if winner == char1 else 2), round_number
+        return 0, round_number
+
+    def simulate_round_silent(self, char1, char2, round_number):
+        """Ένας γύρος χωρίς κείμενο - επιστρέφει (τέλος μάχης, νικητής)"""
+        if round_number == 1 and (char1.surprised or char2.surprised):
+            if char1.surprised and char2.surprised:
+                return False, None
+            # Παίζει μόνο όποιος δεν είναι surprised
+            attacker, defender = (char2, char1) if char1.surprised else (char1, char2)
+            main, extra = self.get_attacks_for_round(attacker, round_number)
+            for _ in range(main + extra):
+                if self.attack_silent(attacker, defender):
+                    return True, attacker
+            return False, None
+
+        first_player, second_player = self.initiative_phase_silent(char1, char2)
+        char1_main, char1_extra = self.get_attacks_for_round(char1, round_number)
+        char2_main, char2_extra = self.get_attacks_for_round(char2, round_number)
+
+        if first_player is None:
+            # Ταυτόχρονες επιθέσεις - και οι δύο παίζουν ΟΛΑ τα χτυπήματά τους
+            if char2.is_alive():
+                self.attack_silent(char1, char2)
+            if char1.is_alive():
+                self.attack_silent(char2, char1)
+            for _ in range(char1_extra):
+                if char2.is_alive():
+                    self.attack_silent(char1, char2)
+            for _ in range(char2_extra):
+                if char1.is_alive():
+                    self.attack_silent(char2, char1)
+
+            char1_alive = char1.is_alive()
+            char2_alive = char2.is_alive()
+            if not char1_alive and not char2_alive:
+                return True, None  # Ισοπαλία
+            if not char1_alive:
+                return True, char2
+            if not char2_alive:
+                return True, char1
+            return False, None
+
+        # Κύριες επιθέσεις με τη σειρά της πρωτοβουλίας
+        if self.attack_silent(first_player, second_player):
+            return True, first_player
+        if self.attack_silent(second_player, first_player):
+            return True, second_player
+
+        # Extra attacks
+        for attacker, defender in ((first_player, second_player), (second_player, first_player)):
+            extra_attacks = char1_extra if attacker == char1 else char2_extra
+            for _ in range(extra_attacks):
+                if not defender.is_alive():
+                    break
+                if self.attack_silent(attacker, defender):
+                    return True, attacker
+        return False, None
+
+    def simulate_1vMany_silent(self, char1, char2_list, char2_engaged):
+        """Μάχη 1 vs πολλοί χωρίς κείμενο - ίδιες ζαριές με την simulate_battle_1vMany"""
+        enemies = self.alive_set(char2_list, char2_engaged, Character.is_alive)
+        round_number = 0
+        while round_number < 100:  # Safety limit
+            round_number += 1
+
+            engaged_enemies = enemies.refresh()
+            if not engaged_enemies:
+                return 1, round_number
+            if not char1.is_alive():
+                return 2, round_number
+
+            # Επιλογή στόχου: ο πιο χτυπημένος από τους engaged
+            target = min(engaged_enemies, key=lambda c: c.current_hp)
+
+            char1_main, char1_extra = self.get_attacks_for_round(char1, round_number)
+            for _ in range(char1_main + char1_extra):
+                if not target.is_alive():
+                    engaged_enemies = enemies.refresh()
+                    if not engaged_enemies:
+                        break
+                    target = min(engaged_enemies, key=lambda c: c.current_hp)
+                self.attack_silent(char1, target)
+
+            engaged_enemies = enemies.refresh()
+            if not engaged_enemies:
+                return 1, round_number
+
+            # Engaged εχθροί επιτίθενται
+            for enemy in engaged_enemies:
+                if not char1.is_alive():
+                    break
+                enemy_main, enemy_extra = self.get_attacks_for_round(enemy, round_number)
+                for _ in range(enemy_main + enemy_extra):
+                    if not char1.is_alive():
+                        break
+                    if self.attack_silent(enemy, char1):
+                        return 2, round_number
+
+        return 0, round_number
+
+    def initiative_phase_silent(self, char1, char2):
+        """initiative_phase χωρίς κείμενο - (πρώτος, δεύτερος) ή (None, None) για ταυτόχρονες επιθέσεις"""
+        init1 = self.rng.randint(1, 10) + char1.profile.initiative
+        init2 = self.rng.randint(1, 10) + char2.profile.initiative
+        if init1 < init2:  # Μικρότερο initiative παίζει πρώτος
+            return char1, char2
+        if init2 < init1:
+            return char2, char1
+        return None, None
+
+    def attack_silent(self, attacker, defender):
+        """perform_attack χωρίς κείμενο - επιστρέφει True αν νικήθηκε ο αμυνόμενος"""
+        profile = attacker.profile
+        target_number = profile.thac0 - defender.profile.ac
+        if self.rng.randint(1, 20) + profile.attack_bonus < target_number:
+            return False
+
+        damage = profile.damage_bonus
+        for _ in range(profile.damage_dice):
+            damage += self.rng.randint(1, profile.die_size)
+        defender.take_damage(damage)
+        return not defender.is_alive()
+
+    def single_battle(self, char1_stats, char2_stats, char1_surprised=False, char2_surprised=False, char2_number=1, char2_engaged=1):
+        """Εκτελεί μια αναλυτική μάχη - επιστρέφει το κείμενο της μάχης"""
+        if char2_number == 1:
+            result, winner, rounds = self.simulate_battle(
+                char1_stats, char2_stats,
+                char1_surprised, char2_surprised,
+                verbose=True
+            )
+        else:
+            result, winner, rounds = self.simulate_battle_1vMany(
+                char1_stats, char2_stats, char2_number, char2_engaged,
+                char1_surprised, char2_surprised,
+                verbose=True
+            )
+        return result
+
+
+def simulate(config, n, seed=None, rng=None, stats=None, engine_class=None):
+    """Εκτελεί n μάχες χωρίς output - config: τα ορίσματα της simulate_battle_silent
+
+    rng: έτοιμη γεννήτρια αντί για την rng.make_rng(seed)
+    stats: BattleStats που συμπληρώνεται, π.χ. aggregate.BattleAggregate (με την κατάσταση
+    του νικητή, BattleEngine.end_state) ή export.BattleRecorder (μία γραμμή ανά μάχη)
+    engine_class: άλλη κλάση μηχανής, π.χ. instrument.instrumented_class (προεπιλογή BattleEngine)
+    """
+    engine = (engine_class or BattleEngine)(rng if rng is not None else make_rng(seed))
+    config = dict(config)
+    config["char1_stats"] = compile_profile(config["char1_stats"])  # Μία φορά για όλες τις μάχες
+    config["char2_stats"] = compile_profile(config["char2_stats"])
+    return run_battles(engine.simulate_battle_silent, config, n, stats, engine)
@@ -0,0 +1,208 @@
+"""Αναλυτικά στατιστικά μαζικών μαχών: κατανομή γύρων, εκατοστημόρια, καμπύλες
+επιβίωσης και η κατάσταση του νικητή στο τέλος της μάχης.
+
+Η BattleAggregate είναι BattleStats (ό,τι δουλεύει με BattleStats δουλεύει και
+με αυτήν) που κρατάει επιπλέον ιστογράμματα: γύροι ανά νικητή και κατάσταση
+του νικητή (λαβωματιές/κόπωση ή πόντοι ζωής, ό,τι δίνει η end_state κάθε
+μηχανής). Η μνήμη δεν εξαρτάται από τον αριθμό των μαχών, μόνο από το πόσες
+διαφορετικές τιμές εμφανίζονται, και δύο BattleAggregate ενώνονται ακριβώς
+με τη merge, οπότε κάθε worker μαζεύει τα δικά του κομμάτια.
+
+Μέσος όρος και διασπορά βγαίνουν από το ιστόγραμμα με ακέραια αθροίσματα:
+ακριβή και ίδια με όποια σειρά κι αν ενωθούν τα κομμάτια.
+"""
+
+import math
+import os
+import random
+from concurrent.futures import ProcessPoolExecutor
+
+from . import get_rule_system
+from .common import BattleStats
+from .parallel import CHUNK_SIZE, split_chunks
+from .rng import DEFAULT_GENERATOR, make_rng
+
+try:
+    import numpy as np
+except ImportError:  # Χωρίς numpy δεν υπάρχει η add_arrays
+    np = None
+
+PERCENTILES = (50, 90, 99)
+
+
+def _merge_counts(target, counts):
+    for value, count in counts.items():
+        target[value] = target.get(value, 0) + count
+
+
+class BattleAggregate(BattleStats):
+    """BattleStats με την πλήρη κατανομή των γύρων και της κατάστασης του νικητή"""
+
+    def __init__(self):
+        super().__init__()
+        self.rounds_by_winner = {0: {}, 1: {}, 2: {}}  # νικητής -> {γύροι: μάχες}
+        self.end_states = {1: {}, 2: {}}  # νικητής -> {κατάσταση: μάχες}
+
+    def battle_details(self, engine):
+        return engine.end_state
+
+    def add(self, winner, rounds, end_state=None):
+        """Καταγράφει μια μάχη - end_state: η κατάσταση του νικητή (BattleEngine.end_state)"""
+        BattleStats.add(self, winner, rounds)
+        histogram = self.rounds_by_winner[winner]
+        histogram[rounds] = histogram.get(rounds, 0) + 1
+        if end_state is not None:
+            states = self.end_states[winner]
+            states[end_state] = states.get(end_state, 0) + 1
+
+    def add_arrays(self, winners, rounds):
+        """Καταγράφει μάχες από πίνακες numpy νικητών και γύρων (π.χ. classic_batch.battle_results)"""
+        if np is None:
+            raise ImportError("Η add_arrays απαιτεί numpy")
+        for winner in (0, 1, 2):
+            values, counts = np.unique(rounds[winners == winner], return_counts=True)
+            if len(values) == 0:
+                continue
+            stats = BattleAggregate()
+            stats.battles = int(counts.sum())
+            stats.total_rounds = int((values * counts).sum())
+            stats.min_rounds, stats.max_rounds = int(values[0]), int(values[-1])
+            if winner == 1:
+                stats.char1_wins = stats.battles
+            elif winner == 2:
+                stats.char2_wins = stats.battles
+            else:
+                stats.draws = stats.battles
+            stats.rounds_by_winner[winner] = dict(zip(values.tolist(), counts.tolist()))
+            self.merge(stats)
+        return self
+
+    def merge(self, other):
+        """Προσθέτει τα αποτελέσματα ενός άλλου BattleAggregate (ή απλού BattleStats, χωρίς ιστογράμματα)"""
+        BattleStats.merge(self, other)
+        if isinstance(other, BattleAggregate):
+            for winner, histogram in other.rounds_by_winner.items():
+                _merge_counts(self.rounds_by_winner[winner], histogram)
+            for winner, states in other.end_states.items():
+                _merge_counts(self.end_states[winner], states)
+        return self
+
+    def histogram(self):
+        """Μάχες ανά αριθμό γύρων - {γύροι: μάχες}, ταξινομημένο"""
+        histogram = {}
+        for counts in self.rounds_by_winner.values():
+            _merge_counts(histogram, counts)
+        return dict(sorted(histogram.items()))
+
+    def percentile(self, q):
+        """Οι γύροι μέσα στους οποίους τελειώνει το q% των μαχών (nearest rank)"""
+        if self.battles == 0:
+            return None
+        rank = max(1, math.ceil(q / 100 * self.battles))
+        seen = 0
+        for rounds, count in self.histogram().items():
+            seen += count
+            if seen >= rank:
+                return rounds
+        return self.max_rounds
+
+    def variance(self):
+        """Διασπορά των γύρων (δείγματος)"""
+        if self.battles < 2:
+            return 0.0
+        square_sum = sum(rounds * rounds * count for rounds, count in self.histogram().items())
+        # Ακέραιοι αριθμητής: καμία απώλεια ακρίβειας για οποιονδήποτε αριθμό μαχών
+        return (self.battles * square_sum - self.total_rounds ** 2) / (self.battles * (self.battles - 1))
+
+    def std_rounds(self):
+        return math.sqrt(self.variance())
+
+    def survival(self):
+        """Πιθανότητα να συνεχίζεται η μάχη μετά από κάθε γύρο - [(γύροι, πιθανότητα), ...]"""
+        if self.battles == 0:
+            return []
+        histogram = self.histogram()
+        remaining = self.battles
+        curve = []
+        for rounds in range(1, self.max_rounds + 1):
+            remaining -= histogram.get(rounds, 0)
+            curve.append((rounds, remaining / self.battles))
+        return curve
+
+    def win_curve(self):
+        """Πιθανότητα να έχει νικήσει ο καθένας μέχρι κάθε γύρο - [(γύροι, νίκη 1, νίκη 2), ...]"""
+        if self.battles == 0:
+            return []
+        wins1 = wins2 = 0
+        curve = []
+        for rounds in range(1, self.max_rounds + 1):
+            wins1 += self.rounds_by_winner[1].get(rounds, 0)
+            wins2 += self.rounds_by_winner[2].get(rounds, 0)
+            curve.append((rounds, wins1 / self.battles, wins2 / self.battles))
+        return curve
+
+    def end_state_distribution(self, winner):
+        """Η κατάσταση του νικητή στις νίκες του - {κατάσταση: πιθανότητα}, από τη συχνότερη"""
+        states = self.end_states[winner]
+        total = sum(states.values())
+        return {state: count / total for state, count in sorted(states.items(), key=lambda item: -item[1])}
+
+    def to_dict(self):
+        result = super().to_dict()
+        result["std_rounds"] = self.std_rounds()
+        result["percentiles"] = {str(q): self.percentile(q) for q in PERCENTILES}
+        result["rounds_histogram"] = {
+            str(winner): dict(sorted(histogram.items())) for winner, histogram in self.rounds_by_winner.items()
+        }
+        result["end_states"] = {
+            str(winner): [[list(state) if isinstance(state, tuple) else state, count]
+                          for state, count in sorted(states.items(), key=lambda item: -item[1])]
+            for winner, states in self.end_states.items()
+        }
+        return result
+
+
+def format_aggregate(stats, char2_number=1):
+    """Κείμενο με τα επιπλέον στατιστικά, για μετά το format_summary"""
+    if stats.battles == 0:
+        return ""
+    percentiles = ", ".join(f"p{q}: {stats.percentile(q)}" for q in PERCENTILES)
+    text = f"Γύροι: {percentiles}, τυπική απόκλιση {stats.std_rounds():.2f}\n"
+    for winner, name in ((1, "Χαρακτήρα 1"), (2, "Χαρακτήρα 2" if char2_number == 1 else "αντιπάλων")):
+        distribution = stats.end_state_distribution(winner)
+        if not distribution:
+            continue
+        shown = ", ".join(f"{state}: {p * 100:.1f}%" for state, p in list(distribution.items())[:5])
+        text += f"Κατάσταση νικητή (νίκες {name}): {shown}\n"
+    return text
+
+
+def _run_chunk(args):
+    system, config, n, seed, generator = args
+    return get_rule_system(system).simulate(
+        config, n, rng=make_rng(seed, generator=generator or DEFAULT_GENERATOR), stats=BattleAggregate()
+    )
+
+
+def simulate(system, config, n, workers=None, seed=None, chunk_size=CHUNK_SIZE, generator=None):
+    """Όπως η parallel.simulate, αλλά επιστρέφει BattleAggregate
+
+    Τρέχει πάντα την απλή simulate του συστήματος (όχι την FAST_SIMULATORS),
+    γιατί μόνο αυτή δίνει την κατάσταση του νικητή κάθε μάχης.
+    """
+    if seed is None:
+        seed = random.SystemRandom().getrandbits(64)
+    if workers is None:
+        workers = os.cpu_count() or 1
+
+    tasks = [(system, config, size, shard_seed, generator) for size, shard_seed in split_chunks(n, seed, chunk_size)]
+    if workers <= 1 or len(tasks) <= 1:
+        results = map(_run_chunk, tasks)
+    else:
+        with ProcessPoolExecutor(max_workers=min(workers, len(tasks))) as executor:
+            results = list(executor.map(_run_chunk, tasks))
+
+    stats = BattleAggregate()
+    for chunk_stats in results:
+        stats.merge(chunk_stats)
+    return stats
@@ -0,0 +1,57 @@
+"""Οι ζωντανοί αντίπαλοι μιας μάχης 1 vs πολλοί, κοινοί σε όλα τα συστήματα.
+
+Σε κάθε σύστημα πολεμάνε μόνο οι engaged πρώτοι ζωντανοί αντίπαλοι (με τη σειρά
+της λίστας) και οι υπόλοιποι περιμένουν ως reserves. Μόνο οι engaged μπορούν να
+χτυπηθούν, οπότε αρκεί να ελέγχονται αυτοί: οι νεκροί βγαίνουν και τη θέση τους
+παίρνουν οι πρώτοι reserves από ένα deque. Κάθε έλεγχος κοστίζει O(engaged) αντί
+για O(αντίπαλοι), και η μάχη εναντίον N αντιπάλων γίνεται γραμμική στο N.
+"""
+
+import itertools
+from collections import deque
+
+
+class AliveSet:
+    """Οι ζωντανοί αντίπαλοι: οι engaged (λίστα, με τη σειρά τους) και οι reserves (deque).
+
+    is_alive: συνάρτηση που ελέγχει αν ένας αντίπαλος ζει, π.χ. lambda c: c.wounds < 10
+    """
+
+    __slots__ = ("engaged", "reserves", "size", "is_alive")
+
+    def __init__(self, combatants, size, is_alive):
+        self.size = max(1, size)
+        self.is_alive = is_alive
+        self.engaged = list(combatants[:self.size])
+        self.reserves = deque(combatants[self.size:])
+
+    def refresh(self):
+        """Βγάζει τους νεκρούς από τους engaged και συμπληρώνει από τους reserves - επιστρέφει τους engaged
+
+        Ίδιο αποτέλεσμα με [c for c in combatants if is_alive(c)][:size]. Η λίστα δεν
+        αλλάζει ποτέ επί τόπου, οπότε μπορεί να διατρέχεται ενώ πεθαίνουν αντίπαλοι.
+        Κενή λίστα: δεν έμεινε κανένας ζωντανός.
+        """
+        is_alive = self.is_alive
+        engaged = self.engaged
+        for combatant in engaged:
+            if not is_alive(combatant):
+                break
+        else:
+            return engaged  # Κανένας νεκρός - η συνηθισμένη περίπτωση
+
+        engaged = [combatant for combatant in engaged if is_alive(combatant)]
+        reserves = self.reserves
+        while len(engaged) < self.size and reserves:
+            combatant = reserves.popleft()
+            if is_alive(combatant):
+                engaged.append(combatant)
+        self.engaged = engaged
+        return engaged
+
+    def __iter__(self):
+        """Όλοι οι ζωντανοί με τη σειρά τους: οι engaged και μετά οι reserves"""
+        return itertools.chain(self.refresh(), self.reserves)
+
+    def __len__(self):
+        return len(self.refresh()) + len(self.reserves)
@@ -0,0 +1,482 @@
+from . import tables
+from .alive import AliveSet
+from .common import run_battles
+from .rng import make_rng
+
+STATS = ["Μάχη", "Ζημιά", "Αντοχή"]
+
+# Τα πεδία του Character στο τέλος κάθε μάχης, για το export (μία στήλη ανά χαρακτήρα)
+RECORD_FIELDS = ("wounds", "crits")
+
+# Το πεδίο του Character για κάθε στατιστικό
+STAT_FIELDS = {"Μάχη": "combat", "Ζημιά": "damage", "Αντοχή": "toughness"}
+
+class Character:
+    # Ακέραια πεδία αντί για dicts: σε μάχες 1 vs Πολλών φτιάχνονται εκατομμύρια χαρακτήρες
+    __slots__ = ("name", "combat", "damage", "toughness", "is_minion", "wounds", "crits")
+
+    def __init__(self, name, stats, is_minion=False):
+        self.name = name
+        self.combat = stats["Μάχη"]
+        self.damage = stats["Ζημιά"]
+        self.toughness = stats["Αντοχή"]
+        self.is_minion = is_minion
+        self.wounds = 0
+        self.crits = 0  # Καίρια που πέτυχε
+
+    def get_effective_stat(self, stat_name):
+        """Υπολογίζει το τελικό stat"""
+        return getattr(self, STAT_FIELDS[stat_name])
+
+class BattleEngine:
+    """Οι κανόνες μάχης του εναλλακτικού συστήματος, χωρίς γραφικό περιβάλλον"""
+
+    alive_set = AliveSet  # Οι ζωντανοί αντίπαλοι στις μάχες 1 vs πολλοί (η instrument την αντικαθιστά)
+
+    def __init__(self, rng=None):
+        self.rng = rng if rng is not None else make_rng()
+
+    def roll_d20(self, modifier=0):
+        """Ρίχνει d20 με modifier"""
+        dice_result = self.rng.randint(1, 20)
+        total = dice_result + modifier
+        return dice_result, modifier, total
+
+    def format_dice_roll(self, stat_name, dice_result, modifier, total):
+        """Μορφοποιεί την εμφάνιση της ζαριάς"""
+        if modifier >= 0:
+            return f"{stat_name} d20({dice_result}) + {modifier} = {total}"
+        else:
+            return f"{stat_name} d20({dice_result}) - {abs(modifier)} = {total}"
+
+    def apply_damage(self, attacker, defender, attacker_battle_dice, defender_no_crit, result_text=""):
+        """Εφαρμόζει ζημιά από τον attacker στον defender.
+        Αν attacker_battle_dice == 20 και defender_no_crit == False, ρίχνει 2 ζαριές ζημιάς.
+        Επιστρέφει: (result_text, battle_ended, winner, wounds_dealt)"""
+
+        is_critical = (attacker_battle_dice == 20 and not defender_no_crit)
+        num_damage_rolls = 2 if is_critical else 1
+
+        if is_critical:
+            result_text += "⚔️ ΚΑΙΡΙΟ ΧΤΥΠΗΜΑ! Ρίχνει 2 ζαριές ζημιάς!\n"
+
+        total_wounds = 0
+
+        for roll_num in range(num_damage_rolls):
+            dmg_dice, dmg_mod, damage_roll = self.roll_d20(attacker.damage)
+            end_dice, end_mod, endurance_roll = self.roll_d20(defender.toughness)
+
+            damage_display = self.format_dice_roll("Ζημιά", dmg_dice, dmg_mod, damage_roll)
+            endurance_display = self.format_dice_roll("Αντοχή", end_dice, end_mod, endurance_roll)
+
+            if is_critical:
+                result_text += f"Ζημιά {roll_num + 1}/2: {damage_display} vs {endurance_display}\n"
+            else:
+                result_text += f"{damage_display} vs {endurance_display}\n"
+
+            damage_diff = damage_roll - endurance_roll
+            had_two_wounds = defender.wounds >= 2
+
+            # Τσιράκι: πεθαίνει με οποιαδήποτε επιτυχή ζημιά
+            if defender.is_minion and damage_diff >= 0:
+                result_text += f"Τσιράκι! (+{damage_diff}) Ο {defender.name} νικιέται!\n"
+                defender.wounds = 10  # Σημάδι νίκης
+                return result_text, True, attacker, total_wounds
+            elif damage_diff >= 10:
+                result_text += f"ΘΑΝΑΤΗΦΟΡΟ ΧΤΥΠΗΜΑ! (+{damage_diff}) Ο {defender.name} νικιέται!\n"
+                defender.wounds = 10  # Σημάδι νίκης
+                return result_text, True, attacker, total_wounds
+            elif damage_diff >= 5:
+                result_text += f"Σοβαρή ζημιά! (+{damage_diff}) 2 λαβωματιές\n"
+                defender.wounds += 2
+                total_wounds += 2
+            elif damage_diff >= 0:
+                result_text += f"Ζημιά! (+{damage_diff}) 1 λαβωματιά\n"
+                defender.wounds += 1
+                total_wounds += 1
+            else:
+                result_text += f"Αντέχει τη ζημιά! ({damage_diff})\n"
+
+            # Έλεγχος αν ο defender είχε >=2 λαβωματιές και μόλις λαβώθηκε ξανά (μόνο αν δεν είναι τσιράκι)
+            if not defender.is_minion and had_two_wounds and damage_diff >= 0:
+                result_text += f"Ο {defender.name} έχει πάρει πολλές λαβωματιές και νικιέται!\n"
+                defender.wounds = 10  # Σημάδι νίκης
+                return result_text, True, attacker, total_wounds
+
+        # Αν δεν νικήθηκε, εμφάνισε κατάσταση
+        if defender.wounds < 10:
+            result_text += f"Κατάσταση {defender.name}: {defender.wounds} λαβωματιές\n"
+
+        return result_text, False, None, total_wounds
+
+    def battle_round_multiple(self, char1, char2_list, max_engaged, char1_no_crit=False, char2_no_crit=False):
+        """Εκτελεί έναν γύρο μάχης με πολλαπλούς αντιπάλους και σύστημα reserves"""
+        result = f"--- Γύρος Μάχης ---\n"
+
+        # Βρίσκουμε τους ζωντανούς εχθρούς
+        alive_enemies = [char2 for char2 in char2_list if char2.wounds != 10]
+
+        # Χωρίζουμε σε engaged και reserves
+        engaged_enemies = alive_enemies[:max_engaged]
+        reserves = alive_enemies[max_engaged:]
+
+        if reserves:
+            result += f"Μάχονται: {len(engaged_enemies)}, Reserves: {len(reserves)}\n"
+        else:
+            result += f"Μάχονται: {len(engaged_enemies)}\n"
+        result += "\n"
+
+        # Ζαριά μάχης του χαρακτήρα 1
+        battle1_dice, battle1_mod, battle1_total = self.roll_d20(char1.combat)
+        battle1_display = self.format_dice_roll("Μάχη", battle1_dice, battle1_mod, battle1_total)
+        result += f"{char1.name}: {battle1_display}\n"
+
+        # Ζαριές μάχης μόνο των engaged χαρακτήρων 2
+        char2_results = []
+        char1_wins = True
+
+        for char2 in engaged_enemies:
+            battle2_dice, battle2_mod, battle2_total = self.roll_d20(char2.combat)
+            battle2_display = self.format_dice_roll("Μάχη", battle2_dice, battle2_mod, battle2_total)
+            # Βρίσκουμε το index στο αρχικό list
+            original_index = char2_list.index(char2)
+            result += f"Χαρακτήρας 2.{original_index+1}: {battle2_display}\n"
+
+            char2_results.append((char2, original_index, battle2_total, battle2_mod, battle2_dice))
+
+            # Έλεγχος αν ο χαρακτήρας 1 νικάει αυτόν τον αντίπαλο
+            if battle1_total < battle2_total:
+                char1_wins = False
+            elif battle1_total == battle2_total and battle1_mod <= battle2_mod:
+                char1_wins = False
+
+        if char1_wins:
+            result += f"\n{char1.name} νικάει όλους τους engaged!\n"
+
+            # Ο χαρακτήρας 1 ρίχνει ζημιά σε όλους τους engaged (με πιθανό καίριο)
+            result += f"\n{char1.name} ρίχνει ζημιά σε όλους τους engaged...\n"
+
+            for (char2, original_index, _, _, _) in char2_results:
+                result += f"\nΣτον Χαρακτήρα 2.{original_index+1}:\n"
+
+                damage_result, battle_ended, final_winner, _ = self.apply_damage(
+                    char1, char2, battle1_dice, char2_no_crit, ""
+                )
+                result += damage_result
+
+                if battle_ended:
+                    # Έλεγχος αν όλοι οι χαρακτήρες 2 νικήθηκαν
+                    living_enemies = [c for c in char2_list if c.wounds != 10]
+                    if len(living_enemies) == 0:
+                        return result, True, char1
+
+        else:
+            result += f"\nΟι αντίπαλοι νικούν!\n"
+
+            # Όλοι οι engaged χαρακτήρες 2 ρίχνουν ζημιά (με πιθανά καίρια)
+            result += f"\nΌλοι οι engaged αντίπαλοι ρίχνουν ζημιά...\n"
+
+            for (char2, original_index, _, _, battle2_dice) in char2_results:
+                result += f"\nΧαρακτήρας 2.{original_index+1}:\n"
+
+                damage_result, battle_ended, final_winner, _ = self.apply_damage(
+                    char2, char1, battle2_dice, char1_no_crit, ""
+                )
+                result += damage_result
+
+                if battle_ended:
+                    return result, True, char2_list[0]  # Οποιοσδήποτε από τους νικητές
+
+            result += f"Κατάσταση {char1.name}: {char1.wounds} λαβωματιές\n\n"
+
+        return result, False, None
+
+    def battle_round(self, char1, char2, char1_no_crit=False, char2_no_crit=False):
+        """Εκτελεί έναν γύρο μάχης με το νέο σύστημα"""
+        result = f"--- Γύρος Μάχης ---\n"
+
+        # Ζαριές μάχης και των δύο
+        battle1_dice, battle1_mod, battle1_total = self.roll_d20(char1.combat)
+        battle2_dice, battle2_mod, battle2_total = self.roll_d20(char2.combat)
+
+        battle1_display = self.format_dice_roll("Μάχη", battle1_dice, battle1_mod, battle1_total)
+        battle2_display = self.format_dice_roll("Μάχη", battle2_dice, battle2_mod, battle2_total)
+
+        result += f"{char1.name}: {battle1_display}\n"
+        result += f"{char2.name}: {battle2_display}\n"
+
+        # Καθορισμός νικητή
+        winner = None
+        loser = None
+        winner_battle_dice = None
+        loser_no_crit = None
+
+        if battle1_total > battle2_total:
+            winner = char1
+            loser = char2
+            winner_battle_dice = battle1_dice
+            loser_no_crit = char2_no_crit
+            result += f"{char1.name} νικάει τον γύρο!\n"
+        elif battle2_total > battle1_total:
+            winner = char2
+            loser = char1
+            winner_battle_dice = battle2_dice
+            loser_no_crit = char1_no_crit
+            result += f"{char2.name} νικάει τον γύρο!\n"
+        else:
+            # Ισοβαθμία - νικάει όποιος έχει μεγαλύτερο συντελεστή
+            if battle1_mod > battle2_mod:
+                winner = char1
+                loser = char2
+                winner_battle_dice = battle1_dice
+                loser_no_crit = char2_no_crit
+                result += f"Ισοβαθμία! {char1.name} νικάει λόγω μεγαλύτερου συντελεστή ({battle1_mod} vs {battle2_mod})!\n"
+            elif battle2_mod > battle1_mod:
+                winner = char2
+                loser = char1
+                winner_battle_dice = battle2_dice
+                loser_no_crit = char1_no_crit
+                result += f"Ισοβαθμία! {char2.name} νικάει λόγω μεγαλύτερου συντελεστή ({battle2_mod} vs {battle1_mod})!\n"
+            else:
+                result += f"Πλήρης ισοβαθμία (ζάρι και συντελεστές)! Ξαναρίχνουμε...\n\n"
+                return result, False, None  # Ξαναρίχνουμε
+
+        # Ο νικητής ρίχνει ζημιά (με πιθανό καίριο χτύπημα)
+        result += f"\n{winner.name} ρίχνει ζημιά...\n"
+
+        damage_result, battle_ended, final_winner, _ = self.apply_damage(
+            winner, loser, winner_battle_dice, loser_no_crit, ""
+        )
+        result += damage_result
+
+        if battle_ended:
+            return result + "\n", True, final_winner
+        else:
+            return result + "\n", False, None
+
+    def damage_diff_silent(self, attacker, defender):
+        """Ζαριά ζημιάς εναντίον αντοχής χωρίς output - επιστρέφει τη διαφορά"""
+        _, _, damage_roll = self.roll_d20(attacker.damage)
+        _, _, endurance_roll = self.roll_d20(defender.toughness)
+        return damage_roll - endurance_roll
+
+    def apply_damage_silent(self, attacker, defender, attacker_battle_dice, defender_no_crit):
+        """Εφαρμόζει ζημιά χωρίς output. Επιστρέφει (battle_ended, winner)"""
+        is_critical = (attacker_battle_dice == 20 and not defender_no_crit)
+        num_damage_rolls = 2 if is_critical else 1
+        if is_critical:
+            attacker.crits += 1
+
+        for roll_num in range(num_damage_rolls):
+            damage_diff = self.damage_diff_silent(attacker, defender)
+            had_two_wounds = defender.wounds >= 2
+
+            # Τσιράκι: πεθαίνει με οποιαδήποτε επιτυχή ζημιά
+            if defender.is_minion and damage_diff >= 0:
+                defender.wounds = 10
+                return True, attacker
+            elif damage_diff >= 10:
+                defender.wounds = 10
+                return True, attacker
+            elif damage_diff >= 5:
+                defender.wounds += 2
+            elif damage_diff >= 0:
+                defender.wounds += 1
+
+            # Έλεγχος αν ο defender είχε >=2 λαβωματιές και μόλις λαβώθηκε ξανά
+            if not defender.is_minion and had_two_wounds and damage_diff >= 0:
+                defender.wounds = 10
+                return True, attacker
+
+        return False, None
+
+    def battle_round_silent(self, char1, char2, char1_no_crit, char2_no_crit):
+        """Εκτελεί έναν γύρο μάχης χωρίς output"""
+        winner, loser, winner_battle_dice = self.contest_silent(char1, char2)
+        if winner is None:
+            return False, None  # Ξαναρίχνουμε
+
+        loser_no_crit = char2_no_crit if winner is char1 else char1_no_crit
+
+        # Ζημιά με πιθανό καίριο
+        return self.apply_damage_silent(winner, loser, winner_battle_dice, loser_no_crit)
+
+    def contest_silent(self, char1, char2):
+        """Ζαριές μάχης χωρίς output - επιστρέφει (νικητής, ηττημένος, ζάρι νικητή), None σε πλήρη ισοβαθμία"""
+        battle1_dice, _, battle1_total = self.roll_d20(char1.combat)
+        battle2_dice, _, battle2_total = self.roll_d20(char2.combat)
+
+        if battle1_total > battle2_total:
+            return char1, char2, battle1_dice
+        elif battle2_total > battle1_total:
+            return char2, char1, battle2_dice
+
+        # Ισοβαθμία - ελέγχουμε συντελεστές
+        char1_mod = char1.combat
+        char2_mod = char2.combat
+        if char1_mod > char2_mod:
+            return char1, char2, battle1_dice
+        elif char2_mod > char1_mod:
+            return char2, char1, battle2_dice
+        return None, None, None
+
+    def battle_round_silent_multiple(self, char1, enemies, char1_no_crit, char2_no_crit):
+        """Εκτελεί έναν γύρο μάχης με πολλαπλούς αντιπάλους χωρίς output (με reserves) - enemies: AliveSet"""
+        # Οι engaged από τους ζωντανούς εχθρούς (οι υπόλοιποι είναι reserves)
+        engaged_enemies = enemies.refresh()
+
+        # Ζαριά μάχης του χαρακτήρα 1
+        battle1_dice, _, battle1_total = self.roll_d20(char1.combat)
+        battle1_mod = char1.combat
+
+        # Ζαριές μάχης μόνο των engaged χαρακτήρων 2
+        char2_results = []
+        char1_wins = True
+
+        for char2 in engaged_enemies:
+            battle2_dice, _, battle2_total = self.roll_d20(char2.combat)
+            battle2_mod = char2.combat
+
+            char2_results.append((char2, battle2_total, battle2_mod, battle2_dice))
+
+            # Έλεγχος αν ο χαρακτήρας 1 νικάει αυτόν τον αντίπαλο
+            if battle1_total < battle2_total:
+                char1_wins = False
+            elif battle1_total == battle2_total and battle1_mod <= battle2_mod:
+                char1_wins = False
+
+        if char1_wins:
+            # Ο χαρακτήρας 1 ρίχνει ζημιά σε όλους (με πιθανό καίριο)
+            for char2, _, _, _ in char2_results:
+                battle_ended, winner = self.apply_damage_silent(char1, char2, battle1_dice, char2_no_crit)
+                if battle_ended:
+                    # Έλεγχος αν όλοι οι χαρακτήρες 2 νικήθηκαν
+                    if not enemies.refresh():
+                        return True, char1
+
+        else:
+            # Όλοι οι engaged χαρακτήρες 2 ρίχνουν ζημιά (με πιθανά καίρια)
+            for char2, _, _, battle2_dice in char2_results:
+                battle_ended, winner = self.apply_damage_silent(char2, char1, battle2_dice, char1_no_crit)
+                if battle_ended:
+                    return True, char2  # Οποιοσδήποτε από τους νικητές
+
+        return False, None
+
+    def simulate_battle_silent(self, char1_stats, char2_stats, char2_number=1, char2_engaged=1, char2_minion=False, char1_no_crit=False, char2_no_crit=False):
+        """Προσομοιώνει μια μάχη χωρίς output"""
+        char1 = Character("Χαρακτήρας 1", char1_stats)
+
+        # Δημιουργία πολλαπλών χαρακτήρων 2
+        char2_list = []
+        for i in range(char2_number):
+            char2 = Character(f"Χαρακτήρας 2.{i+1}", char2_stats, char2_minion)
+            char2_list.append(char2)
+        self.combatants = (char1, char2_list)
+
+        if char2_number > 1:
+            enemies = self.alive_set(char2_list, char2_engaged, lambda char2: char2.wounds != 10)
+
+        round_count = 0
+        while round_count < 100:  # Safety limit
+            round_count += 1
+
+            if char2_number == 1:
+                battle_ended, winner = self.battle_round_silent(char1, char2_list[0], char1_no_crit, char2_no_crit)
+            else:
+                battle_ended, winner = self.battle_round_silent_multiple(char1, enemies, char1_no_crit, char2_no_crit)
+
+            if battle_ended:
+                if winner == char1 or (hasattr(winner, 'name') and winner.name == "Χαρακτήρας 1"):
+                    return 1, round_count
+                else:
+                    return 2, round_count
+
+        return 0, round_count  # Draw
+
+    def end_state(self, winner):
+        """Οι λαβωματιές του νικητή της τελευταίας μάχης χωρίς output (None σε ισοπαλία)
+
+        Όταν νικάνε οι αντίπαλοι, του λιγότερο λαβωμένου ζωντανού αντιπάλου.
+        """
+        char1, char2_list = self.combatants
+        if winner == 1:
+            return char1.wounds
+        if winner == 2:
+            return min(char2.wounds for char2 in char2_list if char2.wounds != 10)
+        return None
+
+    def single_battle(self, char1_stats, char2_stats, char2_number=1, char2_engaged=1, char2_minion=False, char1_no_crit=False, char2_no_crit=False):
+        """Εκτελεί μια αναλυτική μάχη - επιστρέφει το κείμενο της μάχης"""
+        # Δημιουργία χαρακτήρων
+        char1 = Character("Χαρακτήρας 1", char1_stats)
+
+        # Δημιουργία πολλαπλών χαρακτήρων 2
+        char2_list = []
+        for i in range(char2_number):
+            char2 = Character(f"Χαρακτήρας 2.{i+1}", char2_stats, char2_minion)
+            char2_list.append(char2)
+
+        if char2_number == 1:
+            result = "=== ΜΑΧΗ ΧΑΡΑΚΤΗΡΩΝ - ΕΝΑΛΛΑΚΤΙΚΟ ΣΥΣΤΗΜΑ ===\n\n"
+        else:
+            result = f"=== ΜΑΧΗ ΧΑΡΑΚΤΗΡΩΝ - ΕΝΑΛΛΑΚΤΙΚΟ ΣΥΣΤΗΜΑ ===\n"
+            result += f"Χαρακτήρας 1 εναντίον {char2_number} αντιπάλων (max {char2_engaged} engaged)!\n\n"
+
+        round_count = 0
+        while round_count < 50:  # Safety limit
+            round_count += 1
+            result += f"Γύρος {round_count}:\n"
+
+            if char2_number == 1:
+                round_result, battle_ended, winner = self.battle_round(char1, char2_list[0], char1_no_crit, char2_no_crit)
+            else:
+                round_result, battle_ended, winner = self.battle_round_multiple(char1, char2_list, char2_engaged, char1_no_crit, char2_no_crit)
+
+            result += round_result
+
+            if battle_ended:
+                if char2_number == 1:
+                    result += f"\n🏆 ΝΙΚΗΤΗΣ: {winner.name}! 🏆\n"
+                else:
+                    if winner == char1:
+                        result += f"\n🏆 ΝΙΚΗΤΗΣ: {winner.name}! 🏆\n"
+                    else:
+                        result += f"\n🏆 ΝΙΚΗΤΕΣ: Οι αντίπαλοι! 🏆\n"
+                result += f"Συνολικοί γύροι μάχης: {round_count}\n"
+                break
+
+        if round_count >= 50:
+            result += "\nΗ μάχη διαρκεί πολύ! Ισοπαλία.\n"
+            result += f"Συνολικοί γύροι μάχης: {round_count}\n"
+
+        return result
+
+
+class TableBattleEngine(BattleEngine):
+    """Ίδιοι κανόνες, αλλά οι μάχες χωρίς output διαλέγουν το αποτέλεσμα κάθε
+    ζαριάς από τους πίνακες πιθανοτήτων με μία ζαριά αντί για δύο d20"""
+
+    def contest_silent(self, char1, char2):
+        winner, natural_20 = tables.sample_contest(self.rng, char1.combat, char2.combat)
+        battle_dice = 20 if natural_20 else 0  # Για το καίριο μετράει μόνο αν ήταν φυσικό 20
+        if winner == 1:
+            return char1, char2, battle_dice
+        elif winner == 2:
+            return char2, char1, battle_dice
+        return None, None, None
+
+    def damage_diff_silent(self, attacker, defender):
+        bands = tables.damage_bands(defender.toughness - attacker.damage)
+        return tables.sample_band(self.rng, bands)
+
+def simulate(config, n, seed=None, rng=None, stats=None, engine_class=None):
+    """Εκτελεί n μάχες χωρίς output - config: τα ορίσματα της simulate_battle_silent
+
+    rng: έτοιμη γεννήτρια αντί για την rng.make_rng(seed)
+    stats: BattleStats που συμπληρώνεται, π.χ. aggregate.BattleAggregate (με την κατάσταση
+    του νικητή, BattleEngine.end_state) ή export.BattleRecorder (μία γραμμή ανά μάχη)
+    engine_class: άλλη κλάση μηχανής, π.χ. instrument.instrumented_class (προεπιλογή TableBattleEngine)
+    """
+    engine = (engine_class or TableBattleEngine)(rng if rng is not None else make_rng(seed))
+    return run_battles(engine.simulate_battle_silent, config, n, stats, engine)
@@ -0,0 +1,113 @@
+"""Ακριβής υπολογισμός μάχης 1v1 των εναλλακτικών συστημάτων (αλυσίδα Markov).
+
+Στα alternative, alternative_new και singleroll ο γύρος 1v1 δεν έχει μνήμη:
+μία αντιπαράθεση Μάχης (ξαναρίχνουμε σε πλήρη ισοβαθμία - ο γύρος μετράει)
+και ο νικητής της ρίχνει Ζημιά εναντίον Αντοχής (στο alternative δύο φορές
+με φυσικό 20, εκτός αν ο ηττημένος έχει "Χωρίς καίρια"). Τα στατιστικά δεν
+αλλάζουν με τις λαβωματιές, οπότε η κατάσταση είναι μόνο οι λαβωματιές των
+δύο χαρακτήρων (0, 1 ή 2 και πάνω) και η κατανομή προχωράει γύρο-γύρο μέχρι
+το όριο των 100 γύρων της simulate_battle_silent.
+"""
+
+from . import get_rule_system
+from .common import ExactResult, full_config
+from .tables import contest_table, damage_bands
+
+MAX_ROUNDS = 100  # Ίδιο safety limit με την simulate_battle_silent
+DEAD = -1  # Κατάσταση λαβωματιών: νεκρός
+
+# Συστήματα με αυτόν τον γύρο 1v1 -> αν το φυσικό 20 δίνει καίριο (διπλή ζαριά ζημιάς)
+SYSTEMS = {
+    "alternative": True,
+    "alternative_new": False,
+    "singleroll": False,
+}
+
+
+def _damage(wounds, is_minion, bands):
+    """Μία ζαριά ζημιάς - επιστρέφει [(νέες λαβωματιές ή DEAD, πιθανότητα)]"""
+    p_diff10, p_diff5, p_diff0 = bands
+    if is_minion or wounds >= 2:
+        # Τσιράκι ή είχε ήδη >=2 λαβωματιές: πεθαίνει με οποιαδήποτε ζημιά
+        return [(DEAD, p_diff0), (wounds, 1.0 - p_diff0)]
+    return [
+        (DEAD, p_diff10),
+        (min(wounds + 2, 2), p_diff5 - p_diff10),
+        (min(wounds + 1, 2), p_diff0 - p_diff5),
+        (wounds, 1.0 - p_diff0),
+    ]
+
+
+def _critical_damage(wounds, is_minion, bands):
+    """Δύο ζαριές ζημιάς (καίριο) - η δεύτερη μόνο αν ο αμυνόμενος επέζησε της πρώτης"""
+    outcomes = {}
+    for first, p_first in _damage(wounds, is_minion, bands):
+        if first == DEAD:
+            outcomes[DEAD] = outcomes.get(DEAD, 0.0) + p_first
+            continue
+        for second, p_second in _damage(first, is_minion, bands):
+            outcomes[second] = outcomes.get(second, 0.0) + p_first * p_second
+    return list(outcomes.items())
+
+
+def _attack_outcomes(p_plain, p_critical, wounds, is_minion, bands):
+    """Τα αποτελέσματα της ζημιάς του νικητή της αντιπαράθεσης - {λαβωματιές ή DEAD: πιθανότητα}"""
+    outcomes = {}
+    for damage, p_win in ((_damage, p_plain), (_critical_damage, p_critical)):
+        if p_win <= 0:
+            continue
+        for new_wounds, p in damage(wounds, is_minion, bands):
+            outcomes[new_wounds] = outcomes.get(new_wounds, 0.0) + p_win * p
+    return outcomes
+
+
+def _transitions(config, criticals, wounds1, wounds2):
+    """Ένας γύρος από την κατάσταση (λαβωματιές 1, λαβωματιές 2) - επιστρέφει [(κατάσταση ή νικητής, πιθανότητα)]"""
+    stats1, stats2 = config["char1_stats"], config["char2_stats"]
+    table = contest_table(stats1["Μάχη"], stats2["Μάχη"])
+    p1_critical, p2_critical = table[0], table[2] - table[1]
+    p1_plain, p2_plain = table[1] - table[0], table[3] - table[2]
+    if not criticals or config.get("char2_no_crit"):
+        p1_plain, p1_critical = p1_plain + p1_critical, 0.0
+    if not criticals or config.get("char1_no_crit"):
+        p2_plain, p2_critical = p2_plain + p2_critical, 0.0
+
+    result = [((wounds1, wounds2), 1.0 - table[3])]  # Πλήρης ισοβαθμία: κανείς δεν λαβώνεται
+    bands = damage_bands(stats2["Αντοχή"] - stats1["Ζημιά"])
+    for new_wounds, p in _attack_outcomes(p1_plain, p1_critical, wounds2, config["char2_minion"], bands).items():
+        result.append((1 if new_wounds == DEAD else (wounds1, new_wounds), p))
+    bands = damage_bands(stats1["Αντοχή"] - stats2["Ζημιά"])
+    for new_wounds, p in _attack_outcomes(p2_plain, p2_critical, wounds1, False, bands).items():
+        result.append((2 if new_wounds == DEAD else (new_wounds, wounds2), p))
+    return result
+
+
+def solve(config, system="alternative"):
+    """Ακριβείς πιθανότητες νίκης/ισοπαλίας και κατανομή γύρων μιας μάχης 1v1 - επιστρέφει ExactResult"""
+    if system not in SYSTEMS:
+        raise ValueError(f"Ο ακριβής υπολογισμός δεν υποστηρίζει το σύστημα: {system}")
+    config = full_config(get_rule_system(system).BattleEngine, config)
+    if config["char2_number"] != 1:
+        raise ValueError("Ο ακριβής υπολογισμός υποστηρίζει μόνο μάχες 1v1")
+
+    result = ExactResult()
+    cache = {}
+    distribution = {(0, 0): 1.0}
+    for round_number in range(1, MAX_ROUNDS + 1):
+        next_distribution = {}
+        for state, probability in distribution.items():
+            if state not in cache:
+                cache[state] = _transitions(config, SYSTEMS[system], *state)
+            for next_state, p in cache[state]:
+                if p <= 0:
+                    continue
+                if next_state in (1, 2):
+                    result.add(next_state, round_number, probability * p)
+                else:
+                    next_distribution[next_state] = next_distribution.get(next_state, 0.0) + probability * p
+        distribution = next_distribution
+
+    remaining = sum(distribution.values())
+    if remaining > 0:
+        result.add(0, MAX_ROUNDS, remaining)  # Ισοπαλία στο όριο γύρων
+    return result
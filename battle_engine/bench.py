@@ -0,0 +1,223 @@
+"""Μετρήσεις ταχύτητας των μηχανών σε σταθερά σενάρια, με αποθηκευμένα baselines.
+
+    python -m battle_engine.bench                          # Όλα τα συστήματα και σενάρια
+    python -m battle_engine.bench --save bench.json        # Αποθήκευση ως baseline
+    python -m battle_engine.bench --baseline bench.json    # Σύγκριση - exit code 1 αν κάτι χειροτέρεψε
+
+Κάθε σύστημα τρέχει τα ίδια σενάρια: 1v1 ισόπαλο, 1v1 άνισο, 1 vs 10 με 3
+engaged και 1 vs 100 (ορδή αδύναμων αντιπάλων, 3 engaged). Το Kryptes έχει και
+κλασματικές επιθέσεις με ασπίδες και στις δύο πλευρές, το AD&D 5/2 επιθέσεις
+και στις δύο πλευρές. Για κάθε σενάριο μετριούνται μάχες/δευτερόλεπτο (ο
+καλύτερος από repeat χρόνους), ns ανά επίθεση και η μέγιστη μνήμη μιας
+εκτέλεσης (tracemalloc, σε ξεχωριστή εκτέλεση γιατί επιβραδύνει).
+
+Επίθεση είναι μία κλήση της instrument.ATTACK_METHODS του συστήματος: attack_turn_silent
+στο κλασικό, attack_silent στο Kryptes/AD&D και damage_diff_silent (ζαριά
+ζημιάς του νικητή μιας αντιπαράθεσης) στα εναλλακτικά. Οι επιθέσεις
+μετριούνται σε μια τρίτη εκτέλεση με το ίδιο seed, άρα είναι ακριβώς αυτές
+των μετρημένων μαχών.
+
+Τα baselines έχουν νόημα μόνο στον ίδιο υπολογιστή: γράφεται και η πλατφόρμα,
+για να φαίνεται αν η σύγκριση έγινε αλλού.
+"""
+
+import argparse
+import json
+import platform
+import sys
+import time
+import tracemalloc
+
+from . import ENGINE_VERSION, RULE_SYSTEMS, get_rule_system, instrument
+from .dice import BENCHMARK_STATS
+from .rng import DEFAULT_GENERATOR, GENERATORS, make_rng
+
+TOLERANCE = 0.15  # Επιτρεπτή χειροτέρευση πριν θεωρηθεί regression
+MEMORY_BATTLES = 200  # Μάχες της εκτέλεσης με tracemalloc
+
+# Οι αδύναμοι αντίπαλοι του 1v1 άνισου και της ορδής
+WEAK_STATS = {
+    "classic": {"Πρωτοβουλία": 0, "Επίθεση": 0, "Ζημιά": 1, "Άμυνα": 0, "Αντοχή": 0},
+    "kryptes": {"Πόντοι αντοχής": "1d6", "Ζαριά μάχης": 4, "Ζαριά ζημιάς": "1D6-1", "Θωράκιση": 0,
+                "Ασπίδες/γύρο": 0, "Αριθμός επιθέσεων": "1"},
+    "adnd": {"Initiative": 0, "Hit points": "1d8", "AC": 8, "THAC0": 20, "Attack bonus": 0,
+             "Damage die": "1d4", "Number of attacks": "1"},
+    "alternative": {"Μάχη": 0, "Ζημιά": 1, "Αντοχή": 0},
+    "alternative_new": {"Μάχη": 0, "Ζημιά": 1, "Αντοχή": 0},
+    "singleroll": {"Μάχη": 0, "Ζημιά": 1, "Αντοχή": 0},
+}
+
+
+def scenarios(systems=None, scale=1.0):
+    """Τα σενάρια - [(σύστημα, όνομα, config, μάχες), ...]"""
+    result = []
+    for system in systems or RULE_SYSTEMS:
+        strong, average = BENCHMARK_STATS[system]
+        weak = WEAK_STATS[system]
+        cases = [
+            ("1v1-even", {"char1_stats": strong, "char2_stats": strong}, 5000),
+            ("1v1-lopsided", {"char1_stats": strong, "char2_stats": weak}, 5000),
+            ("1v10-3engaged", {"char1_stats": strong, "char2_stats": average, "char2_number": 10,
+                               "char2_engaged": 3}, 1000),
+            ("1v100-horde", {"char1_stats": strong, "char2_stats": weak, "char2_number": 100,
+                             "char2_engaged": 3}, 200),
+        ]
+        if system == "kryptes":
+            shielded = dict(average, **{"Ασπίδες/γύρο": 1, "Αριθμός επιθέσεων": "3/2"})
+            cases.append(("fractional-shields", {"char1_stats": strong, "char2_stats": shielded}, 5000))
+        if system == "adnd":
+            fast = dict(average, **{"Number of attacks": "5/2"})
+            cases.append(("2.5-attacks", {"char1_stats": strong, "char2_stats": fast}, 5000))
+        for name, config, battles in cases:
+            result.append((system, name, config, max(1, int(battles * scale))))
+    return result
+
+
+def count_attacks(system, config, n, seed=1, generator=None):
+    """Οι επιθέσεις (κλήσεις της ATTACK_METHODS) σε n μάχες με αυτό το seed"""
+    _, profile = instrument.simulate(system, config, n, seed, generator)
+    return profile.counters.get("attacks", 0)
+
+
+def peak_memory(system, config, n, seed=1, generator=None):
+    """Η μέγιστη μνήμη (bytes) που δεσμεύει μια εκτέλεση n μαχών"""
+    module = get_rule_system(system)
+    tracemalloc.start()
+    try:
+        module.simulate(config, n, rng=make_rng(seed, generator=generator or DEFAULT_GENERATOR))
+        return tracemalloc.get_traced_memory()[1]
+    finally:
+        tracemalloc.stop()
+
+
+def run_scenario(system, config, n, seed=1, repeat=3, generator=None):
+    """Μετρήσεις ενός σεναρίου - dict για το JSON"""
+    module = get_rule_system(system)
+    seconds = float("inf")
+    for _ in range(repeat):
+        rng = make_rng(seed, generator=generator or DEFAULT_GENERATOR)
+        start = time.perf_counter()
+        module.simulate(config, n, rng=rng)
+        seconds = min(seconds, time.perf_counter() - start)
+    attacks = count_attacks(system, config, n, seed, generator)
+    return {
+        "battles": n,
+        "seconds": seconds,
+        "battles_per_sec": n / seconds,
+        "attacks": attacks,
+        "ns_per_attack": seconds * 1e9 / attacks if attacks else None,
+        "peak_memory": peak_memory(system, config, min(n, MEMORY_BATTLES), seed, generator),
+    }
+
+
+def benchmark(systems=None, scale=1.0, seed=1, repeat=3, generator=None):
+    """Όλα τα σενάρια - επιστρέφει {"σύστημα/σενάριο": μετρήσεις}"""
+    results = {}
+    for system, name, config, n in scenarios(systems, scale):
+        results[f"{system}/{name}"] = run_scenario(system, config, n, seed, repeat, generator)
+    return results
+
+
+def make_baseline(results, generator=None):
+    """Τα αποτελέσματα μαζί με ό,τι χρειάζεται για να κριθεί αν η σύγκριση έχει νόημα"""
+    return {
+        "engine_version": ENGINE_VERSION,
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "processor": platform.processor() or platform.machine(),
+        "generator": generator or DEFAULT_GENERATOR,
+        "results": results,
+    }
+
+
+def compare(results, baseline, tolerance=TOLERANCE):
+    """Τα σενάρια που χειροτέρεψαν πάνω από tolerance - [(σενάριο, μέτρηση, παλιά τιμή, νέα τιμή), ...]
+
+    Μάχες/δευτερόλεπτο που έπεσαν, ns ανά επίθεση ή μνήμη που ανέβηκαν. Αν
+    άλλαξε ο αριθμός των επιθέσεων, άλλαξαν οι κανόνες ή το σενάριο: αναφέρεται
+    κι αυτό, για να μη συγκρίνονται διαφορετικές μάχες.
+    """
+    regressions = []
+    for key, new in results.items():
+        old = baseline["results"].get(key)
+        if old is None:
+            continue
+        if old["battles"] == new["battles"] and old["attacks"] != new["attacks"]:
+            regressions.append((key, "attacks", old["attacks"], new["attacks"]))
+        if new["battles_per_sec"] < old["battles_per_sec"] * (1 - tolerance):
+            regressions.append((key, "battles_per_sec", old["battles_per_sec"], new["battles_per_sec"]))
+        for metric in ("ns_per_attack", "peak_memory"):
+            if old[metric] and new[metric] and new[metric] > old[metric] * (1 + tolerance):
+                regressions.append((key, metric, old[metric], new[metric]))
+    return regressions
+
+
+def format_results(results, baseline=None):
+    lines = [f"{'Σενάριο':<34}{'μάχες/s':>12}{'ns/επίθεση':>12}{'μνήμη KiB':>11}{'αλλαγή':>9}"]
+    for key, result in results.items():
+        ns = f"{result['ns_per_attack']:.0f}" if result["ns_per_attack"] else "-"
+        line = f"{key:<34}{result['battles_per_sec']:>12.0f}{ns:>12}{result['peak_memory'] / 1024:>11.0f}"
+        old = baseline["results"].get(key) if baseline else None
+        if old:
+            line += f"{(result['battles_per_sec'] / old['battles_per_sec'] - 1) * 100:>+8.1f}%"
+        lines.append(line)
+    return "\n".join(lines)
+
+
+def format_regressions(regressions):
+    if not regressions:
+        return "Καμία χειροτέρευση."
+    lines = ["Χειροτέρευση:"]
+    for key, metric, old, new in regressions:
+        lines.append(f"  {key}: {metric} {old:.6g} -> {new:.6g}")
+    return "\n".join(lines)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(prog="python -m battle_engine.bench",
+                                     description="Μετράει την ταχύτητα των μηχανών σε σταθερά σενάρια.")
+    parser.add_argument("systems", nargs="*", metavar="ΣΥΣΤΗΜΑ",
+                        help=f"συστήματα (προεπιλογή: όλα - {', '.join(RULE_SYSTEMS)})")
+    parser.add_argument("--scale", type=float, default=1.0, help="πολλαπλασιαστής των μαχών κάθε σεναρίου")
+    parser.add_argument("--repeat", type=int, default=3, help="επαναλήψεις ανά σενάριο (κρατιέται ο καλύτερος χρόνος)")
+    parser.add_argument("--seed", type=int, default=1)
+    parser.add_argument("--generator", choices=list(GENERATORS), help="γεννήτρια τυχαίων αριθμών (προεπιλογή: dice)")
+    parser.add_argument("--save", metavar="ΑΡΧΕΙΟ", help="αποθήκευση των αποτελεσμάτων ως baseline (JSON)")
+    parser.add_argument("--baseline", metavar="ΑΡΧΕΙΟ", help="σύγκριση με baseline - exit code 1 αν κάτι χειροτέρεψε")
+    parser.add_argument("--tolerance", type=float, default=TOLERANCE, help="επιτρεπτή χειροτέρευση (προεπιλογή 0.15)")
+    parser.add_argument("--format", choices=["text", "json"], default="text", help="μορφή εξόδου")
+    args = parser.parse_args(argv)
+    unknown = [system for system in args.systems if system not in RULE_SYSTEMS]
+    if unknown:
+        parser.error(f"άγνωστα συστήματα: {', '.join(unknown)}")
+
+    baseline = None
+    if args.baseline:
+        with open(args.baseline, encoding="utf-8") as f:
+            baseline = json.load(f)
+    results = benchmark(args.systems, args.scale, args.seed, args.repeat, args.generator)
+    regressions = compare(results, baseline, args.tolerance) if baseline else []
+
+    if args.save:
+        with open(args.save, "w", encoding="utf-8") as f:
+            json.dump(make_baseline(results, args.generator), f, ensure_ascii=False, indent=2)
+    if args.format == "json":
+        output = make_baseline(results, args.generator)
+        if baseline:
+            output["regressions"] = [
+                {"scenario": key, "metric": metric, "baseline": old, "value": new}
+                for key, metric, old, new in regressions
+            ]
+        json.dump(output, sys.stdout, ensure_ascii=False, indent=2)
+        print()
+    else:
+        print(format_results(results, baseline))
+        if baseline:
+            if baseline.get("platform") != platform.platform():
+                print(f"\nΠροσοχή: το baseline μετρήθηκε σε άλλο σύστημα ({baseline.get('platform')}).")
+            print("\n" + format_regressions(regressions))
+    return 1 if regressions else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
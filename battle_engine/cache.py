@@ -0,0 +1,141 @@
+"""Αποθήκευση αποτελεσμάτων μαζικών μαχών σε SQLite, ώστε τα ίδια configs να
+μην ξανατρέχουν από την αρχή σε κάθε συνεδρία.
+
+Το κλειδί είναι hash του συστήματος κανόνων, του πλήρους config (στατιστικά,
+επιλογές, αριθμός αντιπάλων) και της ENGINE_VERSION. Κάθε εγγραφή κρατάει τα
+συγκεντρωτικά αποτελέσματα (BattleStats): όταν ζητηθούν περισσότερες μάχες από
+όσες υπάρχουν, τρέχουν μόνο οι επιπλέον και προστίθενται στην εγγραφή. Όταν
+ζητηθούν λιγότερες, επιστρέφονται όλες οι αποθηκευμένες (τα συγκεντρωτικά δεν
+χωρίζονται): η format_cached το γράφει δίπλα στα αποτελέσματα. Όταν οι
+εγγραφές ξεπεράσουν το max_entries, σβήνονται όσες χρησιμοποιήθηκαν παλαιότερα.
+"""
+
+import hashlib
+import json
+import os
+import sqlite3
+import time
+from contextlib import contextmanager
+
+from . import ENGINE_VERSION, get_rule_system
+from .common import BattleStats, full_config
+from .parallel import BattleRun, chunk_seed
+
+MAX_ENTRIES = 10000
+
+
+def default_path():
+    """Το αρχείο της cache - ANDRAGATHIMA_CACHE ή ~/.andragathima/results.sqlite"""
+    path = os.environ.get("ANDRAGATHIMA_CACHE")
+    if path:
+        return path
+    return os.path.join(os.path.expanduser("~"), ".andragathima", "results.sqlite")
+
+
+def cache_key(system, config):
+    """Hash του συστήματος, του πλήρους config και της έκδοσης των κανόνων"""
+    config = full_config(get_rule_system(system).BattleEngine, config)
+    text = json.dumps([system, config, ENGINE_VERSION], sort_keys=True, ensure_ascii=False)
+    return hashlib.sha256(text.encode()).hexdigest()
+
+
+def format_cached(stats, n):
+    """Σημείωση όταν η cache έδωσε περισσότερες μάχες από τις n που ζητήθηκαν ("" αλλιώς)"""
+    if stats.battles <= n:
+        return ""
+    return f"(Από την cache: {stats.battles} μάχες αντί για {n} - όσες έχουν αποθηκευτεί για αυτή την αναμέτρηση)\n"
+
+
+class ResultCache:
+    """Cache αποτελεσμάτων σε ένα αρχείο SQLite (νέα σύνδεση σε κάθε κλήση, ώστε να δουλεύει από threads)"""
+
+    def __init__(self, path=None, max_entries=MAX_ENTRIES):
+        self.path = path or default_path()
+        self.max_entries = max_entries
+        os.makedirs(os.path.dirname(os.path.abspath(self.path)), exist_ok=True)
+        with self._connect() as db:
+            db.execute(
+                "CREATE TABLE IF NOT EXISTS results ("
+                " key TEXT PRIMARY KEY, system TEXT, config TEXT, engine_version TEXT,"
+                " battles INTEGER, char1_wins INTEGER, char2_wins INTEGER, draws INTEGER,"
+                " total_rounds INTEGER, min_rounds INTEGER, max_rounds INTEGER, last_used REAL)"
+            )
+            db.execute("CREATE INDEX IF NOT EXISTS results_last_used ON results (last_used)")
+
+    @contextmanager
+    def _connect(self):
+        db = sqlite3.connect(self.path, timeout=30)
+        try:
+            with db:  # commit ή rollback
+                yield db
+        finally:
+            db.close()
+
+    def get(self, system, config):
+        """Τα αποθηκευμένα αποτελέσματα ενός config (κενό BattleStats αν δεν υπάρχουν)"""
+        key = cache_key(system, config)
+        stats = BattleStats()
+        with self._connect() as db:
+            row = db.execute(
+                "SELECT battles, char1_wins, char2_wins, draws, total_rounds, min_rounds, max_rounds"
+                " FROM results WHERE key = ?", (key,)
+            ).fetchone()
+            if row is None:
+                return stats
+            db.execute("UPDATE results SET last_used = ? WHERE key = ?", (time.time(), key))
+        (stats.battles, stats.char1_wins, stats.char2_wins, stats.draws,
+         stats.total_rounds, stats.min_rounds, stats.max_rounds) = row
+        return stats
+
+    def add(self, system, config, stats):
+        """Προσθέτει νέες μάχες στην εγγραφή ενός config - επιστρέφει τα συνολικά αποτελέσματα"""
+        if stats.battles == 0:
+            return self.get(system, config)
+        key = cache_key(system, config)
+        with self._connect() as db:
+            db.execute("BEGIN IMMEDIATE")  # Δύο διεργασίες δεν πρέπει να χάσουν η μία τις μάχες της άλλης
+            row = db.execute(
+                "SELECT battles, char1_wins, char2_wins, draws, total_rounds, min_rounds, max_rounds"
+                " FROM results WHERE key = ?", (key,)
+            ).fetchone()
+            total = BattleStats()
+            if row is not None:
+                (total.battles, total.char1_wins, total.char2_wins, total.draws,
+                 total.total_rounds, total.min_rounds, total.max_rounds) = row
+            total.merge(stats)
+            db.execute(
+                "INSERT OR REPLACE INTO results VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)",
+                (key, system, json.dumps(config, sort_keys=True, ensure_ascii=False), ENGINE_VERSION,
+                 total.battles, total.char1_wins, total.char2_wins, total.draws,
+                 total.total_rounds, total.min_rounds, total.max_rounds, time.time()),
+            )
+            self._evict(db)
+        return total
+
+    def _evict(self, db):
+        """Σβήνει τις εγγραφές που χρησιμοποιήθηκαν παλαιότερα, πάνω από το max_entries"""
+        count = db.execute("SELECT COUNT(*) FROM results").fetchone()[0]
+        if count > self.max_entries:
+            db.execute(
+                "DELETE FROM results WHERE key IN (SELECT key FROM results ORDER BY last_used LIMIT ?)",
+                (count - self.max_entries,),
+            )
+
+    def seed(self, system, config, battles):
+        """Seed για τις επόμενες μάχες ενός config, όταν έχουν ήδη αποθηκευτεί battles μάχες"""
+        return chunk_seed(cache_key(system, config), battles)
+
+    def simulate(self, system, config, n, workers=None):
+        """Τουλάχιστον n μάχες ενός config: τρέχει μόνο όσες λείπουν από την cache - επιστρέφει BattleStats
+
+        Αν η cache έχει ήδη περισσότερες από n, επιστρέφονται όλες (βλ. format_cached).
+        """
+        return BattleRun(system, config, n, workers, cache=self).run()
+
+    def clear(self):
+        with self._connect() as db:
+            db.execute("DELETE FROM results")
+
+    def __len__(self):
+        with self._connect() as db:
+            return db.execute("SELECT COUNT(*) FROM results").fetchone()[0]
@@ -0,0 +1,711 @@
+from . import tables
+from .alive import AliveSet
+from .common import run_battles
+from .rng import make_rng
+
+STATS = ["Πρωτοβουλία", "Επίθεση", "Ζημιά", "Άμυνα", "Αντοχή"]
+
+# Τα πεδία του Character στο τέλος κάθε μάχης, για το export (μία στήλη ανά χαρακτήρα)
+RECORD_FIELDS = ("wounds", "fatigue", "stuns")
+
+# Το πεδίο του Character με την τελική τιμή κάθε στατιστικού (με τα penalties)
+EFFECTIVE_FIELDS = {
+    "Πρωτοβουλία": "initiative",
+    "Επίθεση": "effective_attack",
+    "Ζημιά": "effective_damage",
+    "Άμυνα": "effective_defense",
+    "Αντοχή": "effective_toughness",
+}
+
+STUN_TURNS = 2  # Σειρές που χάνει όποιος λαβώνεται χωρίς υπερπροσπάθεια
+STUN_DEFENSE = -2  # Η Άμυνά του όσο χάνει σειρές (αγνοώντας τον συντελεστή)
+
+
+def fatigue_penalty(fatigue, indomitable):
+    """Η ποινή σε Επίθεση και Ζημιά από την κόπωση - ο Ακατάβλητος δεν παίρνει ποινή για 1 κόπωση"""
+    return 0 if indomitable and fatigue == 1 else fatigue
+
+
+def effective_stats(stats, wounds, fatigue, indomitable, defense_penalty, outnumbered_penalty=0):
+    """Τα τελικά (Επίθεση, Ζημιά, Άμυνα, Αντοχή) με τα penalties
+
+    stats: (Επίθεση, Ζημιά, Άμυνα, Αντοχή) χωρίς penalties. Οι κανόνες της
+    Character.update_effective_stats, κοινοί με την classic_exact.
+    """
+    attack, damage, defense, toughness = stats
+    penalty = fatigue_penalty(fatigue, indomitable)
+    if defense_penalty < 0:
+        # Ποινή άμυνας από υπερπροσπάθεια - αγνοεί τον συντελεστή
+        defense = defense_penalty
+    else:
+        # Penalty από λαβωματιές και από πολλαπλούς εχθρούς
+        defense = defense - wounds - outnumbered_penalty
+    return attack - penalty, damage - penalty, defense, toughness - wounds
+
+
+class Character:
+    """Ένας μαχητής του κλασικού συστήματος.
+
+    Τα effective_* είναι τα τελικά stats με τα penalties. Ξαναϋπολογίζονται μόνο όταν
+    αλλάζουν λαβωματιές, κόπωση ή ποινές, οπότε λαβωματιές και ποινή από πολλαπλούς
+    εχθρούς αλλάζουν μόνο μέσω των add_wound, mark_dead και set_outnumbered_penalty.
+    """
+
+    # Ακέραια πεδία αντί για dicts: σε μάχες 1 vs Πολλών φτιάχνονται εκατομμύρια χαρακτήρες
+    __slots__ = (
+        "name", "initiative", "attack", "damage", "defense", "toughness",
+        "wounds", "fatigue", "stuns", "indomitable", "overexertion", "never_stunned", "is_minion",
+        "stunned_turns", "defense_penalty", "outnumbered_penalty",
+        "effective_attack", "effective_damage", "effective_defense", "effective_toughness",
+    )
+
+    def __init__(self, name, stats, indomitable=False, overexertion=True, never_stunned=False, is_minion=False):
+        self.name = name
+        self.initiative = stats["Πρωτοβουλία"]
+        self.attack = stats["Επίθεση"]
+        self.damage = stats["Ζημιά"]
+        self.defense = stats["Άμυνα"]
+        self.toughness = stats["Αντοχή"]
+        self.wounds = 0
+        self.fatigue = 0
+        self.stuns = 0  # Πόσες φορές έχασε σειρές
+        self.indomitable = indomitable
+        self.overexertion = overexertion
+        self.never_stunned = never_stunned
+        self.is_minion = is_minion
+        self.stunned_turns = 0  # Πόσες σειρές χάνει
+        self.defense_penalty = 0  # Ποινή στην άμυνα
+        self.outnumbered_penalty = 0  # Ποινή από πολλαπλούς εχθρούς
+        self.update_effective_stats()
+
+    def update_effective_stats(self):
+        """Υπολογίζει τα τελικά stats με penalties (effective_stats)"""
+        (self.effective_attack, self.effective_damage, self.effective_defense,
+         self.effective_toughness) = effective_stats(
+            (self.attack, self.damage, self.defense, self.toughness), self.wounds, self.fatigue,
+            self.indomitable, self.defense_penalty, self.outnumbered_penalty)
+
+    def get_effective_stat(self, stat_name):
+        """Το τελικό stat με penalties"""
+        return getattr(self, EFFECTIVE_FIELDS[stat_name])
+
+    def add_wound(self, apply_fatigue=True, count=1):
+        self.wounds += count
+        if apply_fatigue:
+            self._apply_fatigue()
+        self.update_effective_stats()
+
+    def mark_dead(self):
+        self.wounds = 10  # Σημάδι θανάτου
+        self.update_effective_stats()
+
+    def set_outnumbered_penalty(self, penalty):
+        if penalty != self.outnumbered_penalty:
+            self.outnumbered_penalty = penalty
+            self.update_effective_stats()
+
+    def add_fatigue(self):
+        self._apply_fatigue()
+        self.update_effective_stats()
+
+    def _apply_fatigue(self):
+        if self.never_stunned:
+            # Ποτέ εμβρόντητος: δεν παίρνει ποτέ κόπωση ούτε χάνει σειρές
+            return
+        elif not self.overexertion:
+            # Χωρίς υπερπροσπάθεια: δεν παίρνει κόπωση αλλά χάνει σειρές
+            self.stunned_turns = STUN_TURNS  # Χάνει τις επόμενες 2 σειρές
+            self.stuns += 1
+            self.defense_penalty = STUN_DEFENSE  # Άμυνα -2 (αγνοώντας τον συντελεστή)
+        else:
+            self.fatigue += 1
+
+    def is_stunned(self):
+        return self.stunned_turns > 0
+
+    def reduce_stun(self):
+        if self.stunned_turns > 0:
+            self.stunned_turns -= 1
+            if self.stunned_turns == 0:
+                self.defense_penalty = 0  # Αφαίρεση penalty όταν τελειώνει το stun
+                self.update_effective_stats()
+
+    def is_defeated(self):
+        return self.wounds >= 2
+
+class BattleEngine:
+    """Οι κανόνες μάχης του κλασικού συστήματος, χωρίς γραφικό περιβάλλον"""
+
+    alive_set = AliveSet  # Οι ζωντανοί αντίπαλοι στις μάχες 1 vs πολλοί (η instrument την αντικαθιστά)
+
+    def __init__(self, rng=None):
+        self.rng = rng if rng is not None else make_rng()
+
+    def roll_d20(self, modifier=0):
+        """Ρίχνει d20 με modifier"""
+        dice_result = self.rng.randint(1, 20)
+        total = dice_result + modifier
+        return dice_result, modifier, total
+
+    def format_dice_roll(self, stat_name, dice_result, modifier, total):
+        """Μορφοποιεί την εμφάνιση της ζαριάς"""
+        if modifier >= 0:
+            return f"{stat_name} d20({dice_result}) + {modifier} = {total}"
+        else:
+            return f"{stat_name} d20({dice_result}) - {abs(modifier)} = {total}"
+
+    def initiative_phase(self, char1, char2):
+        """Καθορίζει ποιος παίζει πρώτος"""
+        result = ""
+
+        while True:
+            dice1, mod1, init1 = self.roll_d20(char1.get_effective_stat("Πρωτοβουλία"))
+            dice2, mod2, init2 = self.roll_d20(char2.get_effective_stat("Πρωτοβουλία"))
+
+            init1_display = self.format_dice_roll("Πρωτοβουλία", dice1, mod1, init1)
+            init2_display = self.format_dice_roll("Πρωτοβουλία", dice2, mod2, init2)
+
+            result += f"{char1.name}: {init1_display}\n"
+            result += f"{char2.name}: {init2_display}\n"
+
+            if init1 > init2:
+                result += f"{char1.name} παίζει πρώτος!\n\n"
+                return char1, char2, result
+            elif init2 > init1:
+                result += f"{char2.name} παίζει πρώτος!\n\n"
+                return char2, char1, result
+            else:
+                result += "Ισοβαθμία! Ξαναρίχνουμε...\n"
+
+    def attack_turn(self, attacker, defender, attack_type="Επίθεση"):
+        """Εκτελεί μια επίθεση"""
+        result = f"--- {attack_type} {attacker.name} ---\n"
+
+        # Ζαριά επίθεσης vs άμυνας
+        att_dice, att_mod, attack_roll = self.roll_d20(attacker.get_effective_stat("Επίθεση"))
+        def_dice, def_mod, defense_roll = self.roll_d20(defender.get_effective_stat("Άμυνα"))
+
+        attack_display = self.format_dice_roll("Επίθεση", att_dice, att_mod, attack_roll)
+        defense_display = self.format_dice_roll("Άμυνα", def_dice, def_mod, defense_roll)
+
+        result += f"{attack_display} vs {defense_display}\n"
+
+        if attack_roll >= defense_roll:  # Ισοβαθμία κερδίζει επιτιθέμενος
+            result += "Επιτυχής επίθεση! Ρίχνουμε ζημιά...\n"
+
+            # Ζαριά ζημιάς vs αντοχής
+            dmg_dice, dmg_mod, damage_roll = self.roll_d20(attacker.get_effective_stat("Ζημιά"))
+            end_dice, end_mod, endurance_roll = self.roll_d20(defender.get_effective_stat("Αντοχή"))
+
+            damage_display = self.format_dice_roll("Ζημιά", dmg_dice, dmg_mod, damage_roll)
+            endurance_display = self.format_dice_roll("Αντοχή", end_dice, end_mod, endurance_roll)
+
+            result += f"{damage_display} vs {endurance_display}\n"
+
+            damage_diff = damage_roll - endurance_roll
+            had_two_wounds = defender.wounds >= 2  # Ελέγχουμε ΠΡΙΝ την ζημιά
+
+            # Τσιράκι: πεθαίνει με οποιαδήποτε επιτυχή ζημιά
+            if defender.is_minion and damage_diff >= 0:
+                result += f"Τσιράκι! (+{damage_diff}) Ο {defender.name} νικιέται!\n"
+                defender.mark_dead()
+                return result, True  # Νίκη
+            elif damage_diff >= 10:
+                result += f"ΘΑΝΑΤΗΦΟΡΟ ΧΤΥΠΗΜΑ! (+{damage_diff}) Ο {defender.name} νικιέται!\n"
+                defender.mark_dead()
+                return result, True  # Νίκη
+            elif damage_diff >= 5:
+                result += f"Σοβαρή ζημιά! (+{damage_diff}) 2 λαβωματιές, 1 κόπωση\n"
+                defender.add_wound(count=2)
+            elif damage_diff >= 0:  # Ισοβαθμία ή +1 έως +4
+                result += f"Ζημιά! (+{damage_diff}) 1 λαβωματιά, 1 κόπωση\n"
+                defender.add_wound()  # Η add_wound καλεί ήδη την add_fatigue
+            else:
+                result += f"Αντέχει τη ζημιά! ({damage_diff})\n"
+
+            # Έλεγχος αν ο defender είχε >=2 λαβωματιές και μόλις λαβώθηκε ξανά (μόνο αν δεν είναι τσιράκι)
+            if not defender.is_minion and had_two_wounds and damage_diff >= 0:
+                result += f"Ο {defender.name} έχει πάρει πολλές λαβωματιές και νικιέται!\n"
+                defender.mark_dead()
+                return result, True
+
+        else:
+            result += "Αποτυχημένη επίθεση!\n"
+
+        result += f"Κατάσταση {defender.name}: {defender.wounds} λαβωματιές, {defender.fatigue} κόπωση\n\n"
+        return result, False
+
+    def simulate_battle_silent(self, char1_stats, char2_stats, char1_indomitable=False, char2_indomitable=False, char1_overexertion=True, char2_overexertion=True, char1_never_stunned=False, char2_never_stunned=False, char2_number=1, char2_engaged=1, char2_minion=False):
+        """Προσομοιώνει μια μάχη χωρίς output - επιστρέφει (νικητής, γύροι)"""
+        # Δημιουργία χαρακτήρων
+        char1 = Character("Χαρακτήρας 1", char1_stats, char1_indomitable, char1_overexertion, char1_never_stunned)
+
+        if char2_number == 1:
+            # Κανονική μάχη 1v1
+            char2 = Character("Χαρακτήρας 2", char2_stats, char2_indomitable, char2_overexertion, char2_never_stunned, char2_minion)
+            self.combatants = (char1, (char2,))
+            winner, turns = self.simulate_1v1_silent(char1, char2)
+            self.turns = turns
+            rounds = max(1, turns // 4)  # Μετατροπή turns σε γύρους
+            return winner, rounds
+        else:
+            # Μάχη 1 vs πολλοί
+            char2_list = []
+            for i in range(char2_number):
+                char_name = f"Χαρακτήρας 2.{i+1}"
+                char2_opponent = Character(char_name, char2_stats, char2_indomitable, char2_overexertion, char2_never_stunned, char2_minion)
+                char2_list.append(char2_opponent)
+
+            self.combatants = (char1, char2_list)
+            self.turns = None  # Στις μάχες 1 vs πολλοί μετράνε μόνο οι γύροι
+            return self.simulate_1vMany_silent(char1, char2_list, char2_engaged)
+
+    def end_state(self, winner):
+        """Λαβωματιές και κόπωση του νικητή της τελευταίας μάχης χωρίς output (None σε ισοπαλία)
+
+        Όταν νικάνε οι αντίπαλοι, του λιγότερο λαβωμένου ζωντανού αντιπάλου.
+        """
+        char1, char2_list = self.combatants
+        if winner == 1:
+            return char1.wounds, char1.fatigue
+        if winner == 2:
+            return min((char2.wounds, char2.fatigue) for char2 in char2_list if char2.wounds < 10)
+        return None
+
+    def simulate_1v1_silent(self, char1, char2):
+        # Φάση πρωτοβουλίας
+        first_player, second_player = self.initiative_phase_silent(char1, char2)
+
+        # Μάχη
+        turn_count = 0
+        current_attacker = first_player
+        current_defender = second_player
+        is_first_turn = True
+        current_player_attacks = 0
+
+        while turn_count < 400:  # Safety limit
+            turn_count += 1
+
+            # Έλεγχος αν ο τρέχων επιτιθέμενος είναι stunned
+            if current_attacker.is_stunned():
+                current_attacker.reduce_stun()
+                # Αλλάζουμε αμέσως παίκτη
+                if is_first_turn:
+                    current_attacker, current_defender = current_defender, current_attacker
+                    current_player_attacks = 0
+                    is_first_turn = False
+                else:
+                    if current_player_attacks >= 2:
+                        current_attacker, current_defender = current_defender, current_attacker
+                        current_player_attacks = 0
+                    else:
+                        current_player_attacks += 1
+                continue
+
+            current_player_attacks += 1
+
+            # Εκτέλεση επίθεσης
+            battle_ended = self.attack_turn_silent(current_attacker, current_defender)
+
+            if battle_ended:
+                if current_attacker.name == "Χαρακτήρας 1":
+                    return 1, turn_count
+                else:
+                    return 2, turn_count
+
+            # Καθορισμός επόμενου παίκτη
+            if is_first_turn:
+                # Η πρώτη κίνηση τελείωσε, αλλάζουμε παίκτη
+                current_attacker, current_defender = current_defender, current_attacker
+                current_player_attacks = 0
+                is_first_turn = False
+            else:
+                # Όλες οι άλλες κινήσεις είναι διπλές
+                if current_player_attacks >= 2:
+                    # Ο παίκτης τελείωσε τις 2 επιθέσεις του, αλλάζουμε
+                    current_attacker, current_defender = current_defender, current_attacker
+                    current_player_attacks = 0
+
+        return 0, turn_count  # Ισοπαλία
+
+    def simulate_1vMany_silent(self, char1, char2_list, char2_engaged):
+        """Προσομοιώνει μάχη 1 vs πολλοί αντιπάλους χωρίς output με reserves - επιστρέφει (νικητής, γύροι)"""
+        # Φάση πρωτοβουλίας
+        _, _, char1_initiative = self.roll_d20(char1.get_effective_stat("Πρωτοβουλία"))
+        _, _, opponents_initiative = self.roll_d20(char2_list[0].get_effective_stat("Πρωτοβουλία"))
+
+        char1_wins_init = char1_initiative >= opponents_initiative
+        round_count = 0
+
+        # Ζωντανοί εχθροί: engaged και reserves
+        enemies = self.alive_set(char2_list, char2_engaged, lambda char: char.wounds < 10)
+
+        # Προσομοίωση μάχης
+        while round_count < 200:  # Safety limit
+            round_count += 1
+
+            # Έλεγχος αν υπάρχουν ζωντανοί εχθροί
+            engaged_enemies = enemies.refresh()
+            if not engaged_enemies:
+                return 1, round_count  # Char1 νικάει
+
+            if char1.wounds >= 10:
+                return 2, round_count  # Char1 χάνει
+
+            # Ενημέρωση penalty για πολλαπλούς εχθρούς - βασισμένο σε engaged
+            # -1 για κάθε εχθρό μετά τον πρώτο, μέχρι -5
+            num_enemies = len(engaged_enemies)
+            char1.set_outnumbered_penalty(min(num_enemies - 1, 5))
+
+            # Char1 επιτίθεται σε 1 εχθρό από τους engaged → ο στόχος αντεπιτίθεται
+            target = self.rng.choice(engaged_enemies)
+            # Επίθεση char1
+            char1_killed_target = self.attack_turn_silent(char1, target)
+            # Αντεπίθεση του στόχου (αν δεν πέθανε)
+            if not char1_killed_target and target.wounds < 10:
+                target_killed_char1 = self.attack_turn_silent(target, char1)
+                if target_killed_char1:
+                    return 2, round_count
+
+            # Όλοι οι ΥΠΟΛΟΙΠΟΙ engaged εχθροί επιτίθενται → char1 αντεπιτίθεται
+            for enemy in enemies.refresh():
+                if enemy is target:
+                    continue  # Ο στόχος ήδη αντεπιτέθηκε
+
+                if char1.wounds >= 10:
+                    return 2, round_count
+
+                # Επίθεση εχθρού
+                enemy_killed_char1 = self.attack_turn_silent(enemy, char1)
+                if enemy_killed_char1:
+                    return 2, round_count
+
+                # Αντεπίθεση char1 (αν δεν πέθανε και δεν είναι stunned)
+                if char1.wounds < 10 and not char1.is_stunned():
+                    self.attack_turn_silent(char1, enemy)
+
+        return 0, round_count  # Ισοπαλία
+
+    def initiative_phase_silent(self, char1, char2):
+        """Καθορίζει ποιος παίζει πρώτος χωρίς output"""
+        while True:
+            _, _, init1 = self.roll_d20(char1.initiative)
+            _, _, init2 = self.roll_d20(char2.initiative)
+
+            if init1 > init2:
+                return char1, char2
+            elif init2 > init1:
+                return char2, char1
+            # Ισοβαθμία - ξαναρίχνουμε
+
+    def attack_turn_silent(self, attacker, defender):
+        """Εκτελεί μια επίθεση χωρίς output - επιστρέφει True αν τελειώνει η μάχη"""
+        # Ζαριά επίθεσης vs άμυνας
+        _, _, attack_roll = self.roll_d20(attacker.effective_attack)
+        _, _, defense_roll = self.roll_d20(defender.effective_defense)
+
+        if attack_roll >= defense_roll:
+            # Ζαριά ζημιάς vs αντοχής
+            _, _, damage_roll = self.roll_d20(attacker.effective_damage)
+            _, _, endurance_roll = self.roll_d20(defender.effective_toughness)
+
+            return self.apply_damage_silent(defender, damage_roll - endurance_roll)
+
+        return False
+
+    def apply_damage_silent(self, defender, damage_diff):
+        """Εφαρμόζει τη ζημιά χωρίς output - επιστρέφει True αν πεθαίνει ο defender"""
+        had_two_wounds = defender.wounds >= 2  # Ελέγχουμε ΠΡΙΝ την ζημιά
+
+        # Τσιράκι: πεθαίνει με οποιαδήποτε επιτυχή ζημιά
+        if defender.is_minion and damage_diff >= 0:
+            defender.mark_dead()
+            return True
+        elif damage_diff >= 10:
+            defender.mark_dead()
+            return True  # Θανατηφόρος χτύπημα
+        elif damage_diff >= 5:
+            defender.add_wound(count=2)
+        elif damage_diff >= 0:
+            defender.add_wound()  # Η add_wound καλεί ήδη την add_fatigue
+
+        # Έλεγχος αν ο defender είχε >=2 λαβωματιές και μόλις λαβώθηκε ξανά (μόνο αν δεν είναι τσιράκι)
+        if not defender.is_minion and had_two_wounds and damage_diff >= 0:
+            defender.mark_dead()
+            return True
+
+        return False
+
+    def single_battle(self, char1_stats, char2_stats, char1_indomitable=False, char2_indomitable=False, char1_overexertion=True, char2_overexertion=True, char1_never_stunned=False, char2_never_stunned=False, char2_number=1, char2_engaged=1, char2_minion=False):
+        """Εκτελεί μια αναλυτική μάχη - επιστρέφει το κείμενο της μάχης"""
+        # Δημιουργία χαρακτήρων
+        char1 = Character("Χαρακτήρας 1", char1_stats, char1_indomitable, char1_overexertion, char1_never_stunned)
+
+        # Δημιουργία πολλαπλών χαρακτήρων 2
+        char2_list = []
+        for i in range(char2_number):
+            char2 = Character(f"Χαρακτήρας 2.{i+1}", char2_stats, char2_indomitable, char2_overexertion, char2_never_stunned, char2_minion)
+            char2_list.append(char2)
+
+        if char2_number == 1:
+            # Κανονική μάχη 1 vs 1
+            return self.single_battle_1v1(char1, char2_list[0])
+        else:
+            # Μάχη 1 vs πολλοί
+            return self.single_battle_1vMany(char1, char2_list)
+
+    def single_battle_1v1(self, char1, char2):
+        """Κανονική μάχη 1 vs 1"""
+        result = "=== ΜΑΧΗ ΧΑΡΑΚΤΗΡΩΝ ===\n\n"
+
+        # Φάση πρωτοβουλίας
+        first_player, second_player, init_result = self.initiative_phase(char1, char2)
+        result += init_result
+
+        # Μάχη με το σύστημα σειράς: Μόνο η πρώτη κίνηση είναι μονή, όλες οι άλλες διπλές
+        turn_count = 0
+        current_attacker = first_player
+        current_defender = second_player
+        is_first_turn = True  # Η πρώτη κίνηση είναι μονή
+        current_player_attacks = 0  # Πόσες φορές έχει επιτεθεί ο τρέχων παίκτης
+
+        while True:
+            turn_count += 1
+
+            # Έλεγχος αν ο τρέχων επιτιθέμενος είναι stunned
+            if current_attacker.is_stunned():
+                result += f"--- {current_attacker.name} χάνει τη σειρά του (stunned) ---\n"
+                current_attacker.reduce_stun()
+                # Αλλάζουμε αμέσως παίκτη
+                if is_first_turn:
+                    current_attacker, current_defender = current_defender, current_attacker
+                    current_player_attacks = 0
+                    is_first_turn = False
+                else:
+                    if current_player_attacks >= 2:
+                        current_attacker, current_defender = current_defender, current_attacker
+                        current_player_attacks = 0
+                    else:
+                        current_player_attacks += 1
+                continue
+
+            current_player_attacks += 1
+
+            # Εκτέλεση επίθεσης
+            if is_first_turn:
+                attack_type = "Επίθεση"
+            elif current_player_attacks == 1:
+                attack_type = "Αντεπίθεση"
+            else:
+                attack_type = "Επίθεση"
+
+            turn_result, battle_ended = self.attack_turn(current_attacker, current_defender, attack_type)
+            result += turn_result
+
+            if battle_ended:
+                result += f"\n🏆 ΝΙΚΗΤΗΣ: {current_attacker.name}! 🏆\n"
+                break
+
+            # Καθορισμός επόμενου παίκτη
+            if is_first_turn:
+                # Η πρώτη κίνηση τελείωσε, αλλάζουμε παίκτη
+                current_attacker, current_defender = current_defender, current_attacker
+                current_player_attacks = 0
+                is_first_turn = False
+            else:
+                # Όλες οι άλλες κινήσεις είναι διπλές
+                if current_player_attacks >= 2:
+                    # Ο παίκτης τελείωσε τις 2 επιθέσεις του, αλλάζουμε
+                    current_attacker, current_defender = current_defender, current_attacker
+                    current_player_attacks = 0
+
+            # Έλεγχος για άπειρο loop (safety)
+            if turn_count > 100:
+                result += "\nΗ μάχη διαρκεί πολύ! Ισοπαλία.\n"
+                break
+
+        return result
+
+    def single_battle_1vMany(self, char1, char2_list):
+        """Μάχη 1 vs πολλοί με turn-based σύστημα"""
+        result = f"=== ΜΑΧΗ ΧΑΡΑΚΤΗΡΩΝ - 1 vs {len(char2_list)} ===\n\n"
+
+        # Φάση πρωτοβουλίας - μόνο ο char1 ρίχνει
+        init1_dice, init1_mod, init1_total = self.roll_d20(char1.get_effective_stat("Πρωτοβουλία"))
+        init1_display = self.format_dice_roll("Πρωτοβουλία", init1_dice, init1_mod, init1_total)
+        result += f"{char1.name}: {init1_display}\n"
+
+        # Όλοι οι χαρακτήρες 2 ρίχνουν πρωτοβουλία
+        enemies_init = []
+        for i, char2 in enumerate(char2_list):
+            init2_dice, init2_mod, init2_total = self.roll_d20(char2.get_effective_stat("Πρωτοβουλία"))
+            init2_display = self.format_dice_roll("Πρωτοβουλία", init2_dice, init2_mod, init2_total)
+            result += f"{char2.name}: {init2_display}\n"
+            enemies_init.append((char2, init2_total))
+
+        # Καθορισμός σειράς
+        char1_wins_init = True
+        for char2, init_total in enemies_init:
+            if init1_total <= init_total:
+                char1_wins_init = False
+                break
+
+        if char1_wins_init:
+            result += f"\n{char1.name} κερδίζει την πρωτοβουλία!\n\n"
+        else:
+            result += f"\nΟι αντίπαλοι κερδίζουν την πρωτοβουλία!\n\n"
+
+        # Μετρητής γύρων
+        round_count = 0
+        turn_count = 0
+
+        while turn_count < 200:  # Safety limit
+            # Νέος γύρος: όταν έχουν παίξει όλοι από μια φορά
+            if turn_count % (len(char2_list) + 1) == 0:
+                round_count += 1
+                result += f"=== ΓΥΡΟΣ {round_count} ===\n"
+
+                # Ενημέρωση penalty για πολλαπλούς εχθρούς
+                alive_opponents = [c for c in char2_list if not self.is_dead(c)]
+                num_enemies = len(alive_opponents)
+                char1.set_outnumbered_penalty(min(num_enemies - 1, 5))
+                if char1.outnumbered_penalty > 0:
+                    result += f"({char1.name} έχει -{char1.outnumbered_penalty} Άμυνα λόγω {num_enemies} εχθρών)\n"
+
+            turn_count += 1
+
+            # Καθορισμός ποιος παίζει
+            if char1_wins_init:
+                # Char1 παίζει πρώτος
+                if (turn_count - 1) % (len(char2_list) + 1) == 0:
+                    # Σειρά του char1
+                    result += self.char1_attack_phase(char1, char2_list)
+                    if self.check_enemies_defeated(char2_list):
+                        result += f"\n🏆 ΝΙΚΗΤΗΣ: {char1.name}! 🏆\n"
+                        result += f"Συνολικοί γύροι: {round_count}\n"
+                        break
+                else:
+                    # Σειρά εχθρού
+                    enemy_index = ((turn_count - 2) % len(char2_list))
+                    if enemy_index < len([c for c in char2_list if not self.is_dead(c)]):
+                        living_enemies = [c for c in char2_list if not self.is_dead(c)]
+                        if enemy_index < len(living_enemies):
+                            attacker = living_enemies[enemy_index]
+                            result += self.enemy_attack_phase(attacker, char1)
+                            if self.is_dead(char1):
+                                result += f"\n🏆 ΝΙΚΗΤΕΣ: Οι αντίπαλοι! 🏆\n"
+                                result += f"Συνολικοί γύροι: {round_count}\n"
+                                break
+            else:
+                # Εχθροί παίζουν πρώτοι
+                if (turn_count - 1) % (len(char2_list) + 1) < len(char2_list):
+                    # Σειρά εχθρού
+                    enemy_index = (turn_count - 1) % (len(char2_list) + 1)
+                    living_enemies = [c for c in char2_list if not self.is_dead(c)]
+                    if enemy_index < len(living_enemies):
+                        attacker = living_enemies[enemy_index]
+                        result += self.enemy_attack_phase(attacker, char1)
+                        if self.is_dead(char1):
+                            result += f"\n🏆 ΝΙΚΗΤΕΣ: Οι αντίπαλοι! 🏆\n"
+                            result += f"Συνολικοί γύροι: {round_count}\n"
+                            break
+                else:
+                    # Σειρά του char1
+                    result += self.char1_attack_phase(char1, char2_list)
+                    if self.check_enemies_defeated(char2_list):
+                        result += f"\n🏆 ΝΙΚΗΤΗΣ: {char1.name}! 🏆\n"
+                        result += f"Συνολικοί γύροι: {round_count}\n"
+                        break
+
+        if turn_count >= 200:
+            result += "\nΗ μάχη διαρκεί πολύ! Ισοπαλία.\n"
+            result += f"Συνολικοί γύροι: {round_count}\n"
+
+        return result
+
+    def char1_attack_phase(self, char1, char2_list):
+        """Φάση επίθεσης του χαρακτήρα 1 με αντεπίθεση του στόχου"""
+        result = f"\n--- {char1.name} επιτίθεται ---\n"
+
+        # Επιλογή στόχου: προτεραιότητα σε όποιον έχει >1 λαβωματιά
+        target = self.select_target(char2_list)
+        if target is None:
+            result += "Δεν υπάρχουν ζωντανοί εχθροί!\n"
+            return result
+
+        turn_result, battle_ended = self.attack_turn(char1, target, "Επίθεση")
+        result += turn_result
+
+        if battle_ended:
+            return result
+
+        # Αντεπίθεση του στόχου (αν είναι ακόμη ζωντανός)
+        if not self.is_dead(target):
+            result += f"\n--- {target.name} αντεπιτίθεται ---\n"
+            counter_result, counter_ended = self.attack_turn(target, char1, "Αντεπίθεση")
+            result += counter_result
+
+        return result
+
+    def enemy_attack_phase(self, attacker, char1):
+        """Φάση επίθεσης εχθρού με αντεπίθεση"""
+        result = f"\n--- {attacker.name} επιτίθεται ---\n"
+
+        # Επίθεση εχθρού
+        turn_result, battle_ended = self.attack_turn(attacker, char1, "Επίθεση")
+        result += turn_result
+
+        if battle_ended:
+            return result
+
+        # Αντεπίθεση του char1 (αν είναι ζωντανός)
+        if not self.is_dead(char1):
+            result += f"\n--- {char1.name} αντεπιτίθεται ---\n"
+            counter_result, counter_ended = self.attack_turn(char1, attacker, "Αντεπίθεση")
+            result += counter_result
+
+        return result
+
+    def select_target(self, char2_list):
+        """Επιλέγει στόχο για τον char1"""
+        living_enemies = [c for c in char2_list if not self.is_dead(c)]
+        if not living_enemies:
+            return None
+
+        # Προτεραιότητα σε όποιον έχει >1 λαβωματιά
+        wounded_enemies = [c for c in living_enemies if c.wounds > 1]
+        if wounded_enemies:
+            return wounded_enemies[0]  # Επιλέγει τον πρώτο με >1 λαβωματιά
+
+        # Αλλιώς τυχαίος
+        return self.rng.choice(living_enemies)
+
+    def check_enemies_defeated(self, char2_list):
+        """Ελέγχει αν όλοι οι εχθροί νικήθηκαν"""
+        return all(self.is_dead(c) for c in char2_list)
+
+    def is_dead(self, character):
+        """Ελέγχει αν ένας χαρακτήρας είναι νεκρός"""
+        return character.wounds >= 10  # Χρησιμοποιώ 10 ως σημάδι θανάτου όπως στο alternative
+
+class TableBattleEngine(BattleEngine):
+    """Ίδιοι κανόνες, αλλά οι μάχες χωρίς output διαλέγουν το αποτέλεσμα κάθε επίθεσης
+    από τους πίνακες πιθανοτήτων με μία ζαριά αντί για τέσσερα d20"""
+
+    def attack_turn_silent(self, attacker, defender):
+        bands = tables.attack_bands(
+            defender.effective_defense - attacker.effective_attack,
+            defender.effective_toughness - attacker.effective_damage,
+        )
+        return self.apply_damage_silent(defender, tables.sample_band(self.rng, bands))
+
+def simulate(config, n, seed=None, rng=None, stats=None, engine_class=None):
+    """Εκτελεί n μάχες χωρίς output - config: τα ορίσματα της simulate_battle_silent
+
+    rng: έτοιμη γεννήτρια αντί για την rng.make_rng(seed)
+    stats: BattleStats που συμπληρώνεται, π.χ. aggregate.BattleAggregate (με την κατάσταση
+    του νικητή, BattleEngine.end_state) ή export.BattleRecorder (μία γραμμή ανά μάχη)
+    engine_class: άλλη κλάση μηχανής, π.χ. instrument.instrumented_class (προεπιλογή TableBattleEngine)
+    """
+    engine = (engine_class or TableBattleEngine)(rng if rng is not None else make_rng(seed))
+    return run_battles(engine.simulate_battle_silent, config, n, stats, engine)
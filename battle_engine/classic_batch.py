@@ -0,0 +1,332 @@
+"""Διανυσματική (numpy) εκτέλεση πολλών μαχών του κλασικού συστήματος.
+
+Οι N μάχες προχωράνε μαζί, μία κίνηση τη φορά: η κατάσταση κάθε χαρακτήρα
+(λαβωματιές, κόπωση, stun, ποινή άμυνας) κρατιέται σε πίνακες (2, N) και οι
+μάχες που τελείωσαν βγαίνουν από τον πίνακα των ενεργών. Οι κανόνες είναι
+ίδιοι με τις simulate_1v1_silent / attack_turn_silent του classic.
+
+Στις μάχες 1 vs πολλοί οι αντίπαλοι κρατιούνται σε πίνακες (N, αντίπαλοι) και
+οι μάχες προχωράνε ένα γύρο τη φορά, με τη σειρά της simulate_1vMany_silent:
+επίθεση στον στόχο και αντεπίθεση, και μετά μία θέση του παραθύρου των engaged
+τη φορά, για όλες τις μάχες μαζί.
+"""
+
+from . import classic
+from .common import BattleStats, full_config
+
+try:
+    import numpy as np
+except ImportError:  # Το numpy είναι προαιρετικό - χωρίς αυτό μένει η απλή εκτέλεση
+    np = None
+
+MAX_TURNS = 400  # Ίδιο safety limit με την simulate_1v1_silent
+MAX_ROUNDS = 200  # Ίδιο safety limit με την simulate_1vMany_silent
+
+
+def supports(config):
+    """Ελέγχει αν η μάχη μπορεί να τρέξει διανυσματικά"""
+    return np is not None
+
+
+def simulate(config, n, seed=None, rng=None):
+    """Εκτελεί n μάχες - διανυσματικά αν γίνεται, αλλιώς με τη classic.simulate
+
+    Με rng (γεννήτρια της Python, βλ. rng.make_rng) τρέχει πάντα η classic.simulate.
+    """
+    if rng is None and supports(config):
+        return simulate_batch(config, n, seed)
+    return classic.simulate(config, n, seed, rng)
+
+
+def simulate_batch(config, n, seed=None):
+    """Εκτελεί n μάχες ταυτόχρονα - επιστρέφει BattleStats"""
+    return _stats_from_arrays(*battle_results(config, n, seed))
+
+
+def battle_results(config, n, seed=None):
+    """Εκτελεί n μάχες ταυτόχρονα - επιστρέφει πίνακες (νικητής, γύροι) ανά μάχη"""
+    if np is None:
+        raise ImportError("Η διανυσματική εκτέλεση απαιτεί numpy")
+    config = full_config(classic.BattleEngine, config)
+
+    rng = np.random.default_rng(seed)
+    if config["char2_number"] != 1:
+        return _run_1vMany(rng, config, n)
+    winners, turns = _run_1v1(rng, config, n)
+    rounds = np.maximum(1, turns // 4)  # Μετατροπή turns σε γύρους
+    return winners, rounds
+
+
+def _pair(config, key):
+    """Πίνακας [χαρακτήρας 1, χαρακτήρας 2] για μια ρύθμιση"""
+    return np.array([config["char1_" + key], config["char2_" + key]])
+
+
+def _initiative(rng, init1, init2, n):
+    """Ποιος παίζει πρώτος σε κάθε μάχη (0 ή 1) - ξαναρίχνει τις ισοβαθμίες"""
+    first = np.zeros(n, dtype=np.int8)
+    pending = np.arange(n)
+    while pending.size:
+        dice = rng.integers(1, 21, size=(2, pending.size))
+        total1 = dice[0] + init1
+        total2 = dice[1] + init2
+        first[pending[total2 > total1]] = 1
+        pending = pending[total1 == total2]
+    return first
+
+
+def _run_1v1(rng, config, n):
+    stats1, stats2 = config["char1_stats"], config["char2_stats"]
+    attack = np.array([stats1["Επίθεση"], stats2["Επίθεση"]])
+    damage = np.array([stats1["Ζημιά"], stats2["Ζημιά"]])
+    defense = np.array([stats1["Άμυνα"], stats2["Άμυνα"]])
+    endurance = np.array([stats1["Αντοχή"], stats2["Αντοχή"]])
+    indomitable = _pair(config, "indomitable").astype(bool)
+    overexertion = _pair(config, "overexertion").astype(bool)
+    never_stunned = _pair(config, "never_stunned").astype(bool)
+    minion = np.array([False, bool(config["char2_minion"])])  # Ο χαρακτήρας 1 δεν είναι ποτέ τσιράκι
+
+    wounds = np.zeros((2, n), dtype=np.int32)
+    fatigue = np.zeros((2, n), dtype=np.int32)
+    stunned_turns = np.zeros((2, n), dtype=np.int32)
+    defense_penalty = np.zeros((2, n), dtype=np.int32)
+
+    attacker = _initiative(rng, stats1["Πρωτοβουλία"], stats2["Πρωτοβουλία"], n)
+    is_first_turn = np.ones(n, dtype=bool)
+    player_attacks = np.zeros(n, dtype=np.int32)
+    turns = np.zeros(n, dtype=np.int32)
+    winners = np.zeros(n, dtype=np.int8)
+
+    active = np.arange(n)
+    while active.size:
+        turns[active] += 1
+        att = attacker[active]
+
+        # Όσοι είναι stunned χάνουν τη σειρά τους
+        stunned = stunned_turns[att, active] > 0
+        s_idx = active[stunned]
+        s_att = att[stunned]
+        stunned_turns[s_att, s_idx] -= 1
+        stun_over = stunned_turns[s_att, s_idx] == 0
+        defense_penalty[s_att[stun_over], s_idx[stun_over]] = 0  # Αφαίρεση penalty όταν τελειώνει το stun
+        swap = is_first_turn[s_idx] | (player_attacks[s_idx] >= 2)
+        player_attacks[s_idx] = np.where(swap, 0, player_attacks[s_idx] + 1)
+        attacker[s_idx[swap]] ^= 1
+        is_first_turn[s_idx] = False
+
+        # Επιθέσεις
+        a_pos = np.flatnonzero(~stunned)
+        a_idx = active[a_pos]
+        a_att = att[a_pos]
+        a_def = 1 - a_att
+        player_attacks[a_idx] += 1
+
+        dice = rng.integers(1, 21, size=(4, a_idx.size))
+        att_fatigue = fatigue[a_att, a_idx]
+        # Ακατάβλητος με μόνο 1 κόπωση: καμία penalty
+        fatigue_penalty = np.where(indomitable[a_att] & (att_fatigue == 1), 0, att_fatigue)
+        def_wounds = wounds[a_def, a_idx]
+        def_penalty = defense_penalty[a_def, a_idx]
+        defense_value = np.where(def_penalty < 0, def_penalty, defense[a_def] - def_wounds)
+
+        hit = dice[0] + attack[a_att] - fatigue_penalty >= dice[1] + defense_value
+        damage_diff = (dice[2] + damage[a_att] - fatigue_penalty) - (dice[3] + endurance[a_def] - def_wounds)
+        damaged = hit & (damage_diff >= 0)
+        # Τσιράκι, θανατηφόρο χτύπημα ή νέα λαβωματιά με >=2 λαβωματιές
+        killed = damaged & (minion[a_def] | (damage_diff >= 10) | (def_wounds >= 2))
+
+        hurt = damaged & ~killed
+        h_idx = a_idx[hurt]
+        h_def = a_def[hurt]
+        wounds[h_def, h_idx] += np.where(damage_diff[hurt] >= 5, 2, 1)
+        # add_fatigue: κόπωση με υπερπροσπάθεια, αλλιώς χάνει 2 σειρές με Άμυνα -2
+        gets_fatigue = ~never_stunned[h_def] & overexertion[h_def]
+        fatigue[h_def[gets_fatigue], h_idx[gets_fatigue]] += 1
+        gets_stun = ~never_stunned[h_def] & ~overexertion[h_def]
+        stunned_turns[h_def[gets_stun], h_idx[gets_stun]] = classic.STUN_TURNS
+        defense_penalty[h_def[gets_stun], h_idx[gets_stun]] = classic.STUN_DEFENSE
+
+        winners[a_idx[killed]] = a_att[killed] + 1
+
+        # Καθορισμός επόμενου παίκτη: η πρώτη κίνηση είναι μονή, όλες οι άλλες διπλές
+        c_idx = a_idx[~killed]
+        swap = is_first_turn[c_idx] | (player_attacks[c_idx] >= 2)
+        attacker[c_idx[swap]] ^= 1
+        player_attacks[c_idx[swap]] = 0
+        is_first_turn[c_idx] = False
+
+        finished = np.zeros(active.size, dtype=bool)
+        finished[a_pos[killed]] = True
+        finished |= turns[active] >= MAX_TURNS  # Ισοπαλία
+        active = active[~finished]
+
+    return winners, turns
+
+
+def _strike(rng, attack, damage, defense, toughness, wounds, minion):
+    """Μία επίθεση ανά στοιχείο (attack_turn_silent και apply_damage_silent)
+
+    Επιστρέφει (σκοτώθηκε, νέες λαβωματιές) - 0 λαβωματιές αν αστόχησε ή σκοτώθηκε.
+    """
+    dice = rng.integers(1, 21, size=(4, attack.size))
+    hit = dice[0] + attack >= dice[1] + defense
+    damage_diff = (dice[2] + damage) - (dice[3] + toughness)
+    damaged = hit & (damage_diff >= 0)
+    # Τσιράκι, θανατηφόρο χτύπημα ή νέα λαβωματιά με >=2 λαβωματιές
+    killed = damaged & (minion | (damage_diff >= 10) | (wounds >= 2))
+    new_wounds = np.where(damaged & ~killed, np.where(damage_diff >= 5, 2, 1), 0)
+    return killed, new_wounds
+
+
+def _fatigue_penalty(fatigue, indomitable):
+    # Η classic.fatigue_penalty για πίνακες: Ακατάβλητος με μόνο 1 κόπωση, καμία penalty
+    return np.where(fatigue == 1, 0, fatigue) if indomitable else fatigue
+
+
+class _Horde:
+    """Η κατάσταση των μαχών 1 vs πολλοί που συνεχίζονται, μία γραμμή ανά μάχη.
+
+    Στη simulate_1vMany_silent τα stun δεν λήγουν ποτέ (δεν καλείται η reduce_stun),
+    οπότε όποιος χάσει σειρές έχει από εκεί και πέρα Άμυνα -2 - εδώ αρκεί ένα bool.
+    """
+
+    ARRAYS = ("ids", "wounds1", "fatigue1", "stunned1", "penalty", "alive2", "wounds2", "fatigue2", "stunned2")
+
+    def __init__(self, rng, config, n):
+        self.rng = rng
+        stats1, stats2 = config["char1_stats"], config["char2_stats"]
+        self.char1 = (stats1["Επίθεση"], stats1["Ζημιά"], stats1["Άμυνα"], stats1["Αντοχή"])
+        self.char2 = (stats2["Επίθεση"], stats2["Ζημιά"], stats2["Άμυνα"], stats2["Αντοχή"])
+        self.flags1 = (bool(config["char1_indomitable"]), bool(config["char1_overexertion"]),
+                       bool(config["char1_never_stunned"]))
+        self.flags2 = (bool(config["char2_indomitable"]), bool(config["char2_overexertion"]),
+                       bool(config["char2_never_stunned"]))
+        self.minion2 = bool(config["char2_minion"])
+        number = config["char2_number"]
+
+        self.ids = np.arange(n)  # Η θέση κάθε γραμμής στα αποτελέσματα
+        self.wounds1 = np.zeros(n, dtype=np.int32)
+        self.fatigue1 = np.zeros(n, dtype=np.int32)
+        self.stunned1 = np.zeros(n, dtype=bool)
+        self.penalty = np.zeros(n, dtype=np.int32)  # Ποινή από πολλαπλούς εχθρούς στην Άμυνα του Χαρακτήρα 1
+        self.alive2 = np.ones((n, number), dtype=bool)
+        self.wounds2 = np.zeros((n, number), dtype=np.int32)
+        self.fatigue2 = np.zeros((n, number), dtype=np.int32)
+        self.stunned2 = np.zeros((n, number), dtype=bool)
+
+    def keep(self, mask):
+        """Κρατάει μόνο τις γραμμές του mask"""
+        for name in self.ARRAYS:
+            setattr(self, name, getattr(self, name)[mask])
+
+    def window(self, engaged):
+        """Οι engaged πρώτοι ζωντανοί αντίπαλοι κάθε μάχης - επιστρέφει (δείκτες, πλήθος)"""
+        order = np.argsort(~self.alive2, axis=1, kind="stable")[:, :engaged]
+        return order, np.minimum(self.alive2.sum(axis=1), engaged)
+
+    def char1_attacks(self, rows, enemies):
+        """Ο Χαρακτήρας 1 επιτίθεται στον αντίπαλο enemies[i] της μάχης rows[i] - επιστρέφει ποιοι σκοτώθηκαν"""
+        attack, damage, _, _ = self.char1
+        _, _, defense, toughness = self.char2
+        fatigue = _fatigue_penalty(self.fatigue1[rows], self.flags1[0])
+        wounds = self.wounds2[rows, enemies]
+        killed, new_wounds = _strike(
+            self.rng, attack - fatigue, damage - fatigue,
+            np.where(self.stunned2[rows, enemies], classic.STUN_DEFENSE, defense - wounds), toughness - wounds,
+            wounds, self.minion2,
+        )
+        self.alive2[rows[killed], enemies[killed]] = False
+        hurt = new_wounds > 0
+        rows, enemies = rows[hurt], enemies[hurt]
+        self.wounds2[rows, enemies] += new_wounds[hurt]
+        _, overexertion, never_stunned = self.flags2
+        if never_stunned:
+            pass  # Ποτέ εμβρόντητος: ούτε κόπωση ούτε χαμένες σειρές
+        elif overexertion:
+            self.fatigue2[rows, enemies] += 1
+        else:
+            self.stunned2[rows, enemies] = True
+        return killed
+
+    def enemy_attacks(self, rows, enemies):
+        """Ο αντίπαλος enemies[i] επιτίθεται στον Χαρακτήρα 1 της μάχης rows[i] - επιστρέφει πού σκοτώθηκε"""
+        attack, damage, _, _ = self.char2
+        _, _, defense, toughness = self.char1
+        fatigue = _fatigue_penalty(self.fatigue2[rows, enemies], self.flags2[0])
+        wounds = self.wounds1[rows]
+        killed, new_wounds = _strike(
+            self.rng, attack - fatigue, damage - fatigue,
+            np.where(self.stunned1[rows], classic.STUN_DEFENSE, defense - wounds - self.penalty[rows]), toughness - wounds,
+            wounds, False,  # Ο Χαρακτήρας 1 δεν είναι ποτέ τσιράκι
+        )
+        hurt = new_wounds > 0
+        rows = rows[hurt]
+        self.wounds1[rows] += new_wounds[hurt]
+        _, overexertion, never_stunned = self.flags1
+        if never_stunned:
+            pass
+        elif overexertion:
+            self.fatigue1[rows] += 1
+        else:
+            self.stunned1[rows] = True
+        return killed
+
+
+def _run_1vMany(rng, config, n):
+    engaged = max(1, min(config["char2_engaged"], config["char2_number"]))  # Όπως η AliveSet
+    horde = _Horde(rng, config, n)
+    winners = np.zeros(n, dtype=np.int8)
+    rounds = np.full(n, MAX_ROUNDS, dtype=np.int32)  # Όσες δεν τελειώσουν: ισοπαλία στους MAX_ROUNDS γύρους
+
+    # Η ζαριά πρωτοβουλίας της simulate_1vMany_silent δεν επηρεάζει τη μάχη - δεν χρειάζεται
+    for round_count in range(1, MAX_ROUNDS + 1):
+        # Νίκη όταν δεν έμεινε κανένας ζωντανός αντίπαλος
+        won = ~horde.alive2.any(axis=1)
+        winners[horde.ids[won]] = 1
+        rounds[horde.ids[won]] = round_count
+        horde.keep(~won)
+        if not horde.ids.size:
+            break
+
+        rows = np.arange(horde.ids.size)
+        window, count = horde.window(engaged)
+        horde.penalty = np.minimum(count - 1, 5)  # -1 για κάθε εχθρό μετά τον πρώτο, μέχρι -5
+        target = window[rows, rng.integers(0, count)]
+        running = np.ones(rows.size, dtype=bool)
+
+        # Ο Χαρακτήρας 1 επιτίθεται στον στόχο → ο στόχος αντεπιτίθεται (αν δεν πέθανε)
+        survived = ~horde.char1_attacks(rows, target)
+        counter_rows = rows[survived]
+        running[counter_rows[horde.enemy_attacks(counter_rows, target[survived])]] = False
+
+        # Όλοι οι ΥΠΟΛΟΙΠΟΙ engaged εχθροί επιτίθενται → ο Χαρακτήρας 1 αντεπιτίθεται
+        window, count = horde.window(engaged)
+        for slot in range(engaged):
+            slot_rows = np.flatnonzero(running & (slot < count) & (window[:, slot] != target))
+            enemies = window[slot_rows, slot]
+            char1_killed = horde.enemy_attacks(slot_rows, enemies)
+            running[slot_rows[char1_killed]] = False
+            # Αντεπίθεση αν ο Χαρακτήρας 1 δεν πέθανε και δεν είναι stunned
+            counter = ~char1_killed & ~horde.stunned1[slot_rows]
+            horde.char1_attacks(slot_rows[counter], enemies[counter])
+
+        lost = ~running
+        winners[horde.ids[lost]] = 2
+        rounds[horde.ids[lost]] = round_count
+        horde.keep(running)
+
+    return winners, rounds
+
+
+def _stats_from_arrays(winners, rounds):
+    stats = BattleStats()
+    if winners.size == 0:
+        return stats
+    stats.battles = int(winners.size)
+    stats.char1_wins = int(np.count_nonzero(winners == 1))
+    stats.char2_wins = int(np.count_nonzero(winners == 2))
+    stats.draws = int(np.count_nonzero(winners == 0))
+    stats.total_rounds = int(rounds.sum())
+    stats.min_rounds = int(rounds.min())
+    stats.max_rounds = int(rounds.max())
+    return stats
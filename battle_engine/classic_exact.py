@@ -0,0 +1,145 @@
+"""Ακριβής υπολογισμός μάχης 1v1 του κλασικού συστήματος (αλυσίδα Markov).
+
+Η κατάσταση της μάχης είναι πεπερασμένη: ποιος επιτίθεται, αν είναι η πρώτη
+κίνηση, πόσες επιθέσεις έκανε ο τρέχων παίκτης και για κάθε χαρακτήρα
+(λαβωματιές, κόπωση, stunned_turns, defense_penalty). Οι πιθανότητες κάθε
+ζαριάς d20 εναντίον d20 είναι κλειστές, οπότε η κατανομή των καταστάσεων
+προχωράει κίνηση-κίνηση μέχρι το όριο των 400 κινήσεων της simulate_1v1_silent.
+"""
+
+from . import classic
+from .common import ExactResult, full_config
+from .tables import damage_bands, opposed_at_least
+
+MAX_TURNS = 400  # Ίδιο safety limit με την simulate_1v1_silent
+
+
+class _Fighter:
+    """Οι σταθερές ενός χαρακτήρα - η κατάστασή του είναι tuple (λαβωματιές, κόπωση, stun, penalty)"""
+
+    def __init__(self, stats, indomitable, overexertion, never_stunned, is_minion=False):
+        self.base = tuple(stats[name] for name in ("Επίθεση", "Ζημιά", "Άμυνα", "Αντοχή"))
+        self.indomitable = indomitable
+        self.overexertion = overexertion
+        self.never_stunned = never_stunned
+        self.is_minion = is_minion
+
+    def effective_stats(self, state):
+        """(Επίθεση, Ζημιά, Άμυνα, Αντοχή) σε αυτή την κατάσταση - classic.effective_stats"""
+        wounds, fatigue, _, defense_penalty = state
+        return classic.effective_stats(self.base, wounds, fatigue, self.indomitable, defense_penalty)
+
+    def wounded(self, state, wounds):
+        """Η κατάσταση μετά από λαβωματιές (Character.add_wound / add_fatigue)"""
+        old_wounds, fatigue, stunned_turns, defense_penalty = state
+        if self.never_stunned:
+            pass
+        elif not self.overexertion:
+            stunned_turns, defense_penalty = classic.STUN_TURNS, classic.STUN_DEFENSE
+        else:
+            fatigue += 1
+        return (old_wounds + wounds, fatigue, stunned_turns, defense_penalty)
+
+
+def _next_player(attacker, is_first_turn, attacks):
+    """Καθορισμός επόμενου παίκτη: η πρώτη κίνηση είναι μονή, όλες οι άλλες διπλές"""
+    if is_first_turn or attacks >= 2:
+        return 1 - attacker, False, 0
+    return attacker, False, attacks
+
+
+def _transitions(fighters, state):
+    """Επιστρέφει ([(επόμενη κατάσταση, πιθανότητα)], πιθανότητα να σκοτώσει ο επιτιθέμενος)"""
+    attacker, is_first_turn, attacks, states = state
+    defender = 1 - attacker
+    att, dfn = fighters[attacker], fighters[defender]
+    att_state, def_state = states[attacker], states[defender]
+
+    if att_state[2] > 0:
+        # Stunned: χάνει τη σειρά του
+        wounds, fatigue, stunned_turns, defense_penalty = att_state
+        stunned_turns -= 1
+        if stunned_turns == 0:
+            defense_penalty = 0
+        new_states = list(states)
+        new_states[attacker] = (wounds, fatigue, stunned_turns, defense_penalty)
+        if is_first_turn or attacks >= 2:
+            next_state = (defender, False, 0, tuple(new_states))
+        else:
+            next_state = (attacker, False, attacks + 1, tuple(new_states))
+        return [(next_state, 1.0)], 0.0
+
+    attacks += 1
+    attack, damage, _, _ = att.effective_stats(att_state)
+    _, _, defense, toughness = dfn.effective_stats(def_state)
+    p_hit = opposed_at_least(defense - attack)
+    offset = toughness - damage
+    p_diff10, p_diff5, p_diff0 = damage_bands(offset)
+
+    outcomes = []
+    if dfn.is_minion or def_state[0] >= 2:
+        # Τσιράκι ή είχε ήδη >=2 λαβωματιές: πεθαίνει με οποιαδήποτε ζημιά
+        p_kill = p_hit * p_diff0
+    else:
+        p_kill = p_hit * p_diff10
+        outcomes.append((dfn.wounded(def_state, 2), p_hit * (p_diff5 - p_diff10)))
+        outcomes.append((dfn.wounded(def_state, 1), p_hit * (p_diff0 - p_diff5)))
+    outcomes.append((def_state, 1.0 - p_kill - sum(p for _, p in outcomes)))
+
+    next_attacker, next_first, next_attacks = _next_player(attacker, is_first_turn, attacks)
+    result = []
+    for new_def_state, probability in outcomes:
+        if probability <= 0:
+            continue
+        new_states = list(states)
+        new_states[defender] = new_def_state
+        result.append(((next_attacker, next_first, next_attacks, tuple(new_states)), probability))
+    return result, p_kill
+
+
+def _initiative(init1, init2):
+    """Πιθανότητα να παίξει πρώτος ο χαρακτήρας 1 (οι ισοβαθμίες ξαναρίχνονται)"""
+    p1 = opposed_at_least(init2 - init1 + 1)
+    p2 = opposed_at_least(init1 - init2 + 1)
+    return p1 / (p1 + p2)
+
+
+def solve(config):
+    """Ακριβείς πιθανότητες νίκης/ισοπαλίας και κατανομή γύρων μιας μάχης 1v1 - επιστρέφει ExactResult"""
+    config = full_config(classic.BattleEngine, config)
+    if config["char2_number"] != 1:
+        raise ValueError("Ο ακριβής υπολογισμός υποστηρίζει μόνο μάχες 1v1")
+
+    stats1, stats2 = config["char1_stats"], config["char2_stats"]
+    fighters = (
+        _Fighter(stats1, config["char1_indomitable"], config["char1_overexertion"], config["char1_never_stunned"]),
+        _Fighter(stats2, config["char2_indomitable"], config["char2_overexertion"], config["char2_never_stunned"], config["char2_minion"]),
+    )
+    fresh = (0, 0, 0, 0)
+    p_first = _initiative(stats1["Πρωτοβουλία"], stats2["Πρωτοβουλία"])
+    distribution = {}
+    for attacker, probability in ((0, p_first), (1, 1.0 - p_first)):
+        if probability > 0:
+            distribution[(attacker, True, 0, (fresh, fresh))] = probability
+
+    result = ExactResult()
+    cache = {}
+    for turn in range(1, MAX_TURNS + 1):
+        rounds = max(1, turn // 4)
+        next_distribution = {}
+        for state, probability in distribution.items():
+            if state not in cache:
+                cache[state] = _transitions(fighters, state)
+            outcomes, p_kill = cache[state]
+            if p_kill > 0:
+                result.add(state[0] + 1, rounds, probability * p_kill)
+            for next_state, p in outcomes:
+                next_distribution[next_state] = next_distribution.get(next_state, 0.0) + probability * p
+        distribution = next_distribution
+        if not distribution:
+            break
+
+    remaining = sum(distribution.values())
+    if remaining > 0:
+        result.add(0, max(1, MAX_TURNS // 4), remaining)  # Ισοπαλία στο όριο κινήσεων
+    return result
@@ -0,0 +1,234 @@
+"""Εκτέλεση μαχών από τη γραμμή εντολών, χωρίς γραφικό περιβάλλον.
+
+    python -m battle_engine classic --char1 Πρωτοβουλία=1,Επίθεση=3,Ζημιά=2,Άμυνα=2,Αντοχή=1 \\
+        --char2 Πρωτοβουλία=0,Επίθεση=2,Ζημιά=3,Άμυνα=1,Αντοχή=2 -n 100000 --seed 1
+    python -m battle_engine adnd --config matchups.json --workers 4 --format json
+    python -m battle_engine adnd --config matchups.json -n 100000 --seed 7 --replay 4711
+
+Το αρχείο --config (JSON ή YAML, "-" για stdin) περιέχει ένα config, δηλαδή
+τα ορίσματα της simulate_battle_silent, ή μια λίστα από configs. Τα --char1,
+--char2 και --set συμπληρώνουν ή αλλάζουν κάθε config. Κλειδιά που δεν είναι
+ορίσματα της simulate_battle_silent απορρίπτονται, όπως και char2_number ή
+char2_engaged μικρότερα από 1.
+
+Με --detailed τυπώνονται και εκατοστημόρια γύρων, τυπική απόκλιση και η
+κατάσταση του νικητή στο τέλος της μάχης (aggregate.BattleAggregate). Με
+--export ΦΑΚΕΛΟΣ γράφεται και μία γραμμή ανά μάχη (export.simulate), σε
+υποφακέλους 0, 1, ... όταν υπάρχουν πολλά configs. Με --instrument τυπώνονται
+και ζαριές, επιθέσεις κ.λπ. ανά μάχη και ο χρόνος κάθε φάσης (instrument.Profile),
+με --tracemalloc και η μνήμη ανά μάχη.
+
+Χωρίς --seed επιλέγεται τυχαίο seed, που τυπώνεται μαζί με τα αποτελέσματα:
+με το ίδιο seed, το ίδιο -n και το --replay ΜΑΧΗ ξανατρέχει μία μάχη ακριβώς.
+Τα --detailed, --export και --instrument τρέχουν πάντα την απλή μηχανή, ενώ
+χωρίς --generator το κλασικό τρέχει την classic_batch: τυπώνεται και η
+γεννήτρια τους, που πρέπει να δοθεί και στο --replay.
+"""
+
+import argparse
+import json
+import os
+import random
+import sys
+
+from . import RULE_SYSTEMS, aggregate, export, get_rule_system, instrument, parallel
+from .cache import ResultCache, format_cached
+from .common import format_summary, full_config
+from .rng import DEFAULT_GENERATOR, GENERATORS
+
+try:
+    import yaml
+except ImportError:  # Το YAML είναι προαιρετικό - το JSON δουλεύει πάντα
+    yaml = None
+
+
+def parse_value(text):
+    """Τιμή από τη γραμμή εντολών: αριθμός, true/false ή κείμενο (π.χ. "1d8")"""
+    try:
+        return json.loads(text)
+    except ValueError:
+        return text
+
+
+def parse_pairs(text):
+    """ "Επίθεση=3,Ζημιά=2" -> {"Επίθεση": 3, "Ζημιά": 2}"""
+    result = {}
+    for pair in text.split(","):
+        if not pair.strip():
+            continue
+        name, sep, value = pair.partition("=")
+        if not sep:
+            raise argparse.ArgumentTypeError(f"Αναμενόταν όνομα=τιμή: {pair}")
+        result[name.strip()] = parse_value(value.strip())
+    return result
+
+
+def load_configs(path):
+    """Διαβάζει ένα config ή μια λίστα από configs από αρχείο JSON/YAML - επιστρέφει λίστα"""
+    if path == "-":
+        text = sys.stdin.read()
+    else:
+        with open(path, encoding="utf-8") as f:
+            text = f.read()
+    if path.endswith((".yaml", ".yml")):
+        if yaml is None:
+            raise ValueError("Τα αρχεία YAML απαιτούν PyYAML")
+        data = yaml.safe_load(text)
+    else:
+        data = json.loads(text)
+    configs = data if isinstance(data, list) else [data]
+    if not configs or not all(isinstance(config, dict) for config in configs):
+        raise ValueError("Το αρχείο πρέπει να περιέχει ένα config ή μια μη κενή λίστα από configs")
+    return configs
+
+
+def build_configs(args):
+    """Τα configs της εκτέλεσης, από το --config και τα --char1/--char2/--set"""
+    configs = load_configs(args.config) if args.config else [{}]
+    module = get_rule_system(args.system)
+    text_stats = getattr(module, "TEXT_STATS", [])
+    result = []
+    for config in configs:
+        config = dict(config)
+        for key, overrides in (("char1_stats", args.char1), ("char2_stats", args.char2)):
+            stats = dict(config.get(key, {}))
+            stats.update(overrides)
+            missing = [name for name in module.STATS if name not in stats]
+            if missing:
+                raise ValueError(f"{key}: λείπουν τα στατιστικά {', '.join(missing)}")
+            for name in text_stats:
+                stats[name] = str(stats[name])
+            config[key] = stats
+        config.update(args.set)
+        full = full_config(module.BattleEngine, config)  # ValueError για άγνωστα ορίσματα
+        for key in ("char2_number", "char2_engaged"):
+            if key in full and (not isinstance(full[key], int) or full[key] < 1):
+                raise ValueError(f"{key}: πρέπει να είναι ακέραιος από 1 και πάνω")
+        result.append(config)
+    return result
+
+
+def run(args, config, directory=None):
+    """Εκτελεί τις μάχες ενός config - επιστρέφει BattleStats
+
+    directory: φάκελος για την εξαγωγή μίας γραμμής ανά μάχη (--export)
+    """
+    if directory is not None:
+        return export.simulate(args.system, config, args.battles, directory, args.export_format, args.seed,
+                               args.workers, generator=args.generator)
+    if args.detailed:
+        return aggregate.simulate(args.system, config, args.battles, args.workers, args.seed, generator=args.generator)
+    if args.cache:
+        return ResultCache().simulate(args.system, config, args.battles, args.workers)
+    return parallel.simulate(args.system, config, args.battles, args.workers, args.seed, generator=args.generator)
+
+
+def replay(args, config):
+    """Ξανατρέχει τη μάχη --replay μιας εκτέλεσης - επιστρέφει dict για το output"""
+    winner, rounds = parallel.replay(args.system, config, args.battles, args.seed, args.replay, generator=args.generator)
+    return {"battle": args.replay, "winner": winner, "rounds": rounds}
+
+
+def format_replay(result):
+    winner = f"Χαρακτήρας {result['winner']}" if result["winner"] else "Ισοπαλία"
+    return f"Μάχη {result['battle']}: {winner} σε {result['rounds']} γύρους\n"
+
+
+def make_parser():
+    parser = argparse.ArgumentParser(
+        prog="python -m battle_engine",
+        description="Εκτελεί μάχες ενός συστήματος κανόνων και τυπώνει τα αποτελέσματα.",
+    )
+    parser.add_argument("system", choices=list(RULE_SYSTEMS), help="σύστημα κανόνων")
+    parser.add_argument("--config", metavar="ΑΡΧΕΙΟ", help="config ή λίστα από configs σε JSON/YAML (- για stdin)")
+    parser.add_argument("--char1", type=parse_pairs, default={}, metavar="ΣΤΑΤ=ΤΙΜΗ,...", help="στατιστικά Χαρακτήρα 1")
+    parser.add_argument("--char2", type=parse_pairs, default={}, metavar="ΣΤΑΤ=ΤΙΜΗ,...", help="στατιστικά Χαρακτήρα 2")
+    parser.add_argument("--set", type=parse_pairs, default={}, metavar="ΟΡΙΣΜΑ=ΤΙΜΗ,...",
+                        help="άλλα ορίσματα της simulate_battle_silent, π.χ. char2_number=3,char1_indomitable=true")
+    parser.add_argument("-n", "--battles", type=int, default=1000, help="αριθμός μαχών (προεπιλογή 1000)")
+    parser.add_argument("--workers", type=int, help="διεργασίες (προεπιλογή: όλοι οι πυρήνες)")
+    parser.add_argument("--seed", type=int, help="seed για επαναλήψιμα αποτελέσματα")
+    parser.add_argument("--cache", action="store_true", help="χρήση της cache αποτελεσμάτων (αγνοεί το --seed, χωρίς --generator)")
+    parser.add_argument("--generator", choices=list(GENERATORS), help="γεννήτρια τυχαίων αριθμών (προεπιλογή: dice)")
+    parser.add_argument("--replay", type=int, metavar="ΜΑΧΗ",
+                        help="ξανατρέχει μόνο τη μάχη με αυτόν τον αριθμό (0 έως -n μείον 1) - απαιτεί --seed")
+    parser.add_argument("--detailed", action="store_true",
+                        help="εκατοστημόρια γύρων και κατάσταση του νικητή (τρέχει την απλή μηχανή, χωρίς cache)")
+    parser.add_argument("--export", metavar="ΦΑΚΕΛΟΣ",
+                        help="γράφει μία γραμμή ανά μάχη σε αυτόν τον φάκελο (τρέχει την απλή μηχανή, χωρίς cache)")
+    parser.add_argument("--export-format", choices=list(export.FORMATS),
+                        help="μορφή του --export (προεπιλογή: parquet με pyarrow, αλλιώς npz με numpy, αλλιώς csv)")
+    parser.add_argument("--instrument", action="store_true",
+                        help="ζαριές, επιθέσεις κ.λπ. ανά μάχη και χρόνος ανά φάση (μία διεργασία, χωρίς cache)")
+    parser.add_argument("--tracemalloc", action="store_true", help="όπως το --instrument, μαζί με τη μνήμη ανά μάχη (αργό)")
+    parser.add_argument("--format", choices=["text", "json"], default="text", help="μορφή εξόδου")
+    return parser
+
+
+def main(argv=None):
+    parser = make_parser()
+    args = parser.parse_args(argv)
+    if args.battles < 0:
+        parser.error("ο αριθμός μαχών δεν μπορεί να είναι αρνητικός")
+    if args.replay is not None:
+        if args.seed is None or args.cache:
+            parser.error("το --replay απαιτεί --seed και δεν συνδυάζεται με --cache")
+        if not 0 <= args.replay < args.battles:
+            parser.error(f"το --replay πρέπει να είναι από 0 έως {args.battles - 1}")
+    if args.detailed and args.cache:
+        parser.error("το --detailed δεν συνδυάζεται με --cache")
+    if args.generator and args.cache:
+        parser.error("το --generator δεν συνδυάζεται με --cache (η cache έχει μάχες μόνο της προεπιλεγμένης γεννήτριας)")
+    if args.export and (args.cache or args.detailed or args.replay is not None):
+        parser.error("το --export δεν συνδυάζεται με --cache, --detailed ή --replay")
+    args.instrument = args.instrument or args.tracemalloc
+    if args.instrument and (args.cache or args.detailed or args.export or args.replay is not None):
+        parser.error("το --instrument δεν συνδυάζεται με --cache, --detailed, --export ή --replay")
+    if args.detailed or args.export or args.instrument:
+        args.generator = args.generator or DEFAULT_GENERATOR  # Για το --replay των ίδιων μαχών
+    if args.seed is None and not args.cache:
+        args.seed = random.SystemRandom().getrandbits(64)  # Τυπώνεται, για να μπορεί να επαναληφθεί η εκτέλεση
+    try:
+        configs = build_configs(args)
+    except (OSError, ValueError) as e:
+        parser.error(str(e))
+
+    results = []
+    for index, config in enumerate(configs):
+        if args.replay is not None:
+            result = replay(args, config)
+            if args.format == "json":
+                results.append({"system": args.system, "config": config, "seed": args.seed, **result})
+            else:
+                print(format_replay(result))
+            continue
+        directory = args.export
+        if directory and len(configs) > 1:
+            directory = os.path.join(directory, str(index))
+        profile = None
+        if args.instrument:
+            stats, profile = instrument.simulate(args.system, config, args.battles, args.seed, args.generator,
+                                                 args.tracemalloc)
+        else:
+            stats = run(args, config, directory)
+        if args.format == "json":
+            results.append({"system": args.system, "config": config, "seed": args.seed, "generator": args.generator,
+                            **stats.to_dict()})
+            if profile is not None:
+                results[-1]["instrumentation"] = profile.to_dict()
+        else:
+            if args.cache:
+                print(format_cached(stats, args.battles), end="")
+            print(format_summary(stats, config.get("char2_number", 1)))
+            if args.detailed:
+                print(aggregate.format_aggregate(stats, config.get("char2_number", 1)))
+            if profile is not None:
+                print(instrument.format_profile(profile))
+            if args.seed is not None:
+                generator = f" (--generator {args.generator})" if args.generator else ""
+                print(f"Seed: {args.seed}{generator}\n")
+
+    if args.format == "json":
+        json.dump(results if len(results) > 1 else results[0], sys.stdout, ensure_ascii=False, indent=2)
+        print()
+    return 0
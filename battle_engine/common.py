@@ -0,0 +1,177 @@
+import inspect
+
+
+class BattleStats:
+    """Συγκεντρωτικά αποτελέσματα πολλών μαχών (νίκες, ισοπαλίες, γύροι)"""
+
+    def __init__(self):
+        self.battles = 0
+        self.char1_wins = 0
+        self.char2_wins = 0
+        self.draws = 0
+        self.total_rounds = 0
+        self.min_rounds = float('inf')
+        self.max_rounds = 0
+
+    def add(self, winner, rounds, end_state=None):
+        """Καταγράφει το αποτέλεσμα μιας μάχης (winner: 1, 2 ή 0 για ισοπαλία)
+
+        Το end_state (ό,τι δίνει η battle_details) δεν κρατιέται εδώ - βλ. aggregate.BattleAggregate.
+        """
+        self.battles += 1
+        self.total_rounds += rounds
+        self.min_rounds = min(self.min_rounds, rounds)
+        self.max_rounds = max(self.max_rounds, rounds)
+        if winner == 1:
+            self.char1_wins += 1
+        elif winner == 2:
+            self.char2_wins += 1
+        else:
+            self.draws += 1
+
+    def battle_details(self, engine):
+        """Συνάρτηση (νικητής) -> end_state της add για τη μάχη που μόλις έτρεξε η engine, ή None
+
+        Το BattleStats δεν χρειάζεται τίποτα πέρα από νικητή και γύρους.
+        """
+        return None
+
+    def merge(self, other):
+        """Προσθέτει τα αποτελέσματα ενός άλλου BattleStats"""
+        self.battles += other.battles
+        self.char1_wins += other.char1_wins
+        self.char2_wins += other.char2_wins
+        self.draws += other.draws
+        self.total_rounds += other.total_rounds
+        self.min_rounds = min(self.min_rounds, other.min_rounds)
+        self.max_rounds = max(self.max_rounds, other.max_rounds)
+        return self
+
+    def avg_rounds(self):
+        return self.total_rounds / self.battles if self.battles else 0.0
+
+    def to_dict(self):
+        return {
+            "battles": self.battles,
+            "char1_wins": self.char1_wins,
+            "char2_wins": self.char2_wins,
+            "draws": self.draws,
+            "total_rounds": self.total_rounds,
+            "min_rounds": self.min_rounds if self.battles else None,
+            "max_rounds": self.max_rounds,
+            "avg_rounds": self.avg_rounds(),
+        }
+
+
+def full_config(engine_cls, config):
+    """Συμπληρώνει το config με τις προεπιλογές της simulate_battle_silent
+
+    Κλειδιά που δεν είναι ορίσματά της δίνουν ValueError, όπως θα απέρριπτε
+    το config και η ίδια η simulate_battle_silent.
+    """
+    params = inspect.signature(engine_cls.simulate_battle_silent).parameters
+    unknown = [name for name in config if name not in params or name == "self"]
+    if unknown:
+        raise ValueError(f"Άγνωστα ορίσματα της simulate_battle_silent: {', '.join(unknown)}")
+    result = {name: p.default for name, p in params.items() if p.default is not inspect.Parameter.empty}
+    result.update(config)
+    return result
+
+
+def run_battles(battle_fn, config, n, stats=None, engine=None):
+    """Εκτελεί n μάχες με τη battle_fn(**config) -> (νικητής, γύροι)
+
+    engine: η μηχανή της battle_fn - το stats.battle_details(engine) ορίζει τι
+    επιπλέον περνάει στο stats.add για κάθε μάχη (π.χ. BattleEngine.end_state).
+    """
+    if stats is None:
+        stats = BattleStats()
+    end_state = stats.battle_details(engine) if engine is not None else None
+    if end_state is None:
+        for _ in range(n):
+            winner, rounds = battle_fn(**config)
+            stats.add(winner, rounds)
+    else:
+        for _ in range(n):
+            winner, rounds = battle_fn(**config)
+            stats.add(winner, rounds, end_state(winner))
+    return stats
+
+
+def format_summary(stats, char2_number=1, show_draws=True):
+    """Το κείμενο αποτελεσμάτων που εμφανίζουν τα κουμπιά 1000/100000 μάχες"""
+    n = stats.battles
+    if n == 0:
+        return "Δεν ολοκληρώθηκε καμία μάχη.\n"
+    result = f"=== ΑΠΟΤΕΛΕΣΜΑΤΑ {n} ΜΑΧΩΝ ===\n"
+    if char2_number > 1:
+        result += f"(Χαρακτήρας 1 εναντίον {char2_number} αντιπάλων)\n"
+    result += "\n"
+    result += f"Χαρακτήρας 1: {stats.char1_wins} νίκες ({stats.char1_wins * 100 / n:.1f}%)\n"
+    if char2_number == 1:
+        result += f"Χαρακτήρας 2: {stats.char2_wins} νίκες ({stats.char2_wins * 100 / n:.1f}%)\n"
+    else:
+        result += f"Οι αντίπαλοι: {stats.char2_wins} νίκες ({stats.char2_wins * 100 / n:.1f}%)\n"
+    if show_draws and stats.draws > 0:
+        result += f"Ισοπαλίες: {stats.draws} ({stats.draws * 100 / n:.1f}%)\n"
+    result += f"Μέσος όρος γύρων ανά μάχη: {stats.avg_rounds():.2f} (εύρος: {stats.min_rounds}-{stats.max_rounds})\n\n"
+
+    if stats.char1_wins > stats.char2_wins:
+        result += f"🏆 Συνολικός νικητής: Χαρακτήρας 1! 🏆\n"
+    elif stats.char2_wins > stats.char1_wins:
+        if char2_number == 1:
+            result += f"🏆 Συνολικός νικητής: Χαρακτήρας 2! 🏆\n"
+        else:
+            result += f"🏆 Συνολικοί νικητές: Οι αντίπαλοι! 🏆\n"
+    else:
+        result += "🤝 Ισοπαλία! 🤝\n"
+
+    return result
+
+
+class ExactResult:
+    """Ακριβείς πιθανότητες μιας μάχης 1v1 (χωρίς δειγματοληψία)"""
+
+    def __init__(self):
+        self.char1_win = 0.0
+        self.char2_win = 0.0
+        self.draw = 0.0
+        self.rounds = {}  # γύροι -> πιθανότητα
+
+    def add(self, winner, rounds, probability):
+        """Καταγράφει την πιθανότητα να τελειώσει η μάχη με αυτόν τον νικητή σε τόσους γύρους"""
+        if winner == 1:
+            self.char1_win += probability
+        elif winner == 2:
+            self.char2_win += probability
+        else:
+            self.draw += probability
+        self.rounds[rounds] = self.rounds.get(rounds, 0.0) + probability
+
+    def avg_rounds(self):
+        total = sum(self.rounds.values())
+        return sum(r * p for r, p in self.rounds.items()) / total if total else 0.0
+
+    def to_dict(self):
+        return {
+            "char1_win": self.char1_win,
+            "char2_win": self.char2_win,
+            "draw": self.draw,
+            "avg_rounds": self.avg_rounds(),
+            "rounds": dict(sorted(self.rounds.items())),
+        }
+
+
+def format_exact(result, show_draws=True):
+    """Το κείμενο του κουμπιού ακριβούς υπολογισμού"""
+    text = "=== ΑΚΡΙΒΕΙΣ ΠΙΘΑΝΟΤΗΤΕΣ ===\n\n"
+    text += f"Χαρακτήρας 1: {result.char1_win * 100:.2f}%\n"
+    text += f"Χαρακτήρας 2: {result.char2_win * 100:.2f}%\n"
+    if show_draws and result.draw >= 0.00005:  # Μόνο αν φαίνεται με 2 δεκαδικά
+        text += f"Ισοπαλία: {result.draw * 100:.2f}%\n"
+    text += f"Μέσος όρος γύρων ανά μάχη: {result.avg_rounds():.2f}\n\n"
+    text += "Γύροι: πιθανότητα\n"
+    for r in sorted(result.rounds):
+        if result.rounds[r] >= 0.0005:  # Μόνο όσοι φαίνονται με 1 δεκαδικό
+            text += f"  {r}: {result.rounds[r] * 100:.1f}%\n"
+    return text
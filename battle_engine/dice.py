@@ -0,0 +1,136 @@
+"""Γρήγορα ζάρια για όλες τις μηχανές.
+
+Κάθε ζαριά των κανόνων είναι rng.randint(1, N) (d6, d10, d20, dN για τους
+πόντους ζωής) και η random.Random.randint περνάει από randrange και
+_randbelow σε κάθε κλήση. Η DiceSource παράγει μονομιάς μπλοκ από ζαριές
+κάθε dN (τυχαία bytes από το getrandbits, με απόρριψη όσων θα έδιναν
+ανομοιόμορφα αποτελέσματα) και τις μοιράζει μία-μία από μια λίστα.
+
+    python -m battle_engine.dice    # Ταχύτητα κάθε μηχανής με random.Random και με DiceSource
+"""
+
+import functools
+import random
+import time
+
+from . import RULE_SYSTEMS, get_rule_system
+
+BLOCK_SIZE = 4096  # Ζαριές ανά μπλοκ
+MAX_SIDES = 255  # Μεγαλύτερο ζάρι από μπλοκ - κάθε ζαριά είναι ένα byte
+
+# Χαρακτήρες για το benchmark, ανά σύστημα κανόνων
+BENCHMARK_STATS = {
+    "classic": (
+        {"Πρωτοβουλία": 1, "Επίθεση": 3, "Ζημιά": 2, "Άμυνα": 2, "Αντοχή": 1},
+        {"Πρωτοβουλία": 0, "Επίθεση": 2, "Ζημιά": 3, "Άμυνα": 1, "Αντοχή": 2},
+    ),
+    "kryptes": (
+        {"Πόντοι αντοχής": "3d6+2", "Ζαριά μάχης": 7, "Ζαριά ζημιάς": "1D6+1", "Θωράκιση": 1,
+         "Ασπίδες/γύρο": 1, "Αριθμός επιθέσεων": "3/2"},
+        {"Πόντοι αντοχής": "2d6", "Ζαριά μάχης": 6, "Ζαριά ζημιάς": "2D6", "Θωράκιση": 0,
+         "Ασπίδες/γύρο": 0, "Αριθμός επιθέσεων": "1"},
+    ),
+    "adnd": (
+        {"Initiative": 1, "Hit points": "4d8", "AC": 4, "THAC0": 15, "Attack bonus": 1,
+         "Damage die": "1d8+1", "Number of attacks": "5/2"},
+        {"Initiative": 0, "Hit points": "2d8", "AC": 6, "THAC0": 19, "Attack bonus": 0,
+         "Damage die": "1d6", "Number of attacks": "1"},
+    ),
+    "alternative": ({"Μάχη": 3, "Ζημιά": 2, "Αντοχή": 2}, {"Μάχη": 2, "Ζημιά": 3, "Αντοχή": 1}),
+    "alternative_new": ({"Μάχη": 3, "Ζημιά": 2, "Αντοχή": 2}, {"Μάχη": 2, "Ζημιά": 3, "Αντοχή": 1}),
+    "singleroll": ({"Μάχη": 3, "Ζημιά": 2, "Αντοχή": 2}, {"Μάχη": 2, "Ζημιά": 3, "Αντοχή": 1}),
+}
+
+
+@functools.lru_cache(maxsize=None)
+def _face_table(sides):
+    """Πίνακας bytes.translate για ένα dN: byte -> ζαριά, και τα bytes που απορρίπτονται"""
+    limit = 256 - 256 % sides  # Πάνω από αυτό, κάποιες ζαριές θα έβγαιναν συχνότερα
+    table = bytes(1 + value % sides if value < limit else 0 for value in range(256))
+    return table, bytes(range(limit, 256))
+
+
+class DiceSource(random.Random):
+    """random.Random με γρήγορη randint(1, N) από προ-παραγμένα μπλοκ ζαριών.
+
+    Ένα μπλοκ ανά είδος ζαριού. Η choice σε λίστες έως MAX_SIDES στοιχείων
+    χρησιμοποιεί τα ίδια μπλοκ. Όλα τα άλλα (random, randint με άλλα όρια)
+    είναι του random.Random.
+    """
+
+    def __init__(self, seed=None, block_size=BLOCK_SIZE):
+        self.block_size = block_size
+        self._faces = {}
+        super().__init__(seed)  # Καλεί τη seed
+
+    def seed(self, a=None, version=2):
+        super().seed(a, version)
+        self._faces = {}
+
+    def randint(self, a, b):
+        if a == 1:
+            faces = self._faces.get(b)
+            if faces:
+                return faces.pop()
+            if 1 <= b <= MAX_SIDES:
+                faces = self._faces[b] = self._roll_block(b)
+                return faces.pop()
+        return super().randint(a, b)
+
+    def choice(self, seq):
+        if 0 < len(seq) <= MAX_SIDES:
+            return seq[self.randint(1, len(seq)) - 1]
+        return super().choice(seq)
+
+    def _roll_block(self, sides):
+        """Περίπου block_size ζαριές ενός dN"""
+        table, rejected = _face_table(sides)
+        faces = b""
+        while not faces:
+            faces = self.getrandbits(8 * self.block_size).to_bytes(self.block_size, "little").translate(table, rejected)
+        return list(faces)
+
+    def getstate(self):
+        return super().getstate(), {sides: list(faces) for sides, faces in self._faces.items()}
+
+    def setstate(self, state):
+        source_state, faces = state
+        super().setstate(source_state)
+        self._faces = {sides: list(values) for sides, values in faces.items()}
+
+
+def benchmark(n=10000, seed=1, systems=None, char2_number=3, repeat=3):
+    """Χρόνος n μαχών κάθε συστήματος με random.Random και με DiceSource (ο καλύτερος από repeat)
+
+    Επιστρέφει {σύστημα: (δευτερόλεπτα με random.Random, δευτερόλεπτα με DiceSource)}.
+    """
+    results = {}
+    for system in systems or RULE_SYSTEMS:
+        char1_stats, char2_stats = BENCHMARK_STATS[system]
+        config = {
+            "char1_stats": char1_stats,
+            "char2_stats": char2_stats,
+            "char2_number": char2_number,
+            "char2_engaged": min(2, char2_number),
+        }
+        module = get_rule_system(system)
+        times = [float("inf"), float("inf")]
+        for _ in range(repeat):
+            for i, rng in enumerate((random.Random(seed), DiceSource(seed))):
+                start = time.perf_counter()
+                module.simulate(config, n, rng=rng)
+                times[i] = min(times[i], time.perf_counter() - start)
+        results[system] = tuple(times)
+    return results
+
+
+def format_benchmark(results, n):
+    lines = [f"{'Σύστημα':<16}{'random':>10}{'DiceSource':>12}{'Επιτάχυνση':>12}  ({n} μάχες, s)"]
+    for system, (plain, dice) in results.items():
+        lines.append(f"{system:<16}{plain:>10.3f}{dice:>12.3f}{plain / dice:>11.2f}x")
+    return "\n".join(lines)
+
+
+if __name__ == "__main__":
+    N = 10000
+    print(format_benchmark(benchmark(N), N))
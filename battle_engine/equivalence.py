@@ -0,0 +1,466 @@
+"""Στατιστικός έλεγχος ότι μια γρήγορη μηχανή κρατάει τους κανόνες της απλής.
+
+Οι TableBattleEngine, η classic_batch και οι ακριβείς λύσεις (classic_exact,
+alternative_exact) δίνουν άλλες ζαριές από την απλή μηχανή (BattleEngine με
+random.Random), άρα δεν μπορούν να συγκριθούν μάχη-μάχη: συγκρίνονται οι
+κατανομές. Το golden.json έχει ένα σταθερό σύνολο αναμετρήσεων (CORPUS) με
+τις κατανομές που έδωσε η απλή μηχανή: νικητές και γύροι ανά νικητή. Οι
+αναμετρήσεις διαλέγονται ώστε να περνάνε από τους λεπτούς κανόνες: τσιράκια,
+θάνατος με ζημιά όταν υπάρχουν ήδη 2 λαβωματιές, Ακατάβλητος, stun χωρίς
+υπερπροσπάθεια, ασπίδες με κλασματικές επιθέσεις, αιφνιδιασμός και πρώτο
+χτύπημα, χωρίς καίρια, μάχες 1 vs πολλοί.
+
+Για κάθε αναμέτρηση και μηχανή:
+- outcomes: χ² για νικητή 1 / νικητή 2 / ισοπαλία
+- rounds: χ² για την κοινή κατανομή (νικητής, γύροι), με ενωμένες κατηγορίες
+  ώστε κάθε αναμενόμενη τιμή να είναι τουλάχιστον MIN_EXPECTED
+- ks: Kolmogorov-Smirnov στους γύρους (συντηρητικό για διακριτές τιμές)
+Οι δειγματοληπτικές μηχανές συγκρίνονται με δύο δείγματα, οι ακριβείς ελέγχουν
+αν το golden δείγμα ταιριάζει στις πιθανότητές τους. Ένας έλεγχος αποτυγχάνει
+αν p < alpha / (πλήθος ελέγχων) - διόρθωση Bonferroni για όλη την εκτέλεση.
+
+    python -m battle_engine.equivalence                   # Όλες οι μηχανές
+    python -m battle_engine.equivalence table -n 200000   # Μόνο οι TableBattleEngine
+    python -m battle_engine.equivalence --build           # Ξαναφτιάχνει το golden.json
+
+Το golden.json ξαναφτιάχνεται μόνο όταν αλλάζουν σκόπιμα οι κανόνες (μαζί με
+την ENGINE_VERSION).
+"""
+
+import argparse
+import json
+import math
+import os
+import sys
+from concurrent.futures import ProcessPoolExecutor
+
+from . import ENGINE_VERSION, alternative_exact, classic_batch, classic_exact, get_rule_system
+from .aggregate import BattleAggregate
+from .rng import make_rng, stream_seed
+
+GOLDEN_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), "golden.json")
+REFERENCE_BATTLES = 200000  # Μάχες ανά αναμέτρηση στο golden.json
+REFERENCE_SEED = 1
+REFERENCE_GENERATOR = "random"  # Η γεννήτρια της απλής μηχανής (όχι η DiceSource που ελέγχεται)
+BATTLES = 100000  # Μάχες ανά αναμέτρηση της μηχανής που ελέγχεται
+SEED = 2  # Seed της μηχανής που ελέγχεται (άλλο από το REFERENCE_SEED)
+ALPHA = 0.001  # Για όλη την εκτέλεση (Bonferroni)
+MIN_EXPECTED = 5  # Ελάχιστη αναμενόμενη τιμή ανά κατηγορία του χ²
+
+
+# Οι χαρακτήρες των αναμετρήσεων: (ισχυρός, μέτριος) ανά σύστημα. Είναι
+# δικοί του αρχείου: αν άλλαζαν, το golden.json δεν θα ταίριαζε πια στη CORPUS.
+CORPUS_STATS = {
+    "classic": (
+        {"Πρωτοβουλία": 1, "Επίθεση": 3, "Ζημιά": 2, "Άμυνα": 2, "Αντοχή": 1},
+        {"Πρωτοβουλία": 0, "Επίθεση": 2, "Ζημιά": 3, "Άμυνα": 1, "Αντοχή": 2},
+    ),
+    "kryptes": (
+        {"Πόντοι αντοχής": "3d6+2", "Ζαριά μάχης": 7, "Ζαριά ζημιάς": "1D6+1", "Θωράκιση": 1,
+         "Ασπίδες/γύρο": 1, "Αριθμός επιθέσεων": "3/2"},
+        {"Πόντοι αντοχής": "2d6", "Ζαριά μάχης": 6, "Ζαριά ζημιάς": "2D6", "Θωράκιση": 0,
+         "Ασπίδες/γύρο": 0, "Αριθμός επιθέσεων": "1"},
+    ),
+    "adnd": (
+        {"Initiative": 1, "Hit points": "4d8", "AC": 4, "THAC0": 15, "Attack bonus": 1,
+         "Damage die": "1d8+1", "Number of attacks": "5/2"},
+        {"Initiative": 0, "Hit points": "2d8", "AC": 6, "THAC0": 19, "Attack bonus": 0,
+         "Damage die": "1d6", "Number of attacks": "1"},
+    ),
+    "alternative": ({"Μάχη": 3, "Ζημιά": 2, "Αντοχή": 2}, {"Μάχη": 2, "Ζημιά": 3, "Αντοχή": 1}),
+    "alternative_new": ({"Μάχη": 3, "Ζημιά": 2, "Αντοχή": 2}, {"Μάχη": 2, "Ζημιά": 3, "Αντοχή": 1}),
+    "singleroll": ({"Μάχη": 3, "Ζημιά": 2, "Αντοχή": 2}, {"Μάχη": 2, "Ζημιά": 3, "Αντοχή": 1}),
+}
+
+
+def _case(system, name, char1_stats=None, char2_stats=None, **options):
+    strong, average = CORPUS_STATS[system]
+    config = {"char1_stats": char1_stats or strong, "char2_stats": char2_stats or average}
+    config.update(options)
+    return f"{system}/{name}", system, config
+
+
+_classic, _ = CORPUS_STATS["classic"]
+_kryptes_shields = dict(CORPUS_STATS["kryptes"][1], **{"Ασπίδες/γύρο": 2, "Αριθμός επιθέσεων": "3/2"})
+_adnd_fast = dict(CORPUS_STATS["adnd"][1], **{"Number of attacks": "3/2"})
+
+# (όνομα, σύστημα, config)
+CORPUS = [
+    _case("classic", "1v1"),
+    _case("classic", "1v1-mirror", char2_stats=_classic),
+    _case("classic", "1v1-minion", char2_minion=True),
+    _case("classic", "1v1-indomitable", char1_indomitable=True, char2_indomitable=True),
+    _case("classic", "1v1-stuns", char1_overexertion=False, char2_overexertion=False),
+    _case("classic", "1v1-never-stunned", char1_overexertion=False, char2_never_stunned=True),
+    _case("classic", "1v5", char2_number=5, char2_engaged=2),
+    _case("classic", "1v5-minions-stuns", char1_overexertion=False, char2_number=5, char2_engaged=3,
+          char2_minion=True),
+    _case("kryptes", "1v1"),
+    _case("kryptes", "1v1-shields", char2_stats=_kryptes_shields),
+    _case("kryptes", "1v1-surprise", char2_surprised=True, char1_first_strike=True),
+    _case("kryptes", "1v1-first-strike", char2_stats=_kryptes_shields, char2_first_strike=True),
+    _case("kryptes", "1v4", char2_number=4, char2_engaged=2),
+    _case("kryptes", "1v4-surprised", char1_surprised=True, char2_number=4, char2_engaged=2),
+    _case("adnd", "1v1"),
+    _case("adnd", "1v1-surprised", char2_stats=_adnd_fast, char1_surprised=True),
+    _case("adnd", "1v3", char2_number=3, char2_engaged=2),
+    _case("alternative", "1v1"),
+    _case("alternative", "1v1-minion-no-crit", char2_minion=True, char1_no_crit=True),
+    _case("alternative", "1v4", char2_number=4, char2_engaged=2, char2_no_crit=True),
+    _case("alternative_new", "1v1"),
+    _case("alternative_new", "1v1-minion", char2_minion=True),
+    _case("alternative_new", "1v4", char2_number=4, char2_engaged=2),
+    _case("singleroll", "1v1"),
+    _case("singleroll", "1v4-minions", char2_number=4, char2_engaged=3, char2_minion=True),
+]
+
+
+# Μηχανές: (σύστημα, config, n, seed) -> BattleAggregate, ExactResult ή None αν δεν εφαρμόζεται
+
+def scalar_engine(system, config, n, seed):
+    """Η απλή μηχανή με random.Random - αυτή που έφτιαξε το golden.json
+
+    Ούτε η DiceSource (η προεπιλεγμένη γεννήτρια) ούτε η TableBattleEngine:
+    το golden πρέπει να μην εξαρτάται από καμία βελτιστοποίηση που ελέγχεται.
+    """
+    module = get_rule_system(system)
+    return module.simulate(config, n, rng=make_rng(seed, generator=REFERENCE_GENERATOR), stats=BattleAggregate(),
+                           engine_class=module.BattleEngine)
+
+
+def table_engine(system, config, n, seed):
+    """Η μηχανή της simulate του συστήματος (TableBattleEngine όπου υπάρχει)"""
+    return get_rule_system(system).simulate(config, n, rng=make_rng(seed), stats=BattleAggregate())
+
+
+def batch_engine(system, config, n, seed):
+    """Η διανυσματική classic_batch"""
+    if system != "classic" or not classic_batch.supports(config):
+        return None
+    return BattleAggregate().add_arrays(*classic_batch.battle_results(config, n, seed))
+
+
+def exact_engine(system, config, n, seed):
+    """Οι ακριβείς λύσεις των μαχών 1v1"""
+    if config.get("char2_number", 1) != 1:
+        return None
+    if system == "classic":
+        return classic_exact.solve(config)
+    if system in alternative_exact.SYSTEMS:
+        return alternative_exact.solve(config, system)
+    return None
+
+
+ENGINES = {
+    "scalar": scalar_engine,
+    "table": table_engine,
+    "batch": batch_engine,
+    "exact": exact_engine,
+}
+
+
+# Στατιστική
+
+def _gamma_q(a, x):
+    """Κανονικοποιημένη άνω ελλιπής γάμμα Q(a, x) (σειρά ή συνεχές κλάσμα)"""
+    if x <= 0:
+        return 1.0
+    log_prefix = a * math.log(x) - x - math.lgamma(a)
+    if x < a + 1:
+        term = total = 1.0 / a
+        denominator = a
+        for _ in range(1000):
+            denominator += 1
+            term *= x / denominator
+            total += term
+            if abs(term) < abs(total) * 1e-15:
+                break
+        return max(0.0, 1.0 - total * math.exp(log_prefix))
+    tiny = 1e-300
+    b = x + 1 - a
+    c = 1 / tiny
+    d = 1 / b
+    h = d
+    for i in range(1, 1000):
+        an = -i * (i - a)
+        b += 2
+        d = an * d + b
+        d = tiny if abs(d) < tiny else d
+        c = b + an / c
+        c = tiny if abs(c) < tiny else c
+        d = 1 / d
+        delta = d * c
+        h *= delta
+        if abs(delta - 1) < 1e-15:
+            break
+    return math.exp(log_prefix) * h
+
+
+def chi2_sf(statistic, df):
+    """P(χ² >= statistic) με df βαθμούς ελευθερίας"""
+    if df <= 0:
+        return 1.0
+    return _gamma_q(df / 2, statistic / 2)
+
+
+def ks_sf(d, n_effective):
+    """P(D >= d) της κατανομής Kolmogorov (ασυμπτωτική, με τη διόρθωση του Stephens)"""
+    if d <= 0 or n_effective <= 0:
+        return 1.0
+    root = math.sqrt(n_effective)
+    x = (root + 0.12 + 0.11 / root) * d
+    if x < 0.2:
+        return 1.0
+    total = 0.0
+    for k in range(1, 101):
+        term = (-1) ** (k - 1) * math.exp(-2 * k * k * x * x)
+        total += term
+        if abs(term) < 1e-12:
+            break
+    return min(1.0, max(0.0, 2 * total))
+
+
+def _merge_bins(categories, expected):
+    """Ενώνει διαδοχικές κατηγορίες ώστε κάθε αναμενόμενη τιμή (όλων των δειγμάτων) να είναι >= MIN_EXPECTED
+
+    categories: [(παρατηρήσεις δείγματος 1, ...), ...], expected(bin) -> αναμενόμενες τιμές του bin
+    """
+    bins = []
+    current = None
+    for counts in categories:
+        current = counts if current is None else tuple(a + b for a, b in zip(current, counts))
+        if min(expected(current)) >= MIN_EXPECTED:
+            bins.append(current)
+            current = None
+    if current is not None:
+        if bins:
+            bins[-1] = tuple(a + b for a, b in zip(bins[-1], current))
+        else:
+            bins.append(current)
+    return bins
+
+
+def chi2_two_sample(counts1, counts2):
+    """χ² ομοιογένειας δύο δειγμάτων στις ίδιες κατηγορίες - επιστρέφει (στατιστικό, p)"""
+    n1, n2 = sum(counts1), sum(counts2)
+    total = n1 + n2
+    if n1 == 0 or n2 == 0:
+        return 0.0, 1.0
+
+    def expected(counts):
+        both = counts[0] + counts[1]
+        return both * n1 / total, both * n2 / total
+
+    bins = _merge_bins([pair for pair in zip(counts1, counts2) if pair[0] + pair[1]], expected)
+    statistic = 0.0
+    for observed in bins:
+        for o, e in zip(observed, expected(observed)):
+            statistic += (o - e) ** 2 / e
+    return statistic, chi2_sf(statistic, len(bins) - 1)
+
+
+def chi2_goodness_of_fit(counts, probabilities):
+    """χ² καλής προσαρμογής δείγματος σε γνωστές πιθανότητες - επιστρέφει (στατιστικό, p)"""
+    n = sum(counts)
+    if any(count and p <= 0 for count, p in zip(counts, probabilities)):
+        return math.inf, 0.0  # Αποτέλεσμα που δεν μπορεί να συμβεί
+    bins = _merge_bins([(count, p) for count, p in zip(counts, probabilities) if p > 0],
+                       lambda pair: (pair[1] * n,))
+    statistic = sum((count - p * n) ** 2 / (p * n) for count, p in bins)
+    return statistic, chi2_sf(statistic, len(bins) - 1)
+
+
+def _cdf(histogram, values):
+    total = sum(histogram.values())
+    seen = 0
+    result = []
+    for value in values:
+        seen += histogram.get(value, 0)
+        result.append(seen / total)
+    return result
+
+
+def ks_two_sample(histogram1, histogram2):
+    """KS δύο δειγμάτων από ιστογράμματα {τιμή: πλήθος} - επιστρέφει (D, p)"""
+    n1, n2 = sum(histogram1.values()), sum(histogram2.values())
+    values = sorted(set(histogram1) | set(histogram2))
+    d = max((abs(a - b) for a, b in zip(_cdf(histogram1, values), _cdf(histogram2, values))), default=0.0)
+    return d, ks_sf(d, n1 * n2 / (n1 + n2))
+
+
+def ks_one_sample(histogram, probabilities):
+    """KS δείγματος {τιμή: πλήθος} σε γνωστή κατανομή {τιμή: πιθανότητα} - επιστρέφει (D, p)"""
+    values = sorted(set(histogram) | set(probabilities))
+    d = max((abs(a - b) for a, b in zip(_cdf(histogram, values), _cdf(probabilities, values))), default=0.0)
+    return d, ks_sf(d, sum(histogram.values()))
+
+
+# Κατανομές
+
+def distribution(stats):
+    """Οι κατανομές ενός BattleAggregate για το golden.json"""
+    return {
+        "outcomes": [stats.char1_wins, stats.char2_wins, stats.draws],
+        "rounds": {str(winner): {str(rounds): count for rounds, count in sorted(histogram.items())}
+                   for winner, histogram in stats.rounds_by_winner.items()},
+    }
+
+
+def _joint(rounds_by_winner):
+    """{νικητής: {γύροι: πλήθος}} -> {(νικητής, γύροι): πλήθος}"""
+    return {(int(winner), int(rounds)): count
+            for winner, histogram in rounds_by_winner.items() for rounds, count in histogram.items()}
+
+
+def _all_rounds(rounds_by_winner):
+    result = {}
+    for histogram in rounds_by_winner.values():
+        for rounds, count in histogram.items():
+            result[int(rounds)] = result.get(int(rounds), 0) + count
+    return result
+
+
+def compare(reference, result):
+    """Έλεγχοι ενός αποτελέσματος μηχανής (BattleAggregate ή ExactResult) με μια κατανομή του golden
+
+    Επιστρέφει [(έλεγχος, στατιστικό, p), ...].
+    """
+    outcomes = reference["outcomes"]
+    if isinstance(result, BattleAggregate):
+        tests = [("outcomes",) + chi2_two_sample(outcomes, [result.char1_wins, result.char2_wins, result.draws])]
+        joint1, joint2 = _joint(reference["rounds"]), _joint(result.rounds_by_winner)
+        keys = sorted(set(joint1) | set(joint2))
+        tests.append(("rounds",) + chi2_two_sample([joint1.get(k, 0) for k in keys], [joint2.get(k, 0) for k in keys]))
+        tests.append(("ks",) + ks_two_sample(_all_rounds(reference["rounds"]), _all_rounds(result.rounds_by_winner)))
+        return tests
+
+    # Ακριβής λύση: κατανομή γύρων χωρίς νικητή
+    tests = [("outcomes",) + chi2_goodness_of_fit(outcomes, [result.char1_win, result.char2_win, result.draw])]
+    observed = _all_rounds(reference["rounds"])
+    keys = sorted(set(observed) | set(result.rounds))
+    tests.append(("rounds",) + chi2_goodness_of_fit([observed.get(k, 0) for k in keys],
+                                                    [result.rounds.get(k, 0.0) for k in keys]))
+    tests.append(("ks",) + ks_one_sample(observed, result.rounds))
+    return tests
+
+
+# Golden
+
+def _reference_case(args):
+    name, system, config, n, seed = args
+    return distribution(scalar_engine(system, config, n, stream_seed(seed, name)))
+
+
+def build_golden(path=GOLDEN_PATH, n=REFERENCE_BATTLES, seed=REFERENCE_SEED, workers=None):
+    """Τρέχει τη CORPUS με την απλή μηχανή και γράφει τις κατανομές στο path"""
+    if workers is None:
+        workers = os.cpu_count() or 1
+    tasks = [(name, system, config, n, seed) for name, system, config in CORPUS]
+    if workers <= 1:
+        distributions = list(map(_reference_case, tasks))
+    else:
+        with ProcessPoolExecutor(max_workers=workers) as executor:
+            distributions = list(executor.map(_reference_case, tasks))
+    golden = {
+        "engine_version": ENGINE_VERSION,
+        "battles": n,
+        "seed": seed,
+        "generator": REFERENCE_GENERATOR,
+        "cases": [{"name": name, "system": system, "config": config, **dist}
+                  for (name, system, config), dist in zip(CORPUS, distributions)],
+    }
+    with open(path, "w", encoding="utf-8") as f:
+        json.dump(golden, f, ensure_ascii=False, indent=1)
+    return golden
+
+
+def load_golden(path=GOLDEN_PATH):
+    with open(path, encoding="utf-8") as f:
+        return json.load(f)
+
+
+def check(engines=None, golden=None, n=BATTLES, seed=SEED, alpha=ALPHA, cases=None):
+    """Ελέγχει μηχανές (ονόματα του ENGINES ή συναρτήσεις) με το golden
+
+    cases: ονόματα αναμετρήσεων (προεπιλογή: όλες). Επιστρέφει λίστα από dict
+    (engine, case, test, statistic, p, passed) - passed με p >= alpha / πλήθος ελέγχων.
+    """
+    golden = golden if golden is not None else load_golden()
+    engines = engines or list(ENGINES)
+    results = []
+    for engine in engines:
+        run = ENGINES[engine] if isinstance(engine, str) else engine
+        engine_name = engine if isinstance(engine, str) else getattr(engine, "__name__", str(engine))
+        for case in golden["cases"]:
+            if cases and case["name"] not in cases:
+                continue
+            result = run(case["system"], case["config"], n, stream_seed(seed, case["name"]))
+            if result is None:
+                continue
+            for test, statistic, p in compare(case, result):
+                results.append({"engine": engine_name, "case": case["name"], "test": test,
+                                "statistic": statistic, "p": p})
+    threshold = alpha / max(1, len(results))
+    for result in results:
+        result["passed"] = result["p"] >= threshold
+    return results
+
+
+def format_check(results, alpha=ALPHA):
+    lines = [f"{'Μηχανή':<8}{'Αναμέτρηση':<36}{'Έλεγχος':<10}{'στατιστικό':>12}{'p':>10}"]
+    for result in results:
+        mark = "" if result["passed"] else "  ΑΠΟΤΥΧΙΑ"
+        lines.append(f"{result['engine']:<8}{result['case']:<36}{result['test']:<10}"
+                     f"{result['statistic']:>12.4g}{result['p']:>10.4f}{mark}")
+    failed = sum(not result["passed"] for result in results)
+    threshold = alpha / max(1, len(results))
+    lines.append(f"\n{len(results)} έλεγχοι, {failed} αποτυχίες (όριο p < {threshold:.2g}, alpha {alpha} με Bonferroni)")
+    return "\n".join(lines)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(prog="python -m battle_engine.equivalence",
+                                     description="Συγκρίνει τις κατανομές των μηχανών με το golden.json.")
+    parser.add_argument("engines", nargs="*", metavar="ΜΗΧΑΝΗ", help=f"μηχανές (προεπιλογή: {', '.join(ENGINES)})")
+    parser.add_argument("-n", "--battles", type=int,
+                        help=f"μάχες ανά αναμέτρηση (προεπιλογή {BATTLES}, με --build {REFERENCE_BATTLES})")
+    parser.add_argument("--seed", type=int, help=f"seed (προεπιλογή {SEED}, με --build {REFERENCE_SEED})")
+    parser.add_argument("--alpha", type=float, help=f"επίπεδο σημαντικότητας για όλους τους ελέγχους (προεπιλογή {ALPHA})")
+    parser.add_argument("--case", action="append", metavar="ΟΝΟΜΑ", help="μόνο αυτή η αναμέτρηση (πολλές φορές)")
+    parser.add_argument("--golden", default=GOLDEN_PATH, metavar="ΑΡΧΕΙΟ", help="αρχείο αναφοράς")
+    parser.add_argument("--build", action="store_true",
+                        help="ξαναφτιάχνει το αρχείο αναφοράς με την απλή μηχανή (με -n και --seed αν δοθούν)")
+    parser.add_argument("--workers", type=int, help="διεργασίες για το --build (προεπιλογή: όλοι οι πυρήνες)")
+    parser.add_argument("--format", choices=["text", "json"], default="text", help="μορφή εξόδου")
+    args = parser.parse_args(argv)
+    unknown = [engine for engine in args.engines if engine not in ENGINES]
+    if unknown:
+        parser.error(f"άγνωστες μηχανές: {', '.join(unknown)}")
+
+    if args.build:
+        if args.engines or args.case or args.alpha is not None:
+            parser.error("το --build φτιάχνει όλη τη CORPUS με την απλή μηχανή - δεν συνδυάζεται με μηχανές, --case ή --alpha")
+        n = args.battles if args.battles is not None else REFERENCE_BATTLES
+        seed = args.seed if args.seed is not None else REFERENCE_SEED
+        build_golden(args.golden, n, seed, args.workers)
+        print(f"Γράφτηκε το {args.golden} ({len(CORPUS)} αναμετρήσεις x {n} μάχες, seed {seed})")
+        return 0
+    if args.workers is not None:
+        parser.error("το --workers ισχύει μόνο με --build")
+    n = args.battles if args.battles is not None else BATTLES
+    seed = args.seed if args.seed is not None else SEED
+    alpha = args.alpha if args.alpha is not None else ALPHA
+    golden = load_golden(args.golden)
+    if golden["engine_version"] != ENGINE_VERSION:
+        print(f"Προσοχή: το {args.golden} φτιάχτηκε με ENGINE_VERSION {golden['engine_version']}", file=sys.stderr)
+    results = check(args.engines, golden, n, seed, alpha, args.case)
+    if args.format == "json":
+        json.dump(results, sys.stdout, ensure_ascii=False, indent=2)
+        print()
+    else:
+        print(format_check(results, alpha))
+    return 0 if all(result["passed"] for result in results) else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
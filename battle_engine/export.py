@@ -0,0 +1,232 @@
+"""Εξαγωγή μαζικών μαχών με μία γραμμή ανά μάχη, σε αρχεία στηλών για ανάλυση.
+
+Κάθε γραμμή έχει τον αριθμό της μάχης, το seed του κομματιού της, νικητή,
+γύρους, κινήσεις (στο κλασικό 1v1, αλλιώς ίσες με τους γύρους) και, για κάθε
+χαρακτήρα, τα RECORD_FIELDS του συστήματος στο τέλος της μάχης: λαβωματιές,
+κόπωση και stuns στο κλασικό, λαβωματιές και καίρια στο alternative, πόντους
+ζωής στο Kryptes/AD&D. Οι στήλες είναι char1_<πεδίο> και char2_<πεδίο> ή, με
+πολλούς αντιπάλους, char2_<αριθμός>_<πεδίο>.
+
+Οι μάχες χωρίζονται σε κομμάτια όπως στην parallel.simulate (ίδιο
+parallel.CHUNK_SIZE, ίδια seeds) και διαδοχικά κομμάτια γράφονται στο ίδιο
+αρχείο του φακέλου της εξαγωγής (part-000000.parquet, ...), έως FILE_BATTLES
+μάχες ανά αρχείο, σε παρτίδες το πολύ BATCH_CELLS τιμών. Η μνήμη μένει σταθερή
+για οποιονδήποτε αριθμό μαχών. Το manifest.json του φακέλου έχει ό,τι
+χρειάζεται η parallel.replay για να ξανατρέξει οποιαδήποτε μάχη.
+
+Μορφές: "parquet" και "arrow" (Arrow IPC) αν υπάρχει το pyarrow, αλλιώς "npz"
+(ένα αρχείο ανά παρτίδα) αν υπάρχει numpy, αλλιώς "csv".
+"""
+
+import csv
+import json
+import os
+import random
+from concurrent.futures import ProcessPoolExecutor
+
+from . import get_rule_system
+from .common import BattleStats, full_config
+from .parallel import CHUNK_SIZE, split_chunks
+from .rng import DEFAULT_GENERATOR, make_rng
+
+try:
+    import numpy as np
+except ImportError:  # Χωρίς numpy δεν υπάρχει η "npz"
+    np = None
+
+try:
+    import pyarrow as pa
+    import pyarrow.ipc
+    import pyarrow.parquet
+except ImportError:  # Χωρίς pyarrow δεν υπάρχουν οι "parquet" και "arrow"
+    pa = None
+
+FILE_BATTLES = 1000000  # Μάχες ανά αρχείο (ολόκληρα κομμάτια, τουλάχιστον ένα)
+BATCH_CELLS = 1000000  # Τιμές στη μνήμη πριν γραφτούν (γραμμές x στήλες)
+FORMATS = ("parquet", "arrow", "npz", "csv")
+MANIFEST = "manifest.json"
+
+
+def default_format():
+    """Η καλύτερη διαθέσιμη μορφή"""
+    if pa is not None:
+        return "parquet"
+    if np is not None:
+        return "npz"
+    return "csv"
+
+
+def columns(system, config):
+    """Τα ονόματα των στηλών για ένα config"""
+    module = get_rule_system(system)
+    fields = module.RECORD_FIELDS
+    char2_number = full_config(module.BattleEngine, config)["char2_number"]
+    names = ["battle", "seed", "winner", "rounds", "turns"]
+    names += [f"char1_{field}" for field in fields]
+    if char2_number == 1:
+        names += [f"char2_{field}" for field in fields]
+    else:
+        names += [f"char2_{i}_{field}" for i in range(1, char2_number + 1) for field in fields]
+    return names
+
+
+class _CsvWriter:
+    def __init__(self, path, names):
+        self.file = open(path + ".csv", "w", newline="", encoding="utf-8")
+        self.writer = csv.writer(self.file)
+        self.writer.writerow(names)
+
+    def write(self, rows):
+        self.writer.writerows(rows)
+
+    def close(self):
+        self.file.close()
+
+
+class _NpzWriter:
+    """Ένα .npz ανά παρτίδα (το .npz δεν συμπληρώνεται): path-0000.npz, path-0001.npz, ..."""
+
+    def __init__(self, path, names):
+        if np is None:
+            raise ImportError("Η μορφή npz απαιτεί numpy")
+        self.path = path
+        self.names = names
+        self.batches = 0
+
+    def write(self, rows):
+        arrays = {
+            name: np.array(values, dtype=np.uint64 if name == "seed" else np.int64)
+            for name, values in zip(self.names, zip(*rows))
+        }
+        np.savez_compressed(f"{self.path}-{self.batches:04d}.npz", **arrays)
+        self.batches += 1
+
+    def close(self):
+        pass
+
+
+class _ArrowWriter:
+    """Ένα αρχείο Parquet ή Arrow IPC, με μία ομάδα γραμμών ανά παρτίδα"""
+
+    def __init__(self, path, names, format):
+        if pa is None:
+            raise ImportError(f"Η μορφή {format} απαιτεί pyarrow")
+        self.names = names
+        self.schema = pa.schema([(name, pa.uint64() if name == "seed" else pa.int64()) for name in names])
+        if format == "parquet":
+            self.writer = pa.parquet.ParquetWriter(path + ".parquet", self.schema)
+        else:
+            self.writer = pa.ipc.new_file(path + ".arrow", self.schema)
+
+    def write(self, rows):
+        arrays = [pa.array(values, type=self.schema.field(name).type) for name, values in zip(self.names, zip(*rows))]
+        self.writer.write_table(pa.Table.from_arrays(arrays, schema=self.schema))
+
+    def close(self):
+        self.writer.close()
+
+
+def open_writer(path, names, format):
+    """Writer για ένα αρχείο - path χωρίς κατάληξη"""
+    if format == "csv":
+        return _CsvWriter(path, names)
+    if format == "npz":
+        return _NpzWriter(path, names)
+    if format in ("parquet", "arrow"):
+        return _ArrowWriter(path, names, format)
+    raise ValueError(f"Άγνωστη μορφή: {format}")
+
+
+class BattleRecorder(BattleStats):
+    """BattleStats που γράφει και μία γραμμή ανά μάχη σε έναν writer, σε παρτίδες batch_rows γραμμών"""
+
+    def __init__(self, writer, fields, seed, first_battle=0, batch_rows=10000):
+        super().__init__()
+        self.writer = writer
+        self.fields = fields
+        self.seed = seed
+        self.first_battle = first_battle
+        self.batch_rows = batch_rows
+        self.rows = []
+
+    def battle_details(self, engine):
+        fields = self.fields
+
+        def details(winner):
+            char1, char2_list = engine.combatants
+            row = [getattr(char1, field) for field in fields]
+            for char2 in char2_list:
+                row.extend(getattr(char2, field) for field in fields)
+            return getattr(engine, "turns", None), row
+
+        return details
+
+    def add(self, winner, rounds, end_state=None):
+        BattleStats.add(self, winner, rounds)
+        turns, row = end_state
+        self.rows.append((self.first_battle + self.battles - 1, self.seed, winner, rounds, turns or rounds, *row))
+        if len(self.rows) >= self.batch_rows:
+            self.flush()
+
+    def flush(self):
+        if self.rows:
+            self.writer.write(self.rows)
+            self.rows = []
+
+
+def _export_file(args):
+    system, config, chunks, generator, path, format, first_battle = args
+    module = get_rule_system(system)
+    names = columns(system, config)
+    writer = open_writer(path, names, format)
+    try:
+        recorder = BattleRecorder(writer, module.RECORD_FIELDS, None, first_battle, max(1, BATCH_CELLS // len(names)))
+        for size, seed in chunks:
+            recorder.seed = seed  # Κάθε κομμάτι με τη δική του γεννήτρια, όπως στην parallel.simulate
+            module.simulate(config, size, rng=make_rng(seed, generator=generator), stats=recorder)
+        recorder.flush()
+    finally:
+        writer.close()
+    return BattleStats().merge(recorder)  # Χωρίς τον writer, για να γυρίσει από τη διεργασία
+
+
+def simulate(system, config, n, directory, format=None, seed=None, workers=None, chunk_size=CHUNK_SIZE,
+             generator=None, file_battles=FILE_BATTLES):
+    """Εκτελεί n μάχες και γράφει μία γραμμή ανά μάχη στον φάκελο directory - επιστρέφει BattleStats
+
+    Τρέχει πάντα την απλή simulate του συστήματος (όχι την FAST_SIMULATORS),
+    με ίδια κομμάτια και seeds όπως η parallel.simulate με ίδιο chunk_size.
+    Το file_battles ορίζει μόνο πώς μοιράζονται οι γραμμές σε αρχεία.
+    """
+    format = format or default_format()
+    if format not in FORMATS:
+        raise ValueError(f"Άγνωστη μορφή: {format}")
+    if seed is None:
+        seed = random.SystemRandom().getrandbits(64)
+    if workers is None:
+        workers = os.cpu_count() or 1
+    generator = generator or DEFAULT_GENERATOR  # Γραμμένο στο manifest, για την replay
+
+    os.makedirs(directory, exist_ok=True)
+    with open(os.path.join(directory, MANIFEST), "w", encoding="utf-8") as f:
+        json.dump({
+            "system": system, "config": config, "battles": n, "seed": seed, "chunk_size": chunk_size,
+            "generator": generator, "format": format, "columns": columns(system, config),
+        }, f, ensure_ascii=False, indent=2)
+
+    chunks = split_chunks(n, seed, chunk_size)
+    per_file = max(1, file_battles // chunk_size)  # Κομμάτια ανά αρχείο
+    tasks = [
+        (system, config, chunks[start:start + per_file], generator,
+         os.path.join(directory, f"part-{start // per_file:06d}"), format, start * chunk_size)
+        for start in range(0, len(chunks), per_file)
+    ]
+    stats = BattleStats()
+    if workers <= 1 or len(tasks) <= 1:
+        for task in tasks:
+            stats.merge(_export_file(task))
+    else:
+        with ProcessPoolExecutor(max_workers=min(workers, len(tasks))) as executor:
+            for file_stats in executor.map(_export_file, tasks):
+                stats.merge(file_stats)
+    return stats
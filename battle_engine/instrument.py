@@ -0,0 +1,253 @@
+"""Μετρήσεις μέσα στις μηχανές: ζαριές, επιθέσεις και χρόνος ανά φάση της μάχης.
+
+Οι κανονικές μηχανές δεν αλλάζουν και δεν πληρώνουν τίποτα. Η
+instrumented_class φτιάχνει υποκλάση της μηχανής που χρησιμοποιεί η simulate
+του συστήματος (δίνεται στο engine_class της simulate): οι μέθοδοι του PHASES
+και η ATTACK_METHODS τυλίγονται ώστε να μετράνε κλήσεις και χρόνο, η γεννήτρια
+τυλίγεται σε CountingRandom (ζαριές ανά είδος ζαριού) και οι ζωντανοί
+αντίπαλοι είναι CountingAliveSet (πόσες φορές ξαναφτιάχτηκε η λίστα των engaged).
+
+Μετρήσεις (Profile.counters):
+- d20, d6, ...: ζαριές randint(1, N). Οι TableBattleEngine βγάζουν κάθε
+  επίθεση (κλασικό) ή αντιπαράθεση (εναλλακτικά) με μία ζαριά πίνακα: table_draws
+- choices: τυχαίες επιλογές, δηλαδή στόχοι στις μάχες 1 vs πολλοί
+- attacks: κλήσεις της ATTACK_METHODS (ζαριά ζημιάς στα εναλλακτικά)
+- counterattacks: στο κλασικό 1 vs πολλοί, επίθεση αμέσως πίσω σε όποιον μόλις επιτέθηκε
+- target_switches: επιθέσεις του Χαρακτήρα 1 σε άλλον στόχο από την προηγούμενη
+  (στα συστήματα όπου διαλέγει στόχο)
+- stuns, crits: από τα πεδία των χαρακτήρων (κλασικό / alternative)
+- alive_refreshes, alive_rebuilds: κλήσεις της AliveSet.refresh και πόσες άλλαξαν τους engaged
+
+Οι χρόνοι των φάσεων περιλαμβάνουν ό,τι καλείται μέσα τους (η επίθεση του
+κλασικού περιέχει τη ζημιά) και μετράνε μόνο όπου η φάση είναι μέθοδος: η
+πρωτοβουλία των μαχών 1 vs πολλοί και οι αντιπαραθέσεις τους στα εναλλακτικά
+είναι μέσα στον γύρο. Με memory=True κάθε μάχη τρέχει με tracemalloc και
+καταγράφεται η μέγιστη μνήμη που δέσμευσε (πολύ πιο αργό).
+"""
+
+import time
+import tracemalloc
+
+from . import get_rule_system
+from .alive import AliveSet
+from .rng import DEFAULT_GENERATOR, make_rng
+
+# Η μέθοδος της μηχανής που μετράει ως μία επίθεση
+ATTACK_METHODS = {
+    "classic": "attack_turn_silent",
+    "kryptes": "attack_silent",
+    "adnd": "attack_silent",
+    "alternative": "damage_diff_silent",
+    "alternative_new": "damage_diff_silent",
+    "singleroll": "damage_diff_silent",
+}
+
+# Φάση -> μέθοδος της μηχανής, για κάθε σύστημα
+PHASES = {
+    "classic": {"initiative": "initiative_phase_silent", "attack": "attack_turn_silent", "damage": "apply_damage_silent"},
+    "kryptes": {"initiative": "initiative_phase_silent", "attack": "attack_silent"},
+    "adnd": {"initiative": "initiative_phase_silent", "attack": "attack_silent"},
+    "alternative": {"attack": "contest_silent", "damage": "apply_damage_silent"},
+    "alternative_new": {"attack": "contest_silent", "damage": "damage_diff_silent"},
+    "singleroll": {"attack": "contest_silent", "damage": "damage_diff_silent"},
+}
+
+COUNTERATTACKS = {"classic"}  # Συστήματα με αντεπιθέσεις στις μάχες 1 vs πολλοί
+TARGET_SELECTION = {"classic", "kryptes", "adnd"}  # Ο Χαρακτήρας 1 χτυπάει έναν στόχο από τους engaged
+
+PHASE_NAMES = {"initiative": "πρωτοβουλία", "attack": "επίθεση", "damage": "ζημιά"}
+
+
+class Profile:
+    """Οι μετρήσεις μιας εκτέλεσης: counters, χρόνος ανά φάση και (με tracemalloc) μνήμη ανά μάχη"""
+
+    def __init__(self):
+        self.battles = 0
+        self.seconds = 0.0
+        self.counters = {}  # όνομα -> πλήθος
+        self.phase_calls = {}  # φάση -> κλήσεις
+        self.phase_ns = {}  # φάση -> ns
+        self.memory_total = 0  # Άθροισμα της μέγιστης μνήμης κάθε μάχης (bytes)
+        self.memory_max = 0
+
+    def count(self, name, k=1):
+        self.counters[name] = self.counters.get(name, 0) + k
+
+    def per_battle(self):
+        """Μέσος όρος κάθε counter ανά μάχη"""
+        if self.battles == 0:
+            return {}
+        return {name: count / self.battles for name, count in sorted(self.counters.items())}
+
+    def to_dict(self):
+        result = {
+            "battles": self.battles,
+            "seconds": self.seconds,
+            "counters": dict(sorted(self.counters.items())),
+            "per_battle": self.per_battle(),
+            "phases": {
+                phase: {
+                    "calls": calls,
+                    "seconds": self.phase_ns[phase] / 1e9,
+                    "ns_per_call": self.phase_ns[phase] / calls if calls else None,
+                }
+                for phase, calls in self.phase_calls.items()
+            },
+        }
+        if self.memory_max:
+            result["memory"] = {
+                "mean_peak_bytes": self.memory_total / self.battles,
+                "max_peak_bytes": self.memory_max,
+            }
+        return result
+
+
+class CountingRandom:
+    """Τυλίγει μια γεννήτρια και μετράει τις ζαριές της - ίδιοι αριθμοί με τη γεννήτρια"""
+
+    def __init__(self, rng, profile):
+        self.rng = rng
+        self.profile = profile
+
+    def randint(self, a, b):
+        self.profile.count(f"d{b}" if a == 1 else "randint")
+        return self.rng.randint(a, b)
+
+    def random(self):
+        self.profile.count("table_draws")
+        return self.rng.random()
+
+    def choice(self, seq):
+        self.profile.count("choices")
+        return self.rng.choice(seq)
+
+    def __getattr__(self, name):
+        return getattr(self.rng, name)
+
+
+class CountingAliveSet(AliveSet):
+    """AliveSet που μετράει τις refresh και πόσες από αυτές άλλαξαν τους engaged"""
+
+    __slots__ = ("profile",)
+
+    def __init__(self, profile, combatants, size, is_alive):
+        super().__init__(combatants, size, is_alive)
+        self.profile = profile
+
+    def refresh(self):
+        engaged = self.engaged
+        result = AliveSet.refresh(self)
+        self.profile.count("alive_refreshes")
+        if result is not engaged:
+            self.profile.count("alive_rebuilds")
+        return result
+
+
+def _timed(method, profile, phase):
+    def timed(self, *args):
+        start = time.perf_counter_ns()
+        try:
+            return method(self, *args)
+        finally:
+            profile.phase_ns[phase] += time.perf_counter_ns() - start
+            profile.phase_calls[phase] += 1
+
+    return timed
+
+
+def _attack(method, profile, counterattacks, target_selection):
+    def attack(self, attacker, defender, *args):
+        profile.count("attacks")
+        char1, char2_list = self.combatants
+        if counterattacks and self.last_attack == (defender, attacker) and len(char2_list) > 1:
+            profile.count("counterattacks")
+        self.last_attack = (attacker, defender)
+        if target_selection and attacker is char1:
+            if self.last_target is not None and defender is not self.last_target:
+                profile.count("target_switches")
+            self.last_target = defender
+        return method(self, attacker, defender, *args)
+
+    return attack
+
+
+def instrumented_class(system, profile, memory=False):
+    """Υποκλάση της μηχανής της simulate του system που γράφει τις μετρήσεις της στο profile"""
+    module = get_rule_system(system)
+    base = getattr(module, "TableBattleEngine", module.BattleEngine)
+    fields = [field for field in ("stuns", "crits") if field in module.RECORD_FIELDS]
+
+    methods = {}
+    attack_name = ATTACK_METHODS[system]
+    methods[attack_name] = _attack(getattr(base, attack_name), profile, system in COUNTERATTACKS,
+                                   system in TARGET_SELECTION)
+    for phase, name in PHASES[system].items():
+        profile.phase_calls.setdefault(phase, 0)
+        profile.phase_ns.setdefault(phase, 0)
+        methods[name] = _timed(methods.get(name, getattr(base, name)), profile, phase)
+
+    def __init__(self, rng=None):
+        base.__init__(self, CountingRandom(rng if rng is not None else make_rng(), profile))
+
+    def alive_set(self, combatants, size, is_alive):
+        return CountingAliveSet(profile, combatants, size, is_alive)
+
+    def simulate_battle_silent(self, *args, **kwargs):
+        self.last_attack = self.last_target = None
+        if memory:
+            tracemalloc.reset_peak()
+            start = tracemalloc.get_traced_memory()[0]
+        result = base.simulate_battle_silent(self, *args, **kwargs)
+        if memory:
+            peak = tracemalloc.get_traced_memory()[1] - start
+            profile.memory_total += peak
+            profile.memory_max = max(profile.memory_max, peak)
+        profile.battles += 1
+        char1, char2_list = self.combatants
+        for field in fields:
+            profile.count(field, getattr(char1, field) + sum(getattr(char2, field) for char2 in char2_list))
+        return result
+
+    methods.update(__init__=__init__, alive_set=alive_set, simulate_battle_silent=simulate_battle_silent)
+    return type(f"Instrumented{base.__name__}", (base,), methods)
+
+
+def simulate(system, config, n, seed=None, generator=None, memory=False):
+    """Εκτελεί n μάχες (σε αυτή τη διεργασία) με μετρήσεις - επιστρέφει (BattleStats, Profile)
+
+    Ίδιες μάχες με την simulate του συστήματος με ίδιο seed και generator.
+    """
+    profile = Profile()
+    engine_class = instrumented_class(system, profile, memory)
+    rng = make_rng(seed, generator=generator or DEFAULT_GENERATOR)
+    if memory:
+        tracemalloc.start()
+    start = time.perf_counter()
+    try:
+        stats = get_rule_system(system).simulate(config, n, rng=rng, engine_class=engine_class)
+    finally:
+        profile.seconds = time.perf_counter() - start
+        if memory:
+            tracemalloc.stop()
+    return stats, profile
+
+
+def format_profile(profile):
+    """Κείμενο με τις μετρήσεις ανά μάχη και τον χρόνο κάθε φάσης"""
+    if profile.battles == 0:
+        return ""
+    counters = ", ".join(f"{name} {value:.2f}" for name, value in profile.per_battle().items())
+    text = f"Ανά μάχη: {counters}\n"
+    phases = []
+    for phase, calls in profile.phase_calls.items():
+        if calls:
+            share = profile.phase_ns[phase] / 1e9 / profile.seconds * 100
+            phases.append(f"{PHASE_NAMES[phase]} {share:.0f}% ({profile.phase_ns[phase] / calls:.0f} ns/κλήση)")
+    text += f"Χρόνος {profile.seconds:.3f} s"
+    if phases:
+        text += f" - {', '.join(phases)} (με τον χρόνο των μετρήσεων)"
+    text += "\n"
+    if profile.memory_max:
+        text += (f"Μνήμη ανά μάχη: μέση μέγιστη {profile.memory_total / profile.battles / 1024:.1f} KiB, "
+                 f"μέγιστη {profile.memory_max / 1024:.1f} KiB\n")
+    return text
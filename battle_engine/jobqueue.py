@@ -0,0 +1,270 @@
+"""Ουρά εργασιών σε SQLite για μεγάλες σαρώσεις, με workers που συνεχίζουν μετά από διακοπή.
+
+Ο συντονιστής βάζει στην ουρά αναμετρήσεις (σύστημα, config, μάχες, seed) και
+κάθε αναμέτρηση χωρίζεται στα κομμάτια της parallel.split_chunks: ίδια seeds
+με την parallel.simulate(system, config, n, seed=seed της αναμέτρησης), οπότε
+το αποτέλεσμα δεν εξαρτάται από το ποιος worker έτρεξε ποιο κομμάτι. Οι
+workers (διεργασίες, σε αυτόν ή σε άλλον υπολογιστή με πρόσβαση στο αρχείο)
+δεσμεύουν ένα κομμάτι τη φορά, το τρέχουν και γράφουν τα συγκεντρωτικά του.
+Ένα κομμάτι τρέχει με την parallel._run_chunk, δηλαδή με τη simulate του
+συστήματος (simulate_battle_silent ανά μάχη): το ένα σημείο εισόδου χωρίς
+κείμενο που έχουν και τα έξι συστήματα κανόνων.
+
+Όλη η κατάσταση είναι στο αρχείο. Ένα κομμάτι που δεσμεύτηκε και δεν
+ολοκληρώθηκε μέσα στο lease (ο worker κόλλησε ή σκοτώθηκε) ξαναδίνεται σε
+άλλον worker, και η ίδια αναμέτρηση δεν μπαίνει δύο φορές στην ουρά, οπότε
+μετά από διακοπή αρκεί να ξανατρέξουν ο συντονιστής και οι workers.
+
+    python -m battle_engine.jobqueue sweep.sqlite --workers 8    # Workers μέχρι να αδειάσει η ουρά
+"""
+
+import argparse
+import hashlib
+import json
+import multiprocessing
+import os
+import random
+import socket
+import sqlite3
+import time
+from contextlib import contextmanager
+
+from . import ENGINE_VERSION
+from .common import BattleStats
+from .parallel import CHUNK_SIZE, _run_chunk, chunk_seed, split_chunks
+from .sweep import config_key, expand_grid
+
+LEASE = 600.0  # Δευτερόλεπτα - μετά από τόσα ένα δεσμευμένο κομμάτι ξαναδίνεται
+IDLE_POLL = 1.0  # Δευτερόλεπτα - κάθε πόσο ξανακοιτάει ένας worker που περιμένει
+
+PENDING = "pending"
+RUNNING = "running"
+DONE = "done"
+
+
+def worker_name():
+    """Όνομα για έναν worker: υπολογιστής και διεργασία"""
+    return f"{socket.gethostname()}:{os.getpid()}"
+
+
+class JobQueue:
+    """Η ουρά σε ένα αρχείο SQLite (νέα σύνδεση σε κάθε κλήση, όπως η cache.ResultCache)"""
+
+    def __init__(self, path, lease=LEASE):
+        self.path = path
+        self.lease = lease
+        os.makedirs(os.path.dirname(os.path.abspath(path)), exist_ok=True)
+        with self._connect() as db:
+            db.execute("PRAGMA journal_mode=WAL")  # Οι workers διαβάζουν ενώ κάποιος γράφει
+            db.execute(
+                "CREATE TABLE IF NOT EXISTS matchups ("
+                " id INTEGER PRIMARY KEY, key TEXT UNIQUE, system TEXT, config TEXT, battles INTEGER,"
+                " seed TEXT, generator TEXT, engine_version TEXT)"
+            )
+            # Τα seeds είναι TEXT: τα 64 bits δεν χωράνε σε INTEGER της SQLite
+            db.execute(
+                "CREATE TABLE IF NOT EXISTS jobs ("
+                " id INTEGER PRIMARY KEY, matchup INTEGER, chunk INTEGER, battles INTEGER, seed TEXT,"
+                " status TEXT, worker TEXT, claimed_at REAL, attempts INTEGER,"
+                " char1_wins INTEGER, char2_wins INTEGER, draws INTEGER,"
+                " total_rounds INTEGER, min_rounds INTEGER, max_rounds INTEGER)"
+            )
+            db.execute("CREATE INDEX IF NOT EXISTS jobs_status ON jobs (status, claimed_at)")
+            db.execute("CREATE INDEX IF NOT EXISTS jobs_matchup ON jobs (matchup)")
+
+    @contextmanager
+    def _connect(self):
+        db = sqlite3.connect(self.path, timeout=30)
+        try:
+            with db:  # commit ή rollback
+                yield db
+        finally:
+            db.close()
+
+    def enqueue(self, system, config, n, seed=None, generator=None, chunk_size=CHUNK_SIZE):
+        """Βάζει στην ουρά n μάχες ενός config - επιστρέφει τον αριθμό της αναμέτρησης
+
+        Αν η ίδια αναμέτρηση (σύστημα, πλήρες config, n, seed, generator) είναι
+        ήδη στην ουρά, επιστρέφει την υπάρχουσα. Χωρίς seed επιλέγεται τυχαίο
+        την πρώτη φορά.
+        """
+        text = json.dumps([config_key(system, config), n, seed, generator, chunk_size, ENGINE_VERSION])
+        key = hashlib.sha256(text.encode()).hexdigest()
+        with self._connect() as db:
+            db.execute("BEGIN IMMEDIATE")  # Δύο συντονιστές δεν πρέπει να βάλουν την ίδια αναμέτρηση δύο φορές
+            row = db.execute("SELECT id FROM matchups WHERE key = ?", (key,)).fetchone()
+            if row is not None:
+                return row[0]
+            if seed is None:
+                seed = random.SystemRandom().getrandbits(64)
+            matchup = db.execute(
+                "INSERT INTO matchups (key, system, config, battles, seed, generator, engine_version)"
+                " VALUES (?, ?, ?, ?, ?, ?, ?)",
+                (key, system, json.dumps(config, ensure_ascii=False), n, str(seed), generator, ENGINE_VERSION),
+            ).lastrowid
+            db.executemany(
+                "INSERT INTO jobs (matchup, chunk, battles, seed, status, attempts) VALUES (?, ?, ?, ?, ?, 0)",
+                [(matchup, chunk, size, str(shard_seed), PENDING)
+                 for chunk, (size, shard_seed) in enumerate(split_chunks(n, seed, chunk_size))],
+            )
+        return matchup
+
+    def enqueue_sweep(self, system, base_config, axes, n, seed=None, generator=None):
+        """Βάζει στην ουρά κάθε συνδυασμό των αξόνων (όπως η sweep.run_sweep) - επιστρέφει [(τιμές, αναμέτρηση)]
+
+        Κάθε config παίρνει seed από το περιεχόμενό του, οπότε ο ίδιος
+        συντονιστής μπορεί να ξανατρέξει μετά από διακοπή χωρίς διπλές εγγραφές.
+        """
+        if seed is None:
+            seed = random.SystemRandom().getrandbits(64)
+        return [
+            (values, self.enqueue(system, config, n, chunk_seed(seed, config_key(system, config)), generator))
+            for values, config in expand_grid(base_config, axes)
+        ]
+
+    def claim(self, worker):
+        """Δεσμεύει ένα κομμάτι - επιστρέφει (αριθμός κομματιού, task της parallel._run_chunk) ή None
+
+        Παίρνει πρώτα κομμάτια που περιμένουν και μετά όσα δεσμεύτηκαν πριν
+        από περισσότερο από lease δευτερόλεπτα χωρίς να ολοκληρωθούν.
+        """
+        now = time.time()
+        with self._connect() as db:
+            db.execute("BEGIN IMMEDIATE")  # Δύο workers δεν πρέπει να πάρουν το ίδιο κομμάτι
+            row = db.execute(
+                "SELECT jobs.id, system, config, jobs.battles, jobs.seed, generator FROM jobs"
+                " JOIN matchups ON matchups.id = jobs.matchup"
+                " WHERE status = ? OR (status = ? AND claimed_at < ?)"
+                " ORDER BY status = ? DESC, jobs.id LIMIT 1",
+                (PENDING, RUNNING, now - self.lease, PENDING),
+            ).fetchone()
+            if row is None:
+                return None
+            job, system, config, n, seed, generator = row
+            db.execute(
+                "UPDATE jobs SET status = ?, worker = ?, claimed_at = ?, attempts = attempts + 1 WHERE id = ?",
+                (RUNNING, worker, now, job),
+            )
+        return job, (system, json.loads(config), n, int(seed), generator)
+
+    def complete(self, job, stats):
+        """Γράφει τα αποτελέσματα ενός κομματιού
+
+        Αν το κομμάτι ολοκληρώθηκε ήδη από άλλον worker (έληξε το lease), τα
+        αποτελέσματα είναι ίδια, αφού το seed είναι ίδιο, και δεν γράφονται ξανά.
+        """
+        with self._connect() as db:
+            db.execute(
+                "UPDATE jobs SET status = ?, char1_wins = ?, char2_wins = ?, draws = ?,"
+                " total_rounds = ?, min_rounds = ?, max_rounds = ? WHERE id = ? AND status != ?",
+                (DONE, stats.char1_wins, stats.char2_wins, stats.draws, stats.total_rounds,
+                 stats.min_rounds if stats.battles else None, stats.max_rounds, job, DONE),
+            )
+
+    def release(self, worker=None):
+        """Ξαναβάζει στην αναμονή τα δεσμευμένα κομμάτια (ενός worker ή όλων) - π.χ. όταν είναι
+        σίγουρο ότι δεν τρέχει κανένας worker και δεν αξίζει να περιμένουμε το lease"""
+        with self._connect() as db:
+            if worker is None:
+                db.execute("UPDATE jobs SET status = ? WHERE status = ?", (PENDING, RUNNING))
+            else:
+                db.execute("UPDATE jobs SET status = ? WHERE status = ? AND worker = ?", (PENDING, RUNNING, worker))
+
+    def results(self, matchup):
+        """Τα αποτελέσματα των κομματιών μιας αναμέτρησης που ολοκληρώθηκαν - επιστρέφει BattleStats"""
+        stats = BattleStats()
+        with self._connect() as db:
+            rows = db.execute(
+                "SELECT battles, char1_wins, char2_wins, draws, total_rounds, min_rounds, max_rounds"
+                " FROM jobs WHERE matchup = ? AND status = ?", (matchup, DONE)
+            ).fetchall()
+        for row in rows:
+            chunk_stats = BattleStats()
+            (chunk_stats.battles, chunk_stats.char1_wins, chunk_stats.char2_wins, chunk_stats.draws,
+             chunk_stats.total_rounds, min_rounds, chunk_stats.max_rounds) = row
+            if min_rounds is not None:
+                chunk_stats.min_rounds = min_rounds
+            stats.merge(chunk_stats)
+        return stats
+
+    def matchups(self):
+        """Όλες οι αναμετρήσεις της ουράς - [(αριθμός, σύστημα, config, μάχες), ...]"""
+        with self._connect() as db:
+            rows = db.execute("SELECT id, system, config, battles FROM matchups ORDER BY id").fetchall()
+        return [(matchup, system, json.loads(config), n) for matchup, system, config, n in rows]
+
+    def counts(self):
+        """Κομμάτια ανά κατάσταση - {PENDING: ..., RUNNING: ..., DONE: ...}"""
+        with self._connect() as db:
+            rows = db.execute("SELECT status, COUNT(*) FROM jobs GROUP BY status").fetchall()
+        counts = {PENDING: 0, RUNNING: 0, DONE: 0}
+        counts.update(rows)
+        return counts
+
+    def finished(self):
+        counts = self.counts()
+        return counts[PENDING] == 0 and counts[RUNNING] == 0
+
+
+def work(path, worker=None, run_chunk=_run_chunk, max_jobs=None, wait=False, lease=LEASE):
+    """Ο βρόχος ενός worker: δεσμεύει, τρέχει και ολοκληρώνει κομμάτια - επιστρέφει πόσα έτρεξε
+
+    run_chunk: η συνάρτηση που τρέχει ένα task (system, config, n, seed, generator)
+    και επιστρέφει BattleStats - π.χ. ένας απλός worker για δοκιμές.
+    Με wait=True περιμένει και τα κομμάτια άλλων workers, για να ξαναπάρει
+    όσα δεν ολοκληρωθούν μέσα στο lease.
+    """
+    queue = JobQueue(path, lease)
+    worker = worker or worker_name()
+    done = 0
+    while max_jobs is None or done < max_jobs:
+        claimed = queue.claim(worker)
+        if claimed is None:
+            if wait and not queue.finished():
+                time.sleep(IDLE_POLL)
+                continue
+            break
+        job, task = claimed
+        queue.complete(job, run_chunk(task))
+        done += 1
+    return done
+
+
+def run_workers(path, workers=None, lease=LEASE):
+    """Τρέχει workers διεργασίες μέχρι να ολοκληρωθούν όλα τα κομμάτια της ουράς - επιστρέφει JobQueue"""
+    if workers is None:
+        workers = os.cpu_count() or 1
+    if workers <= 1:
+        work(path, wait=True, lease=lease)
+        return JobQueue(path, lease)
+
+    processes = [
+        multiprocessing.Process(target=work, args=(path,), kwargs={"wait": True, "lease": lease})
+        for _ in range(workers)
+    ]
+    for process in processes:
+        process.start()
+    for process in processes:
+        process.join()
+    return JobQueue(path, lease)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(
+        prog="python -m battle_engine.jobqueue",
+        description="Τρέχει workers για τα κομμάτια μιας ουράς εργασιών μέχρι να ολοκληρωθούν όλα.",
+    )
+    parser.add_argument("path", metavar="ΑΡΧΕΙΟ", help="το αρχείο SQLite της ουράς")
+    parser.add_argument("--workers", type=int, help="διεργασίες (προεπιλογή: όλοι οι πυρήνες)")
+    parser.add_argument("--lease", type=float, default=LEASE,
+                        help=f"δευτερόλεπτα μέχρι να ξαναδοθεί ένα κομμάτι που δεν ολοκληρώθηκε (προεπιλογή {LEASE:g})")
+    args = parser.parse_args(argv)
+
+    queue = run_workers(args.path, args.workers, args.lease)
+    counts = queue.counts()
+    print(f"Κομμάτια: {counts[DONE]} ολοκληρωμένα, {counts[PENDING] + counts[RUNNING]} σε εκκρεμότητα")
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,176 @@
+"""Εκτέλεση πολλών μαχών σε πολλούς πυρήνες.
+
+Οι μάχες χωρίζονται σε κομμάτια σταθερού μεγέθους και κάθε κομμάτι παίρνει
+το δικό του seed, που προκύπτει από το seed της εκτέλεσης και τη θέση του
+κομματιού (rng.stream_seed). Έτσι το αποτέλεσμα με ίδιο seed είναι ίδιο για
+οποιονδήποτε αριθμό workers και κάθε μάχη ξανατρέχει ακριβώς με τη replay.
+"""
+
+import importlib
+import os
+import random
+import threading
+from concurrent.futures import FIRST_COMPLETED, ProcessPoolExecutor, wait
+
+from . import FAST_SIMULATORS, get_rule_system, get_simulator
+from .common import BattleStats
+from .rng import DEFAULT_GENERATOR, make_rng, stream_seed
+
+CHUNK_SIZE = 10000  # Μάχες ανά κομμάτι
+CANCEL_POLL = 0.1  # Δευτερόλεπτα - κάθε πόσο ελέγχεται η ακύρωση
+
+
+def chunk_seed(seed, index):
+    """Ανεξάρτητο seed για το κομμάτι index μιας εκτέλεσης"""
+    return stream_seed(seed, index)
+
+
+def split_chunks(n, seed, chunk_size=CHUNK_SIZE):
+    """Χωρίζει n μάχες σε [(μάχες, seed), ...]"""
+    chunks = []
+    for index, start in enumerate(range(0, n, chunk_size)):
+        chunks.append((min(chunk_size, n - start), chunk_seed(seed, index)))
+    return chunks
+
+
+def _run_chunk(args):
+    system, config, n, seed, generator = args
+    if generator is None:
+        return get_simulator(system)(config, n, seed)
+    return get_simulator(system)(config, n, rng=make_rng(seed, generator=generator))
+
+
+def replay(system, config, n, seed, index, chunk_size=CHUNK_SIZE, generator=None):
+    """Ξανατρέχει τη μάχη index μιας simulate(system, config, n, seed=seed) - επιστρέφει (νικητής, γύροι)
+
+    Νικητής 1 ή 2, 0 για ισοπαλία. Τρέχουν ξανά και οι μάχες πριν από αυτήν
+    στο ίδιο κομμάτι (έως chunk_size), για να φτάσει η γεννήτρια στο σωστό σημείο.
+    """
+    if not 0 <= index < n:
+        raise IndexError(f"Η μάχη {index} δεν υπάρχει σε {n} μάχες")
+    chunk, offset = divmod(index, chunk_size)
+    size = min(chunk_size, n - chunk * chunk_size)
+    shard_seed = chunk_seed(seed, chunk)
+
+    if generator is None and system in FAST_SIMULATORS:
+        fast = importlib.import_module(FAST_SIMULATORS[system])
+        if fast.supports(config):
+            winners, rounds = fast.battle_results(config, size, shard_seed)  # Οι μάχες εξαρτώνται από το μέγεθος του κομματιού
+            return int(winners[offset]), int(rounds[offset])
+
+    module = get_rule_system(system)
+    rng = make_rng(shard_seed, generator=generator or DEFAULT_GENERATOR)
+    module.simulate(config, offset, rng=rng)
+    stats = module.simulate(config, 1, rng=rng)
+    winner = 1 if stats.char1_wins else 2 if stats.char2_wins else 0
+    return winner, stats.total_rounds
+
+
+class BattleRun:
+    """Μια εκτέλεση n μαχών που μπορεί να τρέξει στο παρασκήνιο και να ακυρωθεί.
+
+    Το stats περιέχει πάντα τα αποτελέσματα των κομματιών που ολοκληρώθηκαν.
+    Με cache (cache.ResultCache) τρέχουν μόνο όσες μάχες λείπουν από την cache,
+    με seed που ορίζει η cache, και στο τέλος οι νέες μάχες αποθηκεύονται. Το
+    stats έχει τότε όλες τις μάχες της cache, που μπορεί να είναι περισσότερες από n.
+    Το generator είναι όνομα από το rng.GENERATORS - None για την προεπιλογή κάθε συστήματος.
+    """
+
+    def __init__(self, system, config, n, workers=None, seed=None, chunk_size=CHUNK_SIZE, cache=None,
+                 generator=None):
+        if workers is None:
+            workers = os.cpu_count() or 1
+        self.system = system
+        self.config = config
+        self.n = n
+        self.workers = workers
+        self.cache = cache
+        self.generator = generator
+        self.stats = BattleStats()
+        self.new_stats = BattleStats()  # Μόνο όσες μάχες έτρεξαν τώρα
+        if cache is not None:
+            self.stats = cache.get(system, config)
+            seed = cache.seed(system, config, self.stats.battles)
+        elif seed is None:
+            seed = random.SystemRandom().getrandbits(64)
+        self.seed = seed
+        missing = max(0, n - self.stats.battles)
+        self.tasks = [
+            (system, config, size, shard_seed, generator) for size, shard_seed in split_chunks(missing, seed, chunk_size)
+        ]
+        self.cancelled = False
+        self.done = False
+        self.error = None
+        self._lock = threading.Lock()
+        self._thread = None
+
+    def _add(self, chunk_stats):
+        with self._lock:
+            stats = BattleStats()
+            stats.merge(self.stats)
+            self.stats = stats.merge(chunk_stats)  # Νέο αντικείμενο - όποιος διαβάζει δεν βλέπει μισή ενημέρωση
+            self.new_stats.merge(chunk_stats)
+
+    def progress(self):
+        """Ποσοστό ολοκλήρωσης (0 έως 1)"""
+        return min(1.0, self.stats.battles / self.n) if self.n else 1.0
+
+    def run(self):
+        """Εκτελεί τις μάχες στο τρέχον thread - επιστρέφει BattleStats"""
+        try:
+            self._execute()
+            if self.cache is not None and self.new_stats.battles:
+                # Και μετά από ακύρωση: οι μάχες που ολοκληρώθηκαν είναι έγκυρες
+                self.stats = self.cache.add(self.system, self.config, self.new_stats)
+        except Exception as e:
+            self.error = e
+            raise
+        finally:
+            self.done = True
+        return self.stats
+
+    def _execute(self):
+        if self.workers <= 1 or len(self.tasks) <= 1:
+            # Δεν αξίζει να ξεκινήσουν διεργασίες
+            for task in self.tasks:
+                if self.cancelled:
+                    break
+                self._add(_run_chunk(task))
+            return
+
+        executor = ProcessPoolExecutor(max_workers=min(self.workers, len(self.tasks)))
+        try:
+            pending = {executor.submit(_run_chunk, task) for task in self.tasks}
+            while pending and not self.cancelled:
+                finished, pending = wait(pending, timeout=CANCEL_POLL, return_when=FIRST_COMPLETED)
+                for future in finished:
+                    self._add(future.result())
+        finally:
+            # Με ακύρωση δεν περιμένουμε τα κομμάτια που τρέχουν ήδη
+            executor.shutdown(wait=not self.cancelled, cancel_futures=True)
+
+    def start(self):
+        """Ξεκινάει τις μάχες σε thread στο παρασκήνιο"""
+        self._thread = threading.Thread(target=self._run_background, daemon=True)
+        self._thread.start()
+        return self
+
+    def _run_background(self):
+        try:
+            self.run()
+        except Exception:
+            pass  # Το σφάλμα μένει στο self.error
+
+    def cancel(self):
+        """Σταματάει την εκτέλεση - το stats κρατάει ό,τι ολοκληρώθηκε"""
+        self.cancelled = True
+
+    def wait(self, timeout=None):
+        if self._thread is not None:
+            self._thread.join(timeout)
+        return self.stats
+
+
+def simulate(system, config, n, workers=None, seed=None, chunk_size=CHUNK_SIZE, cache=None, generator=None):
+    """Εκτελεί n μάχες του συστήματος system σε workers διεργασίες - επιστρέφει BattleStats"""
+    return BattleRun(system, config, n, workers, seed, chunk_size, cache, generator).run()
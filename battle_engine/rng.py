@@ -0,0 +1,118 @@
+"""Γεννήτριες τυχαίων αριθμών για τις μηχανές.
+
+Κάθε μηχανή παίρνει ένα αντικείμενο rng με τις μεθόδους του random.Random που
+χρησιμοποιούν οι κανόνες (randint, choice, random) και δεν αγγίζει ποτέ το
+global random. Μια σειρά μαχών ορίζεται από ένα seed και έναν αριθμό stream:
+κάθε κομμάτι μιας parallel.simulate είναι ξεχωριστό stream του seed της
+εκτέλεσης, οπότε οι workers έχουν ανεξάρτητες σειρές και κάθε μάχη μπορεί να
+ξανατρέξει ακριβώς (parallel.replay).
+
+Η γεννήτρια επιλέγεται με όνομα από το GENERATORS. Η "dice" (προεπιλογή) είναι
+η dice.DiceSource: random.Random με ζάρια από προ-παραγμένα μπλοκ. Η "random"
+είναι το σκέτο random.Random της Python. Η "pcg64" είναι ο PCG64 του numpy: οι
+αριθμοί και τα ζάρια παράγονται σε μπλοκ και μοιράζονται ένας-ένας στις μηχανές.
+"""
+
+import hashlib
+import random
+
+from .dice import DiceSource
+
+try:
+    import numpy as np
+except ImportError:  # Χωρίς numpy δεν υπάρχει η "pcg64"
+    np = None
+
+BLOCK_SIZE = 4096  # Αριθμοί ανά μπλοκ της PCG64Random
+DEFAULT_GENERATOR = "dice"
+
+
+def stream_seed(seed, stream):
+    """Ανεξάρτητο seed για το stream ενός seed"""
+    digest = hashlib.sha256(f"{seed}:{stream}".encode()).digest()
+    return int.from_bytes(digest[:8], "big")
+
+
+class PCG64Random(DiceSource):
+    """DiceSource με τον PCG64 του numpy ως πηγή.
+
+    Οι random(), getrandbits() και τα μπλοκ ζαριών σερβίρονται από μπλοκ
+    block_size αριθμών που παράγει το numpy μονομιάς.
+    """
+
+    def __init__(self, seed=None, block_size=BLOCK_SIZE):
+        if np is None:
+            raise ImportError("Η γεννήτρια PCG64 απαιτεί numpy")
+        super().__init__(seed, block_size)
+
+    def seed(self, a=None, version=2):
+        self._generator = np.random.Generator(np.random.PCG64(a))
+        self._faces = {}
+        self._floats = []
+        self._float_pos = 0
+        self._words = []
+        self._word_pos = 0
+
+    def random(self):
+        if self._float_pos == len(self._floats):
+            self._floats = self._generator.random(self.block_size).tolist()
+            self._float_pos = 0
+        value = self._floats[self._float_pos]
+        self._float_pos += 1
+        return value
+
+    def _next_word(self):
+        """Τα επόμενα 32 τυχαία bits"""
+        if self._word_pos == len(self._words):
+            self._words = self._generator.integers(0, 1 << 32, self.block_size, dtype=np.uint32).tolist()
+            self._word_pos = 0
+        value = self._words[self._word_pos]
+        self._word_pos += 1
+        return value
+
+    def getrandbits(self, k):
+        if k <= 32:
+            return self._next_word() >> (32 - k)
+        value = 0
+        for shift in range(0, k, 32):
+            value |= self._next_word() << shift
+        return value & ((1 << k) - 1)
+
+    def _roll_block(self, sides):
+        return self._generator.integers(1, sides + 1, self.block_size).tolist()
+
+    def getstate(self):
+        return (
+            self._generator.bit_generator.state,
+            self._floats[self._float_pos:],
+            self._words[self._word_pos:],
+            {sides: list(faces) for sides, faces in self._faces.items()},
+        )
+
+    def setstate(self, state):
+        bit_state, floats, words, faces = state
+        self._generator.bit_generator.state = bit_state
+        self._floats, self._float_pos = list(floats), 0
+        self._words, self._word_pos = list(words), 0
+        self._faces = {sides: list(values) for sides, values in faces.items()}
+
+
+GENERATORS = {
+    "dice": DiceSource,
+    "random": random.Random,
+    "pcg64": PCG64Random,
+}
+
+
+def make_rng(seed=None, stream=None, generator=DEFAULT_GENERATOR):
+    """Γεννήτρια για ένα seed και (προαιρετικά) ένα stream του
+
+    Χωρίς stream είναι η γεννήτρια generator με το ίδιο το seed, π.χ. random.Random(seed).
+    """
+    if stream is not None:
+        seed = stream_seed(seed, stream)
+    try:
+        rng_class = GENERATORS[generator]
+    except KeyError:
+        raise ValueError(f"Άγνωστη γεννήτρια: {generator}") from None
+    return rng_class(seed)
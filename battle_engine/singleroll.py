@@ -0,0 +1,511 @@
+from . import tables
+from .alive import AliveSet
+from .common import run_battles
+from .rng import make_rng
+
+STATS = ["Μάχη", "Ζημιά", "Αντοχή"]
+
+# Τα πεδία του Character στο τέλος κάθε μάχης, για το export (μία στήλη ανά χαρακτήρα)
+RECORD_FIELDS = ("wounds",)
+
+# Το πεδίο του Character για κάθε στατιστικό
+STAT_FIELDS = {"Μάχη": "combat", "Ζημιά": "damage", "Αντοχή": "toughness"}
+
+class Character:
+    # Ακέραια πεδία αντί για dicts: σε μάχες 1 vs Πολλών φτιάχνονται εκατομμύρια χαρακτήρες
+    __slots__ = ("name", "combat", "damage", "toughness", "is_minion", "wounds")
+
+    def __init__(self, name, stats, is_minion=False):
+        self.name = name
+        self.combat = stats["Μάχη"]
+        self.damage = stats["Ζημιά"]
+        self.toughness = stats["Αντοχή"]
+        self.is_minion = is_minion
+        self.wounds = 0
+
+    def get_effective_stat(self, stat_name):
+        """Υπολογίζει το τελικό stat"""
+        return getattr(self, STAT_FIELDS[stat_name])
+
+class BattleEngine:
+    """Οι κανόνες μάχης του εναλλακτικού συστήματος (Single Roll), χωρίς γραφικό περιβάλλον"""
+
+    alive_set = AliveSet  # Οι ζωντανοί αντίπαλοι στις μάχες 1 vs πολλοί (η instrument την αντικαθιστά)
+
+    def __init__(self, rng=None):
+        self.rng = rng if rng is not None else make_rng()
+
+    def roll_d20(self, modifier=0):
+        """Ρίχνει d20 με modifier"""
+        dice_result = self.rng.randint(1, 20)
+        total = dice_result + modifier
+        return dice_result, modifier, total
+
+    def format_dice_roll(self, stat_name, dice_result, modifier, total):
+        """Μορφοποιεί την εμφάνιση της ζαριάς"""
+        if modifier >= 0:
+            return f"{stat_name} d20({dice_result}) + {modifier} = {total}"
+        else:
+            return f"{stat_name} d20({dice_result}) - {abs(modifier)} = {total}"
+
+    def battle_round_multiple(self, char1, char2_list, max_engaged):
+        """Εκτελεί έναν γύρο μάχης με πολλαπλούς αντιπάλους και σύστημα reserves (Single Roll)"""
+        result = f"--- Γύρος Μάχης ---\n"
+
+        # Βρίσκουμε τους ζωντανούς εχθρούς
+        alive_enemies = [char2 for char2 in char2_list if char2.wounds != 10]
+
+        # Χωρίζουμε σε engaged και reserves
+        engaged_enemies = alive_enemies[:max_engaged]
+        reserves = alive_enemies[max_engaged:]
+
+        if reserves:
+            result += f"Μάχονται: {len(engaged_enemies)}, Reserves: {len(reserves)}\n"
+        else:
+            result += f"Μάχονται: {len(engaged_enemies)}\n"
+        result += "\n"
+
+        # Ζαριά μάχης του χαρακτήρα 1
+        battle1_dice, battle1_mod, battle1_total = self.roll_d20(char1.combat)
+        battle1_display = self.format_dice_roll("Μάχη", battle1_dice, battle1_mod, battle1_total)
+        result += f"{char1.name}: {battle1_display}\n"
+
+        # SINGLE ROLL: Μόνο ο πρώτος engaged ρίχνει, με bonus για τον αριθμό των engaged
+        num_engaged = len(engaged_enemies)
+        first_enemy = engaged_enemies[0]
+
+        # Ο πρώτος εχθρός ρίχνει με bonus (μόνο αν είναι 2+)
+        battle2_dice, battle2_base_mod, _ = self.roll_d20(first_enemy.combat)
+        # Bonus: +2 για 2 εχθρούς, +3 για 3, κλπ. Όχι bonus για 1 μόνο
+        bonus = num_engaged if num_engaged >= 2 else 0
+        battle2_mod = battle2_base_mod + bonus
+        battle2_total = battle2_dice + battle2_mod
+
+        original_index = char2_list.index(first_enemy)
+        if bonus > 0:
+            result += f"Χαρακτήρας 2.{original_index+1} (για όλους): d20({battle2_dice}) + {battle2_base_mod} + {bonus} (bonus) = {battle2_total}\n"
+        else:
+            result += f"Χαρακτήρας 2.{original_index+1}: d20({battle2_dice}) + {battle2_base_mod} = {battle2_total}\n"
+
+        # Έλεγχος νίκης
+        char1_wins = battle1_total > battle2_total or (battle1_total == battle2_total and battle1_mod > battle2_mod)
+
+        if char1_wins:
+            result += f"\n{char1.name} νικάει όλους τους engaged!\n"
+
+            # Ο χαρακτήρας 1 ρίχνει ζημιά σε όλους τους engaged
+            result += f"\n{char1.name} ρίχνει ζημιά σε όλους τους engaged...\n"
+
+            dmg_dice, dmg_mod, damage_roll = self.roll_d20(char1.damage)
+            damage_display = self.format_dice_roll("Ζημιά", dmg_dice, dmg_mod, damage_roll)
+
+            defeated_chars = []
+
+            # Ζημιά σε όλους τους engaged
+            for char2 in engaged_enemies:
+                original_index = char2_list.index(char2)
+                end_dice, end_mod, endurance_roll = self.roll_d20(char2.toughness)
+                endurance_display = self.format_dice_roll("Αντοχή", end_dice, end_mod, endurance_roll)
+
+                result += f"Χαρακτήρας 2.{original_index+1}: {damage_display} vs {endurance_display}\n"
+
+                damage_diff = damage_roll - endurance_roll
+                had_two_wounds = char2.wounds >= 2
+
+                # Τσιράκι: πεθαίνει με οποιαδήποτε επιτυχή ζημιά
+                if char2.is_minion and damage_diff >= 0:
+                    result += f"Τσιράκι! (+{damage_diff}) Ο Χαρακτήρας 2.{original_index+1} νικιέται!\n"
+                    char2.wounds = 10  # Σημάδι νίκης
+                    defeated_chars.append(char2)
+                elif damage_diff >= 10:
+                    result += f"ΘΑΝΑΤΗΦΟΡΟ ΧΤΥΠΗΜΑ! (+{damage_diff}) Ο Χαρακτήρας 2.{original_index+1} νικιέται!\n"
+                    char2.wounds = 10  # Σημάδι νίκης
+                    defeated_chars.append(char2)
+                elif damage_diff >= 5:
+                    result += f"Σοβαρή ζημιά! (+{damage_diff}) 2 λαβωματιές\n"
+                    char2.wounds += 2
+                elif damage_diff >= 0:
+                    result += f"Ζημιά! (+{damage_diff}) 1 λαβωματιά\n"
+                    char2.wounds += 1
+                else:
+                    result += f"Αντέχει τη ζημιά! ({damage_diff})\n"
+
+                # Έλεγχος αν ο char2 είχε >=2 λαβωματιές και μόλις λαβώθηκε ξανά (μόνο αν δεν είναι τσιράκι)
+                if not char2.is_minion and had_two_wounds and damage_diff >= 0:
+                    result += f"Ο Χαρακτήρας 2.{original_index+1} έχει πάρει πολλές λαβωματιές και νικιέται!\n"
+                    char2.wounds = 10  # Σημάδι νίκης
+                    defeated_chars.append(char2)
+                elif char2.wounds != 10:  # Μόνο αν δεν νικήθηκε ήδη
+                    result += f"Κατάσταση Χαρακτήρας 2.{original_index+1}: {char2.wounds} λαβωματιές\n"
+
+                result += "\n"
+
+            # Έλεγχος αν όλοι οι χαρακτήρες 2 νικήθηκαν (θανατηφόρα χτυπήματα)
+            living_enemies = [char2 for char2 in char2_list if char2.wounds != 10]
+            if len(living_enemies) == 0:
+                return result, True, char1
+
+        else:
+            result += f"\nΟι αντίπαλοι νικούν!\n"
+
+            # Όλοι οι engaged χαρακτήρες 2 ρίχνουν ζημιά (ατομικά)
+            result += f"\nΌλοι οι engaged αντίπαλοι ρίχνουν ζημιά...\n"
+
+            total_damage_taken = 0
+
+            for char2 in engaged_enemies:
+                original_index = char2_list.index(char2)
+                dmg_dice, dmg_mod, damage_roll = self.roll_d20(char2.damage)
+                end_dice, end_mod, endurance_roll = self.roll_d20(char1.toughness)
+
+                damage_display = self.format_dice_roll("Ζημιά", dmg_dice, dmg_mod, damage_roll)
+                endurance_display = self.format_dice_roll("Αντοχή", end_dice, end_mod, endurance_roll)
+
+                result += f"Χαρακτήρας 2.{original_index+1}: {damage_display} vs {endurance_display}\n"
+
+                damage_diff = damage_roll - endurance_roll
+                had_two_wounds = char1.wounds >= 2
+
+                if damage_diff >= 10:
+                    result += f"ΘΑΝΑΤΗΦΟΡΟ ΧΤΥΠΗΜΑ! (+{damage_diff}) Ο {char1.name} νικιέται!\n"
+                    return result, True, char2_list[0]  # Οποιοσδήποτε από τους νικητές
+                elif damage_diff >= 5:
+                    result += f"Σοβαρή ζημιά! (+{damage_diff}) 2 λαβωματιές\n"
+                    char1.wounds += 2
+                elif damage_diff >= 0:
+                    result += f"Ζημιά! (+{damage_diff}) 1 λαβωματιά\n"
+                    char1.wounds += 1
+                else:
+                    result += f"Αντέχει τη ζημιά! ({damage_diff})\n"
+
+                # Έλεγχος αν ο char1 είχε >=2 λαβωματιές και μόλις λαβώθηκε ξανά
+                if had_two_wounds and damage_diff >= 0:
+                    result += f"Ο {char1.name} έχει πάρει πολλές λαβωματιές και νικιέται!\n"
+                    return result, True, char2_list[0]  # Οποιοσδήποτε από τους νικητές
+
+                result += "\n"
+
+            result += f"Κατάσταση {char1.name}: {char1.wounds} λαβωματιές\n\n"
+
+        return result, False, None
+
+    def battle_round(self, char1, char2):
+        """Εκτελεί έναν γύρο μάχης με το νέο σύστημα"""
+        result = f"--- Γύρος Μάχης ---\n"
+
+        # Ζαριές μάχης και των δύο
+        battle1_dice, battle1_mod, battle1_total = self.roll_d20(char1.combat)
+        battle2_dice, battle2_mod, battle2_total = self.roll_d20(char2.combat)
+
+        battle1_display = self.format_dice_roll("Μάχη", battle1_dice, battle1_mod, battle1_total)
+        battle2_display = self.format_dice_roll("Μάχη", battle2_dice, battle2_mod, battle2_total)
+
+        result += f"{char1.name}: {battle1_display}\n"
+        result += f"{char2.name}: {battle2_display}\n"
+
+        # Καθορισμός νικητή
+        winner = None
+        loser = None
+
+        if battle1_total > battle2_total:
+            winner = char1
+            loser = char2
+            result += f"{char1.name} νικάει τον γύρο!\n"
+        elif battle2_total > battle1_total:
+            winner = char2
+            loser = char1
+            result += f"{char2.name} νικάει τον γύρο!\n"
+        else:
+            # Ισοβαθμία - νικάει όποιος έχει μεγαλύτερο συντελεστή
+            if battle1_mod > battle2_mod:
+                winner = char1
+                loser = char2
+                result += f"Ισοβαθμία! {char1.name} νικάει λόγω μεγαλύτερου συντελεστή ({battle1_mod} vs {battle2_mod})!\n"
+            elif battle2_mod > battle1_mod:
+                winner = char2
+                loser = char1
+                result += f"Ισοβαθμία! {char2.name} νικάει λόγω μεγαλύτερου συντελεστή ({battle2_mod} vs {battle1_mod})!\n"
+            else:
+                result += f"Πλήρης ισοβαθμία (ζάρι και συντελεστές)! Ξαναρίχνουμε...\n\n"
+                return result, False, None  # Ξαναρίχνουμε
+
+        # Ο νικητής ρίχνει ζημιά
+        result += f"\n{winner.name} ρίχνει ζημιά...\n"
+
+        dmg_dice, dmg_mod, damage_roll = self.roll_d20(winner.damage)
+        end_dice, end_mod, endurance_roll = self.roll_d20(loser.toughness)
+
+        damage_display = self.format_dice_roll("Ζημιά", dmg_dice, dmg_mod, damage_roll)
+        endurance_display = self.format_dice_roll("Αντοχή", end_dice, end_mod, endurance_roll)
+
+        result += f"{damage_display} vs {endurance_display}\n"
+
+        damage_diff = damage_roll - endurance_roll
+        had_two_wounds = loser.wounds >= 2
+
+        # Τσιράκι: πεθαίνει με οποιαδήποτε επιτυχή ζημιά
+        if loser.is_minion and damage_diff >= 0:
+            result += f"Τσιράκι! (+{damage_diff}) Ο {loser.name} νικιέται!\n"
+            return result, True, winner
+        elif damage_diff >= 10:
+            result += f"ΘΑΝΑΤΗΦΟΡΟ ΧΤΥΠΗΜΑ! (+{damage_diff}) Ο {loser.name} νικιέται!\n"
+            return result, True, winner
+        elif damage_diff >= 5:
+            result += f"Σοβαρή ζημιά! (+{damage_diff}) 2 λαβωματιές\n"
+            loser.wounds += 2
+        elif damage_diff >= 0:
+            result += f"Ζημιά! (+{damage_diff}) 1 λαβωματιά\n"
+            loser.wounds += 1
+        else:
+            result += f"Αντέχει τη ζημιά! ({damage_diff})\n"
+
+        # Έλεγχος αν ο loser είχε >=2 λαβωματιές και μόλις λαβώθηκε ξανά (μόνο αν δεν είναι τσιράκι)
+        if not loser.is_minion and had_two_wounds and damage_diff >= 0:
+            result += f"Ο {loser.name} έχει πάρει πολλές λαβωματιές και νικιέται!\n"
+            return result, True, winner
+
+        result += f"Κατάσταση {loser.name}: {loser.wounds} λαβωματιές\n\n"
+        return result, False, None
+
+    def battle_round_silent(self, char1, char2):
+        """Εκτελεί έναν γύρο μάχης χωρίς output"""
+        winner, loser = self.contest_silent(char1, char2)
+        if winner is None:
+            return False, None  # Ξαναρίχνουμε
+
+        # Ζημιά
+        damage_diff = self.damage_diff_silent(winner, loser)
+        had_two_wounds = loser.wounds >= 2
+
+        # Τσιράκι: πεθαίνει με οποιαδήποτε επιτυχή ζημιά
+        if loser.is_minion and damage_diff >= 0:
+            loser.wounds = 10  # Νεκρός
+            return True, winner
+        elif damage_diff >= 10:
+            loser.wounds = 10  # Νεκρός
+            return True, winner
+        elif damage_diff >= 5:
+            loser.wounds += 2
+        elif damage_diff >= 0:
+            loser.wounds += 1
+
+        # Έλεγχος αν ο loser είχε >=2 λαβωματιές και μόλις λαβώθηκε ξανά (μόνο αν δεν είναι τσιράκι)
+        if not loser.is_minion and had_two_wounds and damage_diff >= 0:
+            loser.wounds = 10  # Νεκρός
+            return True, winner
+
+        return False, None
+
+    def contest_silent(self, char1, char2):
+        """Ζαριές μάχης χωρίς output - επιστρέφει (νικητής, ηττημένος), (None, None) σε πλήρη ισοβαθμία"""
+        _, _, battle1_total = self.roll_d20(char1.combat)
+        _, _, battle2_total = self.roll_d20(char2.combat)
+
+        if battle1_total > battle2_total:
+            return char1, char2
+        elif battle2_total > battle1_total:
+            return char2, char1
+
+        # Ισοβαθμία - ελέγχουμε συντελεστές
+        char1_mod = char1.combat
+        char2_mod = char2.combat
+        if char1_mod > char2_mod:
+            return char1, char2
+        elif char2_mod > char1_mod:
+            return char2, char1
+        return None, None
+
+    def damage_diff_silent(self, attacker, defender):
+        """Ζαριά ζημιάς εναντίον αντοχής χωρίς output - επιστρέφει τη διαφορά"""
+        _, _, damage_roll = self.roll_d20(attacker.damage)
+        _, _, endurance_roll = self.roll_d20(defender.toughness)
+        return damage_roll - endurance_roll
+
+    def battle_round_silent_multiple(self, char1, enemies):
+        """Εκτελεί έναν γύρο μάχης με πολλαπλούς αντιπάλους χωρίς output (με reserves, Single Roll) - enemies: AliveSet"""
+        # Οι engaged από τους ζωντανούς εχθρούς (οι υπόλοιποι είναι reserves)
+        engaged_enemies = enemies.refresh()
+
+        # Ζαριά μάχης του χαρακτήρα 1
+        _, _, battle1_total = self.roll_d20(char1.combat)
+        battle1_mod = char1.combat
+
+        # SINGLE ROLL: Μόνο ο πρώτος engaged ρίχνει, με bonus
+        num_engaged = len(engaged_enemies)
+        first_enemy = engaged_enemies[0]
+
+        battle2_dice, _, _ = self.roll_d20(first_enemy.combat)
+        battle2_base_mod = first_enemy.combat
+        # Bonus: +2 για 2 εχθρούς, +3 για 3, κλπ. Όχι bonus για 1 μόνο
+        bonus = num_engaged if num_engaged >= 2 else 0
+        battle2_mod = battle2_base_mod + bonus
+        battle2_total = battle2_dice + battle2_mod
+
+        # Έλεγχος νίκης
+        char1_wins = battle1_total > battle2_total or (battle1_total == battle2_total and battle1_mod > battle2_mod)
+
+        if char1_wins:
+            # Ο χαρακτήρας 1 ρίχνει ζημιά σε όλους τους engaged
+            _, _, damage_roll = self.roll_d20(char1.damage)
+
+            for char2 in engaged_enemies:
+                _, _, endurance_roll = self.roll_d20(char2.toughness)
+
+                damage_diff = damage_roll - endurance_roll
+                had_two_wounds = char2.wounds >= 2
+
+                # Τσιράκι: πεθαίνει με οποιαδήποτε επιτυχή ζημιά
+                if char2.is_minion and damage_diff >= 0:
+                    char2.wounds = 10  # Σημάδι νίκης
+                elif damage_diff >= 10:
+                    char2.wounds = 10  # Σημάδι νίκης
+                elif damage_diff >= 5:
+                    char2.wounds += 2
+                elif damage_diff >= 0:
+                    char2.wounds += 1
+
+                # Έλεγχος αν ο char2 είχε >=2 λαβωματιές και μόλις λαβώθηκε ξανά (μόνο αν δεν είναι τσιράκι)
+                if not char2.is_minion and had_two_wounds and damage_diff >= 0:
+                    char2.wounds = 10  # Σημάδι νίκης
+
+            # Έλεγχος αν όλοι οι χαρακτήρες 2 νικήθηκαν (θανατηφόρα χτυπήματα)
+            if not enemies.refresh():
+                return True, char1
+
+        else:
+            # Όλοι οι engaged χαρακτήρες 2 ρίχνουν ζημιά
+            for char2 in engaged_enemies:
+                damage_diff = self.damage_diff_silent(char2, char1)
+                had_two_wounds = char1.wounds >= 2
+
+                if damage_diff >= 10:
+                    char1.wounds = 10  # Νεκρός
+                    return True, char2  # Οποιοσδήποτε από τους νικητές
+                elif damage_diff >= 5:
+                    char1.wounds += 2
+                elif damage_diff >= 0:
+                    char1.wounds += 1
+
+                # Έλεγχος αν ο char1 είχε >=2 λαβωματιές και μόλις λαβώθηκε ξανά
+                if had_two_wounds and damage_diff >= 0:
+                    char1.wounds = 10  # Νεκρός
+                    return True, char2  # Οποιοσδήποτε από τους νικητές
+
+        return False, None
+
+    def simulate_battle_silent(self, char1_stats, char2_stats, char2_number=1, char2_engaged=1, char2_minion=False):
+        """Προσομοιώνει μια μάχη χωρίς output"""
+        char1 = Character("Χαρακτήρας 1", char1_stats)
+
+        # Δημιουργία πολλαπλών χαρακτήρων 2
+        char2_list = []
+        for i in range(char2_number):
+            char2 = Character(f"Χαρακτήρας 2.{i+1}", char2_stats, char2_minion)
+            char2_list.append(char2)
+        self.combatants = (char1, char2_list)
+
+        if char2_number > 1:
+            enemies = self.alive_set(char2_list, char2_engaged, lambda char2: char2.wounds != 10)
+
+        round_count = 0
+        while round_count < 100:  # Safety limit
+            round_count += 1
+
+            if char2_number == 1:
+                battle_ended, winner = self.battle_round_silent(char1, char2_list[0])
+            else:
+                battle_ended, winner = self.battle_round_silent_multiple(char1, enemies)
+
+            if battle_ended:
+                if winner == char1 or (hasattr(winner, 'name') and winner.name == "Χαρακτήρας 1"):
+                    return 1, round_count
+                else:
+                    return 2, round_count
+
+        return 0, round_count  # Draw
+
+    def end_state(self, winner):
+        """Οι λαβωματιές του νικητή της τελευταίας μάχης χωρίς output (None σε ισοπαλία)
+
+        Όταν νικάνε οι αντίπαλοι, του λιγότερο λαβωμένου ζωντανού αντιπάλου.
+        """
+        char1, char2_list = self.combatants
+        if winner == 1:
+            return char1.wounds
+        if winner == 2:
+            return min(char2.wounds for char2 in char2_list if char2.wounds != 10)
+        return None
+
+    def single_battle(self, char1_stats, char2_stats, char2_number=1, char2_engaged=1, char2_minion=False):
+        """Εκτελεί μια αναλυτική μάχη - επιστρέφει το κείμενο της μάχης"""
+        # Δημιουργία χαρακτήρων
+        char1 = Character("Χαρακτήρας 1", char1_stats)
+
+        # Δημιουργία πολλαπλών χαρακτήρων 2
+        char2_list = []
+        for i in range(char2_number):
+            char2 = Character(f"Χαρακτήρας 2.{i+1}", char2_stats, char2_minion)
+            char2_list.append(char2)
+
+        if char2_number == 1:
+            result = "=== ΜΑΧΗ ΧΑΡΑΚΤΗΡΩΝ - ΕΝΑΛΛΑΚΤΙΚΟ ΣΥΣΤΗΜΑ ===\n\n"
+        else:
+            result = f"=== ΜΑΧΗ ΧΑΡΑΚΤΗΡΩΝ - ΕΝΑΛΛΑΚΤΙΚΟ ΣΥΣΤΗΜΑ ===\n"
+            result += f"Χαρακτήρας 1 εναντίον {char2_number} αντιπάλων (max {char2_engaged} engaged)!\n\n"
+
+        round_count = 0
+        while round_count < 50:  # Safety limit
+            round_count += 1
+            result += f"Γύρος {round_count}:\n"
+
+            if char2_number == 1:
+                round_result, battle_ended, winner = self.battle_round(char1, char2_list[0])
+            else:
+                round_result, battle_ended, winner = self.battle_round_multiple(char1, char2_list, char2_engaged)
+
+            result += round_result
+
+            if battle_ended:
+                if char2_number == 1:
+                    result += f"\n🏆 ΝΙΚΗΤΗΣ: {winner.name}! 🏆\n"
+                else:
+                    if winner == char1:
+                        result += f"\n🏆 ΝΙΚΗΤΗΣ: {winner.name}! 🏆\n"
+                    else:
+                        result += f"\n🏆 ΝΙΚΗΤΕΣ: Οι αντίπαλοι! 🏆\n"
+                result += f"Συνολικοί γύροι μάχης: {round_count}\n"
+                break
+
+        if round_count >= 50:
+            result += "\nΗ μάχη διαρκεί πολύ! Ισοπαλία.\n"
+            result += f"Συνολικοί γύροι μάχης: {round_count}\n"
+
+        return result
+
+
+class TableBattleEngine(BattleEngine):
+    """Ίδιοι κανόνες, αλλά οι μάχες χωρίς output διαλέγουν το αποτέλεσμα κάθε
+    ζαριάς από τους πίνακες πιθανοτήτων με μία ζαριά αντί για δύο d20"""
+
+    def contest_silent(self, char1, char2):
+        winner, _ = tables.sample_contest(self.rng, char1.combat, char2.combat)
+        if winner == 1:
+            return char1, char2
+        elif winner == 2:
+            return char2, char1
+        return None, None
+
+    def damage_diff_silent(self, attacker, defender):
+        bands = tables.damage_bands(defender.toughness - attacker.damage)
+        return tables.sample_band(self.rng, bands)
+
+def simulate(config, n, seed=None, rng=None, stats=None, engine_class=None):
+    """Εκτελεί n μάχες χωρίς output - config: τα ορίσματα της simulate_battle_silent
+
+    rng: έτοιμη γεννήτρια αντί για την rng.make_rng(seed)
+    stats: BattleStats που συμπληρώνεται, π.χ. aggregate.BattleAggregate (με την κατάσταση
+    του νικητή, BattleEngine.end_state) ή export.BattleRecorder (μία γραμμή ανά μάχη)
+    engine_class: άλλη κλάση μηχανής, π.χ. instrument.instrumented_class (προεπιλογή TableBattleEngine)
+    """
+    engine = (engine_class or TableBattleEngine)(rng if rng is not None else make_rng(seed))
+    return run_battles(engine.simulate_battle_silent, config, n, stats, engine)
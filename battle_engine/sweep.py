@@ -0,0 +1,141 @@
+"""Σάρωση παραμέτρων: εκτελεί μάχες για κάθε συνδυασμό τιμών (καρτεσιανό
+γινόμενο) και γράφει έναν συμπαγή πίνακα με ποσοστά νίκης και μέσους γύρους.
+
+Οι άξονες είναι ένα dict {όνομα: [τιμές]}. Το όνομα είναι είτε ένα όρισμα της
+simulate_battle_silent (π.χ. "char2_number", "char1_indomitable") είτε ένα
+στατιστικό με τη μορφή "char1_stats.Επίθεση" / "char2_stats.Αντοχή".
+
+Ίδια configs τρέχουν μία φορά και κάθε config παίρνει seed από το περιεχόμενό
+του, οπότε το αποτέλεσμα δεν εξαρτάται από τη σειρά ή τον αριθμό των workers.
+"""
+
+import csv
+import itertools
+import json
+import os
+import random
+from concurrent.futures import ProcessPoolExecutor
+
+from . import get_rule_system
+from .common import full_config
+from .parallel import _run_chunk, chunk_seed
+
+try:
+    import numpy as np
+except ImportError:  # Χωρίς numpy γράφεται μόνο το CSV
+    np = None
+
+FIELDS = ["battles", "char1_win_rate", "char2_win_rate", "draw_rate", "avg_rounds"]
+
+
+def config_key(system, config):
+    """Κανονική μορφή (string) ενός config - ίδια για ίδια configs, μαζί με τις προεπιλογές"""
+    config = full_config(get_rule_system(system).BattleEngine, config)
+    return json.dumps([system, config], sort_keys=True, ensure_ascii=False)
+
+
+def apply_axis(config, name, value):
+    """Επιστρέφει αντίγραφο του config με την τιμή ενός άξονα"""
+    config = dict(config)
+    if "." in name:
+        stats_key, stat = name.split(".", 1)
+        config[stats_key] = dict(config[stats_key])
+        config[stats_key][stat] = value
+    else:
+        config[name] = value
+    return config
+
+
+def expand_grid(base_config, axes):
+    """Όλοι οι συνδυασμοί των αξόνων - επιστρέφει [(τιμές, config), ...]"""
+    names = list(axes)
+    grid = []
+    for values in itertools.product(*(axes[name] for name in names)):
+        config = base_config
+        for name, value in zip(names, values):
+            config = apply_axis(config, name, value)
+        grid.append((values, config))
+    return grid
+
+
+def _results(stats):
+    """Η γραμμή του πίνακα για τα αποτελέσματα ενός συνδυασμού (με τη σειρά του FIELDS)"""
+    n = stats.battles
+    if n == 0:
+        return [0, 0.0, 0.0, 0.0, 0.0]
+    return [n, stats.char1_wins / n, stats.char2_wins / n, stats.draws / n, stats.avg_rounds()]
+
+
+class SweepResult:
+    """Τα αποτελέσματα μιας σάρωσης, μία γραμμή ανά συνδυασμό (με τη σειρά του expand_grid)"""
+
+    def __init__(self, system, axes, rows):
+        self.system = system
+        self.axes = axes
+        self.rows = rows  # [(τιμές αξόνων, [battles, char1_win_rate, ...]), ...]
+
+    def write_csv(self, path):
+        with open(path, "w", newline="", encoding="utf-8") as f:
+            writer = csv.writer(f)
+            writer.writerow(list(self.axes) + FIELDS)
+            for values, results in self.rows:
+                writer.writerow(list(values) + results)
+
+    def to_array(self):
+        """Πίνακας numpy με σχήμα (μήκη αξόνων..., len(FIELDS))"""
+        if np is None:
+            raise ImportError("Ο πίνακας .npy απαιτεί numpy")
+        shape = [len(values) for values in self.axes.values()] + [len(FIELDS)]
+        return np.array([results for _, results in self.rows], dtype=np.float64).reshape(shape)
+
+    def write_npy(self, path):
+        array = self.to_array()
+        np.save(path, array)
+
+    def save(self, prefix):
+        """Γράφει prefix.csv και, αν υπάρχει numpy, prefix.npy"""
+        self.write_csv(prefix + ".csv")
+        if np is not None:
+            self.write_npy(prefix + ".npy")
+
+
+def run_sweep(system, base_config, axes, n, workers=None, seed=None, cache=None, generator=None):
+    """Εκτελεί n μάχες για κάθε συνδυασμό των αξόνων - επιστρέφει SweepResult
+
+    Με cache (cache.ResultCache) τρέχουν μόνο όσες μάχες λείπουν για κάθε συνδυασμό.
+    generator: όνομα από το rng.GENERATORS - None για την προεπιλογή κάθε συστήματος.
+    """
+    if seed is None:
+        seed = random.SystemRandom().getrandbits(64)
+    if workers is None:
+        workers = os.cpu_count() or 1
+
+    grid = expand_grid(base_config, axes)
+    keys = [config_key(system, config) for _, config in grid]
+    unique = {}
+    cached = {}
+    for key, (_, config) in zip(keys, grid):
+        if key in unique or key in cached:
+            continue
+        if cache is not None:
+            cached[key] = cache.get(system, config)
+            missing = n - cached[key].battles
+            if missing <= 0:
+                continue
+            unique[key] = (system, config, missing, cache.seed(system, config, cached[key].battles), generator)
+        else:
+            unique[key] = (system, config, n, chunk_seed(seed, key), generator)
+
+    tasks = list(unique.values())
+    if workers <= 1 or len(tasks) <= 1:
+        results = list(map(_run_chunk, tasks))
+    else:
+        with ProcessPoolExecutor(max_workers=min(workers, len(tasks))) as executor:
+            results = list(executor.map(_run_chunk, tasks))
+
+    by_key = dict(cached)
+    for key, (_, config, *_), stats in zip(unique, tasks, results):
+        by_key[key] = cache.add(system, config, stats) if cache is not None else stats
+
+    rows = [(values, _results(by_key[key])) for key, (values, _) in zip(keys, grid)]
+    return SweepResult(system, axes, rows)
@@ -0,0 +1,93 @@
+"""Πίνακες πιθανοτήτων για τις ζαριές d20 εναντίον d20.
+
+Όλα τα συστήματα συγκρίνουν roll_d20(a) με roll_d20(b), οπότε το αποτέλεσμα
+εξαρτάται μόνο από τη διαφορά των συντελεστών. Οι πίνακες υπολογίζονται μία
+φορά ανά διαφορά και μετά κάθε ζαριά αντικαθίσταται από μία ομοιόμορφη
+τιμή rng.random() που διαλέγει κατηγορία αποτελέσματος.
+"""
+
+from functools import lru_cache
+
+# Αντιπροσωπευτικές τιμές damage_diff για κάθε ζώνη ζημιάς
+KILL = 10  # >=10: θανατηφόρο χτύπημα
+TWO_WOUNDS = 5  # >=5: 2 λαβωματιές
+ONE_WOUND = 0  # >=0: 1 λαβωματιά
+NO_DAMAGE = -1  # <0: καμία ζημιά
+
+
+def opposed_at_least(k):
+    """P(d20 + a >= d20 + b) όπου k = b - a"""
+    if k <= -19:
+        return 1.0
+    if k > 19:
+        return 0.0
+    # P(d1 - d2 = d) = (20 - |d|) / 400
+    return sum(20 - abs(d) for d in range(k, 20)) / 400
+
+
+@lru_cache(maxsize=None)
+def damage_bands(offset):
+    """Αθροιστικές πιθανότητες (>=10, >=5, >=0) της damage_diff, όπου offset = Αντοχή - Ζημιά"""
+    return (
+        opposed_at_least(offset + KILL),
+        opposed_at_least(offset + TWO_WOUNDS),
+        opposed_at_least(offset + ONE_WOUND),
+    )
+
+
+@lru_cache(maxsize=None)
+def attack_bands(hit_offset, damage_offset):
+    """Όπως η damage_bands, μαζί με την επιτυχία της επίθεσης (hit_offset = Άμυνα - Επίθεση)"""
+    p_hit = opposed_at_least(hit_offset)
+    return tuple(p_hit * p for p in damage_bands(damage_offset))
+
+
+def sample_band(rng, bands):
+    """Διαλέγει ζώνη ζημιάς με μία ζαριά - επιστρέφει αντιπροσωπευτική damage_diff"""
+    u = rng.random()
+    if u < bands[0]:
+        return KILL
+    if u < bands[1]:
+        return TWO_WOUNDS
+    if u < bands[2]:
+        return ONE_WOUND
+    return NO_DAMAGE
+
+
+@lru_cache(maxsize=None)
+def contest_table(mod1, mod2):
+    """Αθροιστικές πιθανότητες της αντιπαράθεσης Μάχης των εναλλακτικών συστημάτων.
+
+    Σειρά: νίκη 1 με φυσικό 20, νίκη 1, νίκη 2 με φυσικό 20, νίκη 2 - το
+    υπόλοιπο είναι πλήρης ισοβαθμία (ξαναρίχνουμε). Στην ισοβαθμία συνόλων
+    νικάει ο μεγαλύτερος συντελεστής.
+    """
+    counts = [0, 0, 0, 0]
+    for dice1 in range(1, 21):
+        for dice2 in range(1, 21):
+            total1, total2 = dice1 + mod1, dice2 + mod2
+            if total1 > total2 or (total1 == total2 and mod1 > mod2):
+                counts[0 if dice1 == 20 else 1] += 1
+            elif total2 > total1 or (total1 == total2 and mod2 > mod1):
+                counts[2 if dice2 == 20 else 3] += 1
+    cumulative = []
+    total = 0
+    for count in counts:
+        total += count
+        cumulative.append(total / 400)
+    return tuple(cumulative)
+
+
+def sample_contest(rng, mod1, mod2):
+    """Διαλέγει αποτέλεσμα αντιπαράθεσης - επιστρέφει (νικητής 1/2 ή 0 για ξαναρίξιμο, φυσικό 20)"""
+    table = contest_table(mod1, mod2)
+    u = rng.random()
+    if u < table[0]:
+        return 1, True
+    if u < table[1]:
+        return 1, False
+    if u < table[2]:
+        return 2, True
+    if u < table[3]:
+        return 2, False
+    return 0, False
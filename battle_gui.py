@@ -0,0 +1,132 @@
+import sqlite3
+import tkinter as tk
+from tkinter import ttk
+
+from battle_engine import adaptive, parallel
+from battle_engine.cache import ResultCache, format_cached
+from battle_engine.common import format_summary
+
+POLL_MS = 100  # Κάθε πόσο ελέγχεται η πρόοδος
+DEFAULT_TOLERANCE = "1.0"  # % - ακρίβεια για τις μάχες μέχρι ακρίβεια
+DEFAULT_TIME_BUDGET = "30"  # Δευτερόλεπτα
+
+
+def open_cache():
+    """Η cache αποτελεσμάτων - None αν δεν μπορεί να ανοίξει το αρχείο"""
+    try:
+        return ResultCache()
+    except (OSError, sqlite3.Error):
+        return None
+
+
+class MassBattleProgress:
+    """Progress bar, κουμπί ακύρωσης και μάχες μέχρι ακρίβεια, κοινά σε όλα τα συστήματα.
+
+    Οι μάχες τρέχουν σε thread στο παρασκήνιο (parallel.BattleRun) και η πρόοδος
+    ελέγχεται με root.after, ώστε το παράθυρο να μην παγώνει.
+    """
+
+    def __init__(self, root, parent, row, show_draws=True, precise_command=None):
+        self.root = root
+        self.show_draws = show_draws
+        self.battle_run = None
+        self.result_text = None
+        self.cache = open_cache()
+
+        frame = ttk.Frame(parent)
+        frame.grid(row=row, column=0, columnspan=3, sticky=(tk.W, tk.E), pady=5)
+        frame.columnconfigure(0, weight=1)
+
+        self.progress_bar = ttk.Progressbar(frame, mode="determinate")
+        self.progress_bar.grid(row=0, column=0, sticky=(tk.W, tk.E))
+
+        self.cancel_btn = ttk.Button(frame, text="Ακύρωση", command=self.cancel, state=tk.DISABLED)
+        self.cancel_btn.grid(row=0, column=1, padx=(10, 0))
+
+        self.status_label = ttk.Label(frame, text="")
+        self.status_label.grid(row=1, column=0, columnspan=2, sticky=tk.W)
+
+        # Μάχες μέχρι ακρίβεια
+        if precise_command is not None:
+            precise_frame = ttk.Frame(frame)
+            precise_frame.grid(row=2, column=0, columnspan=2, sticky=tk.W, pady=(5, 0))
+
+            ttk.Label(precise_frame, text="Ακρίβεια ±").grid(row=0, column=0)
+            self.tolerance_entry = ttk.Entry(precise_frame, width=5)
+            self.tolerance_entry.grid(row=0, column=1)
+            self.tolerance_entry.insert(0, DEFAULT_TOLERANCE)
+            ttk.Label(precise_frame, text="%  Χρόνος").grid(row=0, column=2, padx=(5, 0))
+            self.time_budget_entry = ttk.Entry(precise_frame, width=5)
+            self.time_budget_entry.grid(row=0, column=3)
+            self.time_budget_entry.insert(0, DEFAULT_TIME_BUDGET)
+            ttk.Label(precise_frame, text="s").grid(row=0, column=4)
+
+            precise_btn = ttk.Button(precise_frame, text="Μάχες μέχρι ακρίβεια", command=precise_command)
+            precise_btn.grid(row=0, column=5, padx=(10, 0))
+
+    def is_running(self):
+        return self.battle_run is not None
+
+    def start(self, system, config, n, result_text):
+        """Ξεκινάει n μάχες (όσες δεν υπάρχουν στην cache) - τα αποτελέσματα γράφονται στο result_text όταν τελειώσουν
+
+        Αν η cache έχει ήδη περισσότερες, εμφανίζονται όλες, με σημείωση (cache.format_cached).
+        """
+        self._start(parallel.BattleRun(system, config, n, cache=self.cache), result_text)
+
+    def start_precise(self, system, config, result_text):
+        """Ξεκινάει μάχες μέχρι την ακρίβεια και τον χρόνο που ορίστηκαν"""
+        tolerance = self._get_float(self.tolerance_entry, DEFAULT_TOLERANCE) / 100
+        time_budget = self._get_float(self.time_budget_entry, DEFAULT_TIME_BUDGET)
+        result_text.insert(tk.END, f"Εκτελούνται μάχες μέχρι ακρίβεια ±{tolerance * 100:.1f}% (έως {time_budget:g} s)...\n\n")
+        self._start(adaptive.PreciseRun(system, config, tolerance, time_budget), result_text)
+
+    def _get_float(self, entry, default):
+        """Θετικός αριθμός από entry field - αλλιώς η προεπιλογή"""
+        try:
+            value = float(entry.get().replace(",", "."))
+            return value if value > 0 else float(default)
+        except ValueError:
+            return float(default)
+
+    def _start(self, battle_run, result_text):
+        self.result_text = result_text
+        self.battle_run = battle_run.start()
+        self.progress_bar.configure(maximum=100, value=0)
+        self.status_label.configure(text="")
+        self.cancel_btn.configure(state=tk.NORMAL)
+        self.root.after(POLL_MS, self.poll)
+
+    def cancel(self):
+        """Ακυρώνει τις μάχες - εμφανίζονται τα αποτελέσματα όσων ολοκληρώθηκαν"""
+        if self.battle_run is not None:
+            self.battle_run.cancel()
+            self.cancel_btn.configure(state=tk.DISABLED)
+
+    def poll(self):
+        battle_run = self.battle_run
+        stats = battle_run.stats
+        self.progress_bar.configure(value=battle_run.progress() * 100)
+        if stats.battles:
+            battles = f"{stats.battles}/{battle_run.n}" if battle_run.n else f"{stats.battles}"
+            self.status_label.configure(
+                text=f"{battles} μάχες - Χαρακτήρας 1: {stats.char1_wins * 100 / stats.battles:.1f}% νίκες"
+            )
+
+        if not battle_run.done:
+            self.root.after(POLL_MS, self.poll)
+            return
+
+        self.battle_run = None
+        self.cancel_btn.configure(state=tk.DISABLED)
+        if battle_run.error is not None:
+            self.result_text.insert(tk.END, f"Σφάλμα: {battle_run.error}\n")
+            return
+        if battle_run.cancelled:
+            self.result_text.insert(tk.END, f"Ακυρώθηκε μετά από {stats.battles} μάχες.\n\n")
+        if isinstance(battle_run, parallel.BattleRun):
+            self.result_text.insert(tk.END, format_cached(stats, battle_run.n))
+        char2_number = battle_run.config.get("char2_number", 1)
+        self.result_text.insert(tk.END, format_summary(stats, char2_number, show_draws=self.show_draws))
+        if isinstance(battle_run, adaptive.PreciseRun) and stats.battles:
+            self.result_text.insert(tk.END, "\n" + adaptive.format_interval(battle_run))
@@ -0,0 +1,93 @@
+"""Η διανυσματική classic_batch πρέπει να δίνει τις κατανομές της απλής μηχανής
+(classic.BattleEngine με random.Random), όπως είναι στο golden.json: χ² για
+νικητές και (νικητή, γύρους) και Kolmogorov-Smirnov για τους γύρους.
+"""
+
+import unittest
+
+from battle_engine import classic, classic_batch, equivalence
+
+BATTLES = 100000  # Μάχες της classic_batch ανά αναμέτρηση (με σταθερό seed)
+
+CASES_1V1 = [
+    "classic/1v1",
+    "classic/1v1-mirror",
+    "classic/1v1-minion",
+    "classic/1v1-indomitable",
+    "classic/1v1-stuns",
+    "classic/1v1-never-stunned",
+]
+
+CASES_1VMANY = [
+    "classic/1v5",
+    "classic/1v5-minions-stuns",
+]
+
+
+@unittest.skipIf(classic_batch.np is None, "η classic_batch απαιτεί numpy")
+class ClassicBatchEquivalenceTest(unittest.TestCase):
+    def assert_equivalent(self, cases):
+        results = equivalence.check(["batch"], n=BATTLES, cases=cases)
+        self.assertEqual(sorted(set(result["case"] for result in results)), sorted(cases))
+        failed = [f"{result['case']} {result['test']} p={result['p']:.3g}" for result in results if not result["passed"]]
+        self.assertEqual(failed, [])
+
+    def test_1v1(self):
+        self.assert_equivalent(CASES_1V1)
+
+    def test_1vmany(self):
+        self.assert_equivalent(CASES_1VMANY)
+
+    def test_detects_different_rules(self):
+        # Ένας πόντος Επίθεσης παραπάνω πρέπει να φαίνεται, αλλιώς ο έλεγχος δεν λέει τίποτα
+        def stronger_batch(system, config, n, seed):
+            config = dict(config, char1_stats=dict(config["char1_stats"]))
+            config["char1_stats"]["Επίθεση"] += 1
+            return equivalence.batch_engine(system, config, n, seed)
+
+        results = equivalence.check([stronger_batch], n=BATTLES, cases=["classic/1v1"])
+        self.assertFalse(all(result["passed"] for result in results))
+
+    def test_detects_missing_minions(self):
+        # Αντίπαλοι που δεν είναι τσιράκια αντέχουν περισσότερο στη μάχη 1 vs πολλοί
+        def no_minions_batch(system, config, n, seed):
+            return equivalence.batch_engine(system, dict(config, char2_minion=False), n, seed)
+
+        results = equivalence.check([no_minions_batch], n=BATTLES, cases=["classic/1v5-minions-stuns"])
+        self.assertFalse(all(result["passed"] for result in results))
+
+
+@unittest.skipIf(classic_batch.np is None, "η classic_batch απαιτεί numpy")
+class ClassicBatchConfigTest(unittest.TestCase):
+    CONFIG = {
+        "char1_stats": {"Πρωτοβουλία": 1, "Επίθεση": 3, "Ζημιά": 2, "Άμυνα": 2, "Αντοχή": 1},
+        "char2_stats": {"Πρωτοβουλία": 0, "Επίθεση": 2, "Ζημιά": 3, "Άμυνα": 1, "Αντοχή": 2},
+    }
+
+    def test_rejects_unknown_keys(self):
+        # Ένα λάθος στο όνομα δεν πρέπει να τρέχει σιωπηλά μια άλλη μάχη
+        config = dict(self.CONFIG, char2_numbr=2)
+        with self.assertRaises(TypeError):
+            classic.simulate(config, 10, seed=1, engine_class=classic.BattleEngine)
+        with self.assertRaises(ValueError):
+            classic_batch.battle_results(config, 10, seed=1)
+        with self.assertRaises(ValueError):
+            classic_batch.simulate(config, 10, seed=1)
+
+    def test_zero_engaged_counts_as_one(self):
+        # Η AliveSet των απλών μηχανών κρατάει πάντα τουλάχιστον έναν engaged αντίπαλο
+        config = dict(self.CONFIG, char2_number=3)
+        zero = classic_batch.battle_results(dict(config, char2_engaged=0), 2000, seed=5)
+        one = classic_batch.battle_results(dict(config, char2_engaged=1), 2000, seed=5)
+        self.assertEqual([array.tolist() for array in zero], [array.tolist() for array in one])
+
+        # Και ίδια κατανομή με την απλή μηχανή, που δέχεται το ίδιο config
+        config = dict(config, char2_engaged=0)
+        scalar = equivalence.scalar_engine("classic", config, 20000, 3)
+        batch = equivalence.batch_engine("classic", config, 20000, 4)
+        for test, _, p in equivalence.compare(equivalence.distribution(scalar), batch):
+            self.assertGreater(p, 1e-4, test)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,118 @@
+"""Η ουρά εργασιών: κομμάτια που εγκαταλείφθηκαν ξαναδίνονται μετά το lease,
+τα αποτελέσματα δεν μετράνε δύο φορές και η ίδια αναμέτρηση μπαίνει μία φορά.
+"""
+
+import os
+import shutil
+import sqlite3
+import tempfile
+import time
+import unittest
+
+from battle_engine import jobqueue, parallel
+from battle_engine.common import BattleStats
+
+LEASE = 0.2  # Δευτερόλεπτα
+
+CONFIG = {
+    "char1_stats": {"Πρωτοβουλία": 1, "Επίθεση": 3, "Ζημιά": 2, "Άμυνα": 2, "Αντοχή": 1},
+    "char2_stats": {"Πρωτοβουλία": 0, "Επίθεση": 2, "Ζημιά": 3, "Άμυνα": 1, "Αντοχή": 2},
+}
+
+
+class StandInChunk:
+    """run_chunk χωρίς μάχες: ο Χαρακτήρας 1 κερδίζει κάθε μάχη σε 1 γύρο, και κρατιούνται τα tasks"""
+
+    def __init__(self):
+        self.tasks = []
+
+    def __call__(self, task):
+        self.tasks.append(task)
+        stats = BattleStats()
+        for _ in range(task[2]):
+            stats.add(1, 1)
+        return stats
+
+
+class JobQueueTest(unittest.TestCase):
+    def setUp(self):
+        self.directory = tempfile.mkdtemp()
+        self.path = os.path.join(self.directory, "queue.sqlite")
+        self.queue = jobqueue.JobQueue(self.path, LEASE)
+
+    def tearDown(self):
+        shutil.rmtree(self.directory)
+
+    def attempts(self, job):
+        db = sqlite3.connect(self.path)
+        try:
+            return db.execute("SELECT attempts FROM jobs WHERE id = ?", (job,)).fetchone()[0]
+        finally:
+            db.close()
+
+    def test_enqueue_is_idempotent(self):
+        matchup = self.queue.enqueue("classic", CONFIG, 2500, seed=7, chunk_size=1000)
+        self.assertEqual(self.queue.enqueue("classic", CONFIG, 2500, seed=7, chunk_size=1000), matchup)
+        self.assertEqual(jobqueue.JobQueue(self.path, LEASE).enqueue("classic", CONFIG, 2500, seed=7, chunk_size=1000),
+                         matchup)
+        self.assertEqual(len(self.queue.matchups()), 1)
+        self.assertEqual(self.queue.counts(), {jobqueue.PENDING: 3, jobqueue.RUNNING: 0, jobqueue.DONE: 0})
+
+        other = self.queue.enqueue("classic", CONFIG, 2500, seed=8, chunk_size=1000)
+        self.assertNotEqual(other, matchup)
+        self.assertEqual(self.queue.counts()[jobqueue.PENDING], 6)
+
+    def test_enqueue_sweep_is_idempotent(self):
+        axes = {"char2_number": [1, 2]}
+        first = self.queue.enqueue_sweep("classic", CONFIG, axes, 100, seed=3)
+        self.assertEqual(self.queue.enqueue_sweep("classic", CONFIG, axes, 100, seed=3), first)
+        self.assertEqual(len(self.queue.matchups()), 2)
+
+    def test_abandoned_claim_is_released_after_lease(self):
+        matchup = self.queue.enqueue("classic", CONFIG, 2500, seed=7, chunk_size=1000)
+        job, task = self.queue.claim("crashed")  # Ο worker "πεθαίνει" χωρίς complete
+        run_chunk = StandInChunk()
+
+        # Μέσα στο lease το κομμάτι μένει δεσμευμένο
+        self.assertEqual(jobqueue.work(self.path, "alive", run_chunk, lease=LEASE), 2)
+        self.assertEqual(self.queue.counts()[jobqueue.RUNNING], 1)
+        self.assertFalse(self.queue.finished())
+        self.assertEqual(self.queue.results(matchup).battles, 1500)
+
+        time.sleep(LEASE * 1.5)
+        self.assertEqual(jobqueue.work(self.path, "alive", run_chunk, lease=LEASE), 1)
+        self.assertTrue(self.queue.finished())
+        self.assertEqual(run_chunk.tasks[-1], task)  # Το ίδιο κομμάτι, με το ίδιο seed
+        self.assertEqual(self.attempts(job), 2)
+
+        stats = self.queue.results(matchup)
+        self.assertEqual((stats.battles, stats.char1_wins, stats.total_rounds), (2500, 2500, 2500))
+
+    def test_complete_does_not_double_count(self):
+        matchup = self.queue.enqueue("classic", CONFIG, 2500, seed=7, chunk_size=1000)
+        job, task = self.queue.claim("slow")
+        time.sleep(LEASE * 1.5)
+        run_chunk = StandInChunk()
+        self.assertEqual(jobqueue.work(self.path, "fast", run_chunk, lease=LEASE), 3)
+        self.assertIn(task, run_chunk.tasks)
+
+        # Ο αργός worker τελειώνει μετά το lease: το κομμάτι είναι ήδη ολοκληρωμένο
+        self.queue.complete(job, run_chunk(task))
+        self.queue.complete(job, run_chunk(task))
+        stats = self.queue.results(matchup)
+        self.assertEqual((stats.battles, stats.char1_wins), (2500, 2500))
+        self.assertEqual(self.queue.counts(), {jobqueue.PENDING: 0, jobqueue.RUNNING: 0, jobqueue.DONE: 3})
+        self.assertIsNone(self.queue.claim("late"))
+
+    def test_results_match_parallel_simulate(self):
+        matchup = self.queue.enqueue("classic", CONFIG, 2500, seed=7, chunk_size=1000)
+        self.queue.claim("crashed")
+        self.queue.release("crashed")
+        jobqueue.work(self.path, "worker", lease=LEASE)
+        stats = self.queue.results(matchup)
+        expected = parallel.simulate("classic", CONFIG, 2500, workers=1, seed=7, chunk_size=1000)
+        self.assertEqual(stats.to_dict(), expected.to_dict())
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,97 @@
+"""Οι μάχες χωρίς output του Kryptes και του AD&D πρέπει να ρίχνουν τις ίδιες
+ζαριές με τις αναλυτικές: με ίδιο seed, ίδιος νικητής και ίδιοι γύροι σε κάθε
+μάχη μιας σειράς (άρα και η γεννήτρια φτάνει στο ίδιο σημείο στο τέλος κάθε μάχης).
+"""
+
+import random
+import unittest
+
+from battle_engine import adnd, kryptes
+
+BATTLES = 300  # Μάχες ανά σενάριο, όλες με την ίδια γεννήτρια
+SEEDS = (1, 2, 3)
+
+KRYPTES_STRONG = {"Πόντοι αντοχής": "3d6+2", "Ζαριά μάχης": 7, "Ζαριά ζημιάς": "1D6+1", "Θωράκιση": 1,
+                  "Ασπίδες/γύρο": 1, "Αριθμός επιθέσεων": "3/2"}
+KRYPTES_AVERAGE = {"Πόντοι αντοχής": "2d6", "Ζαριά μάχης": 6, "Ζαριά ζημιάς": "2D6", "Θωράκιση": 0,
+                   "Ασπίδες/γύρο": 0, "Αριθμός επιθέσεων": "1"}
+KRYPTES_SHIELDS = dict(KRYPTES_AVERAGE, **{"Ασπίδες/γύρο": 2, "Αριθμός επιθέσεων": "5/2"})
+
+ADND_STRONG = {"Initiative": 1, "Hit points": "4d8", "AC": 4, "THAC0": 15, "Attack bonus": 1,
+               "Damage die": "1d8+1", "Number of attacks": "5/2"}
+ADND_AVERAGE = {"Initiative": 0, "Hit points": "2d8", "AC": 6, "THAC0": 19, "Attack bonus": 0,
+                "Damage die": "1d6", "Number of attacks": "1"}
+ADND_FRACTIONAL = dict(ADND_AVERAGE, **{"Number of attacks": "3/2"})
+
+
+def verbose_results(engine, config, verbose=True):
+    """(νικητής, γύροι) της αναλυτικής μάχης για ένα config της simulate_battle_silent"""
+    config = dict(config)
+    char2_number = config.pop("char2_number", 1)
+    char2_engaged = config.pop("char2_engaged", 1)
+    char1_surprised = config.pop("char1_surprised", False)
+    char2_surprised = config.pop("char2_surprised", False)
+    if char2_number == 1:
+        _, winner, rounds = engine.simulate_battle(config.pop("char1_stats"), config.pop("char2_stats"),
+                                                   char1_surprised, char2_surprised, verbose=verbose, **config)
+    else:
+        _, winner, rounds = engine.simulate_battle_1vMany(config.pop("char1_stats"), config.pop("char2_stats"),
+                                                          char2_number, char2_engaged, char1_surprised,
+                                                          char2_surprised, verbose=verbose, **config)
+    return winner, rounds
+
+
+class SilentPathTest(unittest.TestCase):
+    def assert_same_battles(self, module, config):
+        for seed in SEEDS:
+            verbose_engine = module.BattleEngine(random.Random(seed))
+            quiet_engine = module.BattleEngine(random.Random(seed))
+            silent_engine = module.BattleEngine(random.Random(seed))
+            verbose = [verbose_results(verbose_engine, config) for _ in range(BATTLES)]
+            quiet = [verbose_results(quiet_engine, config, verbose=False) for _ in range(BATTLES)]
+            silent = [silent_engine.simulate_battle_silent(**config) for _ in range(BATTLES)]
+            self.assertEqual(verbose, quiet, f"seed {seed}: verbose=False")
+            self.assertEqual(verbose, silent, f"seed {seed}: simulate_battle_silent")
+            self.assertEqual(verbose_engine.rng.random(), silent_engine.rng.random())
+            self.assertGreater(len(set(winner for winner, _ in silent)), 1)  # Όχι μια μονότονη αναμέτρηση
+
+    def test_kryptes_1v1(self):
+        self.assert_same_battles(kryptes, {"char1_stats": KRYPTES_STRONG, "char2_stats": KRYPTES_AVERAGE})
+
+    def test_kryptes_shields_fractional_attacks(self):
+        self.assert_same_battles(kryptes, {"char1_stats": KRYPTES_STRONG, "char2_stats": KRYPTES_SHIELDS})
+
+    def test_kryptes_surprise_first_strike(self):
+        self.assert_same_battles(kryptes, {"char1_stats": KRYPTES_STRONG, "char2_stats": KRYPTES_SHIELDS,
+                                           "char2_surprised": True, "char1_first_strike": True})
+        self.assert_same_battles(kryptes, {"char1_stats": KRYPTES_AVERAGE, "char2_stats": KRYPTES_STRONG,
+                                           "char1_surprised": True, "char2_first_strike": True})
+
+    def test_kryptes_1vmany(self):
+        self.assert_same_battles(kryptes, {"char1_stats": KRYPTES_STRONG, "char2_stats": KRYPTES_AVERAGE,
+                                           "char2_number": 3, "char2_engaged": 1})
+        self.assert_same_battles(kryptes, {"char1_stats": KRYPTES_STRONG, "char2_stats": KRYPTES_SHIELDS,
+                                           "char2_number": 2, "char2_engaged": 2, "char2_surprised": True,
+                                           "char1_first_strike": True})
+        self.assert_same_battles(kryptes, {"char1_stats": KRYPTES_STRONG, "char2_stats": KRYPTES_AVERAGE,
+                                           "char2_number": 3, "char2_engaged": 2, "char1_surprised": True,
+                                           "char2_first_strike": True})
+
+    def test_adnd_1v1(self):
+        self.assert_same_battles(adnd, {"char1_stats": ADND_AVERAGE, "char2_stats": ADND_AVERAGE})
+
+    def test_adnd_fractional_attacks_surprise(self):
+        self.assert_same_battles(adnd, {"char1_stats": ADND_AVERAGE, "char2_stats": ADND_FRACTIONAL,
+                                        "char1_surprised": True})
+        self.assert_same_battles(adnd, {"char1_stats": ADND_AVERAGE, "char2_stats": ADND_FRACTIONAL,
+                                        "char2_surprised": True})
+
+    def test_adnd_1vmany(self):
+        self.assert_same_battles(adnd, {"char1_stats": ADND_STRONG, "char2_stats": ADND_AVERAGE,
+                                        "char2_number": 3, "char2_engaged": 2})
+        self.assert_same_battles(adnd, {"char1_stats": ADND_STRONG, "char2_stats": ADND_FRACTIONAL,
+                                        "char2_number": 4, "char2_engaged": 3, "char2_surprised": True})
+
+
+if __name__ == "__main__":
+    unittest.main()